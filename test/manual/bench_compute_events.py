@@ -0,0 +1,72 @@
+"""
+CPU time of compute_events per batch of 50 events (event mappings, event to profile mappings, profile
+rebuild). Custom event mappings are not loaded from storage, so only the computation is timed.
+
+Run: python test/manual/bench_compute_events.py
+"""
+
+import asyncio
+import time
+
+from tracardi.context import ServerContext, Context
+from tracardi.domain.entity import Entity
+from tracardi.domain.event_source import EventSource
+from tracardi.domain.named_entity import NamedEntity
+from tracardi.domain.payload.event_payload import EventPayload
+from tracardi.domain.payload.tracker_payload import TrackerPayload
+from tracardi.domain.profile import Profile
+from tracardi.domain.session import Session
+from tracardi.service.tracking import event_data_computation
+from tracardi.service.tracking.event_data_computation import compute_events
+
+ROUNDS = 50
+BATCH = 50
+
+EVENTS = {
+    # No default mappings
+    "custom-event": {"value": 1, "nested": {"a": "b", "empty": {}}},
+    # Journey state computed by function
+    "page-view": {},
+    # Copies event properties to event data and profile
+    "profile-update": {"pii": {"firstname": "John", "lastname": "Doe"}, "contact": {"email": {"main": "j@d.com"}}},
+}
+
+
+async def _no_custom_mapping(event_type_id):
+    return None
+
+
+async def _no_custom_profile_mapping(event_type_id):
+    return []
+
+
+def _batch(event_type: str):
+    tracker_payload = TrackerPayload(source=Entity(id="source"), session=Entity(id="1"), profile={"id": "1"},
+                                     events=[])
+    events = [EventPayload(type=event_type, properties=EVENTS[event_type]) for _ in range(BATCH)]
+    return tracker_payload, events
+
+
+async def _time(event_type: str) -> float:
+    source = EventSource(id="source", type=["rest"], name="Source", bridge=NamedEntity(id="1", name="Rest"))
+    tracker_payload, events = _batch(event_type)
+    profile = Profile.new(id="1")
+    session = Session.new(id="1")
+
+    start = time.process_time()
+    for _ in range(ROUNDS):
+        await compute_events(events, tracker_payload.metadata, source, session, profile, False, tracker_payload)
+    return (time.process_time() - start) / ROUNDS * 1000
+
+
+async def main():
+    event_data_computation.load_event_mapping = _no_custom_mapping
+    event_data_computation.load_event_to_profile = _no_custom_profile_mapping
+
+    with ServerContext(Context(production=False)):
+        for event_type in EVENTS:
+            print(f"{event_type:16} {await _time(event_type):8.2f}ms per {BATCH} events")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
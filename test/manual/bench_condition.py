@@ -0,0 +1,67 @@
+"""
+Micro-benchmark of Condition.evaluate over the uql_expr.lark grammar. Compares evaluation with
+parsing on every call with evaluation of cached, already parsed trees.
+
+Run: python test/manual/bench_condition.py
+"""
+
+import asyncio
+import time
+
+from tracardi.domain.profile import Profile
+from tracardi.process_engine.tql.condition import Condition
+from tracardi.process_engine.tql.transformer.expr_transformer import ExprTransformer
+from tracardi.service.notation.dot_accessor import DotAccessor
+
+ITERATIONS = 2000
+
+conditions = [
+    'payload@a.b == 1',
+    'payload@a.e == "test"',
+    'payload@a.b == payload@a.f',
+    'payload@a.g == TRUE',
+    'payload@a.h IS NULL',
+    'payload@a.e exists',
+    'payload@a.x not exists',
+    'payload@a.j empty',
+    'payload@a.c contains 1',
+    'payload@a.text starts with "Hello"',
+    'payload@a.d.aa between 0 and 2',
+    'datetime(payload@a.i) < now()',
+    'profile@id == "1" and payload@a.b > 0',
+    '(payload@a.b == 1 or payload@a.b == 2) and payload@a.e == "test" and payload@a.g == true',
+]
+
+payload = {
+    "a": {
+        "b": 1, "c": [1, 2, 3], "d": {"aa": 1}, "e": "test", 'f': 1, 'g': True, 'h': None,
+        'i': "2021-01-10", 'j': [], 'text': 'Hello world'
+    }
+}
+
+
+async def main():
+    dot = DotAccessor(profile=Profile(id="1"), payload=payload)
+    condition = Condition()
+
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        for c in conditions:
+            ExprTransformer(dot=dot).transform(condition.fallback_parser.parse(c))
+    no_cache = time.perf_counter() - start
+
+    condition.clear_cache()
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        for c in conditions:
+            await condition.evaluate(c, dot)
+    cached = time.perf_counter() - start
+
+    total = ITERATIONS * len(conditions)
+    print(f"earley, no cache: {total / no_cache:10.1f} evaluations/s")
+    print(f"cached tree:      {total / cached:10.1f} evaluations/s ({no_cache / cached:.1f}x)")
+    print(condition.cache_info())
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
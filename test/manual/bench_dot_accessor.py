@@ -0,0 +1,69 @@
+"""
+Compares DotAccessor with eager conversion of all sources (the previous implementation) for an accessor that
+reads a few paths.
+
+Run: python test/manual/bench_dot_accessor.py
+"""
+
+import time
+
+from dotty_dict import dotty
+
+from tracardi.domain.entity import Entity
+from tracardi.domain.event import Event, EventSession
+from tracardi.domain.event_metadata import EventMetadata
+from tracardi.domain.profile import Profile
+from tracardi.domain.session import Session, SessionMetadata
+from tracardi.domain.time import EventTime
+from tracardi.service.notation.dot_accessor import DotAccessor
+
+RUNS = 2000
+PATHS = ['profile@id', 'event@type', 'profile@traits.plan']
+
+
+class EagerDotAccessor:
+
+    def __init__(self, profile=None, session=None, payload=None, event=None, flow=None, memory=None):
+        self.storage = {
+            'profile@': dotty(profile.model_dump(mode="json")),
+            'session@': dotty(session.model_dump(mode="json")),
+            'event@': dotty(event.model_dump(mode="json")),
+            'payload@': dotty(payload),
+            'flow@': {},
+            'memory@': {}
+        }
+
+    def __getitem__(self, dot_notation):
+        for prefix, storage in self.storage.items():
+            if dot_notation.startswith(prefix):
+                value = dot_notation[len(prefix):]
+                if value in storage:
+                    return storage[value]
+                raise KeyError(value)
+        return dot_notation
+
+
+def bench(accessor_class, profile, session, event, payload) -> float:
+    start = time.perf_counter()
+    for _ in range(RUNS):
+        dot = accessor_class(profile=profile, session=session, event=event, payload=payload)
+        for path in PATHS:
+            dot[path]
+    return (time.perf_counter() - start) / RUNS * 1000000
+
+
+def main():
+    profile = Profile(id="1", traits={"plan": "pro", "items": [{"id": i} for i in range(50)]},
+                      data={"pii": {"firstname": "John", "lastname": "Doe"}})
+    session = Session(id="1", metadata=SessionMetadata(), context={"browser": {"local": {"device": "pc"}}})
+    event = Event(id='1', type='page-view', metadata=EventMetadata(time=EventTime()), session=EventSession(id='1'),
+                  source=Entity(id='1'), properties={"url": "http://localhost"})
+    payload = {"items": list(range(100))}
+
+    for accessor_class in (EagerDotAccessor, DotAccessor):
+        duration = bench(accessor_class, profile, session, event, payload)
+        print(f"{accessor_class.__name__:16} {len(PATHS)} reads per accessor: {duration:8.2f}us")
+
+
+if __name__ == "__main__":
+    main()
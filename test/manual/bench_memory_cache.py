@@ -0,0 +1,93 @@
+"""
+Inserts and reads 100k keys into MemoryCache and into the previous implementation (pydantic items, full scan
+purge after max_pool inserts). Reports time, memory and cache counters.
+
+Run: python test/manual/bench_memory_cache.py
+"""
+
+import time
+import tracemalloc
+from typing import Any
+
+from pydantic import BaseModel
+
+from tracardi.event_server.utils.memory_cache import MemoryCache, CacheItem
+
+KEYS = 100000
+MAX_POOL = 10000
+
+
+class PreviousCacheItem(BaseModel):
+    data: Any = None
+    ttl: float = 60
+
+    def __init__(self, **data: Any):
+        if 'ttl' in data:
+            data['ttl'] = time.time() + float(data['ttl'])
+        super().__init__(**data)
+
+    def expired(self):
+        return time.time() > self.ttl
+
+
+class PreviousMemoryCache:
+
+    def __init__(self, max_pool):
+        self.memory_buffer = {}
+        self.max_pool = max_pool
+        self.counter = 0
+
+    def __contains__(self, key):
+        if key in self.memory_buffer:
+            if self.memory_buffer[key].expired():
+                del self.memory_buffer[key]
+        return key in self.memory_buffer
+
+    def __setitem__(self, key, value):
+        self.memory_buffer[key] = value
+        self.counter += 1
+        if self.counter > self.max_pool:
+            self.purge()
+
+    def __len__(self):
+        return len(self.memory_buffer)
+
+    def purge(self):
+        for key, value in self.memory_buffer.copy().items():
+            if value.expired():
+                del self.memory_buffer[key]
+
+
+def bench(name, cache_factory, item_class, keys):
+    cache = cache_factory()
+    start = time.perf_counter()
+    for n in range(keys):
+        cache[str(n)] = item_class(data={"id": n}, ttl=60)
+    insert = time.perf_counter() - start
+
+    memory_cache = cache_factory()
+    tracemalloc.start()
+    for n in range(min(keys, MAX_POOL)):
+        memory_cache[str(n)] = item_class(data={"id": n}, ttl=60)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    found = sum(1 for n in range(keys) if str(n) in cache)
+    read = time.perf_counter() - start
+
+    print(f"{name:8} keys={keys} insert={insert * 1000:9.2f}ms read={read * 1000:8.2f}ms "
+          f"memory of {MAX_POOL} items={memory / 1024 / 1024:6.2f}MB size={len(cache)} found={found}")
+    return cache
+
+
+def main():
+    # The previous purge scans the whole buffer on every insert after max_pool, so it gets fewer keys.
+    bench("previous", lambda: PreviousMemoryCache(MAX_POOL), PreviousCacheItem, MAX_POOL + 2000)
+    bench("current", lambda: MemoryCache("bench", max_pool=MAX_POOL), CacheItem, MAX_POOL + 2000)
+    cache = bench("current", lambda: MemoryCache("bench", max_pool=MAX_POOL), CacheItem, KEYS)
+    print(cache.stats())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Compares the previous profile cache format (msgpack of json dump, profile validated on read) with entity_codec.
+Reports bytes per cached value and time per cache hit (decode).
+
+Run: python test/manual/bench_profile_cache_codec.py
+"""
+
+import time
+from datetime import datetime
+
+import msgpack
+
+from tracardi.domain.profile import Profile
+from tracardi.domain.storage_record import RecordMetadata
+from tracardi.service.tracking.cache import entity_codec
+
+READS = 2000
+
+
+def _profile(traits: int) -> Profile:
+    return Profile(
+        id="1",
+        ids=["1", "2"],
+        traits={f"trait-{n}": {"value": n, "label": f"Value of trait {n}"} for n in range(traits)},
+        consents={"marketing": {"revoke": datetime(2024, 1, 1)}},
+        data={"pii": {"firstname": "John", "lastname": "Doe"}, "contact": {"email": {"main": "john@doe.com"}}},
+        interests={"sport": 1.0, "music": 2.0}
+    )
+
+
+def _previous_encode(profile: Profile, metadata: RecordMetadata) -> bytes:
+    return msgpack.packb(({}, profile.model_dump(mode="json", exclude_defaults=True, exclude={"operation": ...}),
+                          None, metadata.model_dump(mode="json")))
+
+
+def _previous_decode(value: bytes) -> Profile:
+    _, data, _, metadata = msgpack.unpackb(value)
+    profile = Profile(**data)
+    profile.set_meta_data(RecordMetadata(**metadata))
+    return profile
+
+
+def _current_decode(value: bytes) -> Profile:
+    profile, metadata = entity_codec.decode(Profile, value)
+    profile.set_meta_data(RecordMetadata.model_construct(**metadata))
+    return profile
+
+
+def _time(decode, value) -> float:
+    start = time.perf_counter()
+    for _ in range(READS):
+        decode(value)
+    return (time.perf_counter() - start) / READS * 1000000
+
+
+def main():
+    metadata = RecordMetadata(id="1", index="tracardi-profile")
+    for traits in (0, 20, 500):
+        profile = _profile(traits)
+        previous = _previous_encode(profile, metadata)
+        current = entity_codec.encode(profile, {}, metadata)
+        print(f"traits={traits:4} previous={len(previous):7}B {_time(_previous_decode, previous):8.1f}us "
+              f"current={len(current):7}B {_time(_current_decode, current):8.1f}us")
+        if entity_codec.zstandard is not None:
+            compressed = entity_codec.encode(profile, {}, metadata, compress_above=1)
+            print(f"{'':11} zstd={len(compressed):7}B {_time(_current_decode, compressed):8.1f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Merges traits and data of synthetic profiles (fake_data_maker) with the previous implementation
+(merge + DeepDiff conflicts + Dotty geo fix) and with the single pass merge.
+
+Run: python test/manual/bench_profile_merge.py
+"""
+
+import time
+
+from dotty_dict import Dotty
+
+from tracardi.domain.profile import Profile
+from tracardi.domain.profile_data import ProfileData
+from tracardi.service.fake_data_maker.generate_profile_data import generate_profile_data
+from tracardi.service.merging.merger import merge, get_conflicted_values, MergingStrategy
+from tracardi.service.profile_merger import ProfileMerger
+
+ROUNDS = 20
+
+
+def _profiles(count: int, traits: int):
+    return [Profile(id=str(n),
+                    data=ProfileData(**generate_profile_data()),
+                    traits={f"trait-{t}": {"value": f"{n}-{t}", "score": t, "tags": [str(t)]} for t in range(traits)})
+            for n in range(count)]
+
+
+def previous_merge(profiles, merging_strategy):
+    _traits = [profile.traits for profile in profiles]
+    _data = [profile.data.model_dump(mode='json') for profile in profiles]
+
+    old_value = {'traits': _traits, "data": _data}
+    new_value = {
+        'traits': merge({}, _traits, merging_strategy),
+        'data': merge({}, _data, merging_strategy)
+    }
+
+    conflicts_aux = get_conflicted_values(old_value, new_value)
+
+    flat_new_values = Dotty(new_value)
+    if 'data.devices.last.geo.location' in flat_new_values:
+        del (flat_new_values['data.devices.last.geo.location'])
+        if 'data.devices.last.geo.latitude' in flat_new_values and 'data.devices.last.geo.longitude' in flat_new_values:
+            flat_new_values['data.devices.last.geo.location'] = [flat_new_values['data.devices.last.geo.latitude'],
+                                                                 flat_new_values['data.devices.last.geo.longitude']]
+        new_value = flat_new_values.to_dict()
+
+    return new_value['traits'], ProfileData(**new_value['data']), conflicts_aux
+
+
+def _time(function, profiles) -> float:
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        function(profiles, MergingStrategy())
+    return (time.perf_counter() - start) / ROUNDS * 1000
+
+
+def main():
+    merger = ProfileMerger(Profile(id="0"))
+    for count, traits in ((2, 10), (10, 100), (50, 500)):
+        profiles = _profiles(count, traits)
+        previous = _time(previous_merge, profiles)
+        current = _time(merger._merge_traits_and_data, profiles)
+        print(f"profiles={count:3} traits={traits:4} previous={previous:9.2f}ms single pass={current:9.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
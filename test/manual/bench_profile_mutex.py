@@ -0,0 +1,63 @@
+"""
+Contention benchmark for the profile mutex. Many coroutines (bursty traffic) lock the same profile,
+hold it for a short time and release. Reports lock wait latency and the number of redis commands issued.
+
+Requires running redis (REDIS_HOST). Run: python test/manual/bench_profile_mutex.py
+"""
+
+import asyncio
+import statistics
+import time
+
+from tracardi.context import ServerContext, Context
+from tracardi.service.storage.redis.collections import Collection
+from tracardi.service.storage.redis_client import AsyncRedisClient
+from tracardi.service.tracking.locking import Lock, AsyncLock, async_mutex
+
+CONTENDERS = [2, 10, 50]
+ROUNDS = 5
+HOLD_TIME = 0.005
+
+
+async def _commands_processed(redis: AsyncRedisClient) -> int:
+    return (await redis.client.info("stats"))['total_commands_processed']
+
+
+async def contend(redis: AsyncRedisClient, contenders: int):
+    key = Lock.get_key(Collection.lock_tracker, "profile", f"bench-{contenders}")
+    waits = []
+    inside = 0
+    max_inside = 0
+
+    async def _worker(n):
+        nonlocal inside, max_inside
+        for _ in range(ROUNDS):
+            start = time.perf_counter()
+            async with async_mutex(AsyncLock(redis, key, default_lock_ttl=3), name=f"worker-{n}"):
+                waits.append(time.perf_counter() - start)
+                inside += 1
+                max_inside = max(max_inside, inside)
+                await asyncio.sleep(HOLD_TIME)
+                inside -= 1
+
+    commands = await _commands_processed(redis)
+    start = time.perf_counter()
+    await asyncio.gather(*[_worker(n) for n in range(contenders)])
+    duration = time.perf_counter() - start
+    commands = await _commands_processed(redis) - commands - 1
+
+    waits.sort()
+    print(f"contenders={contenders:3} locks/s={len(waits) / duration:8.1f} "
+          f"wait p50={statistics.median(waits) * 1000:7.2f}ms p99={waits[int(len(waits) * 0.99) - 1] * 1000:7.2f}ms "
+          f"redis commands/lock={commands / len(waits):5.2f} max holders={max_inside}")
+
+
+async def main():
+    redis = AsyncRedisClient()
+    for contenders in CONTENDERS:
+        await contend(redis, contenders)
+
+
+if __name__ == "__main__":
+    with ServerContext(Context(production=False, tenant="bench")):
+        asyncio.run(main())
@@ -0,0 +1,65 @@
+"""
+Compares per-process concurrency of the redis round-trips done by /track (profile lock, profile cache
+load and save) when issued via the blocking RedisClient and the non-blocking AsyncRedisClient.
+
+Requires running redis (REDIS_HOST). Run: python test/manual/bench_redis_client.py
+"""
+
+import asyncio
+import time
+from uuid import uuid4
+
+import msgpack
+
+from tracardi.context import ServerContext, Context
+from tracardi.service.storage.redis_client import RedisClient, AsyncRedisClient
+
+CONCURRENCY = [1, 10, 50, 100]
+REQUESTS = 2000
+payload = msgpack.packb({"id": str(uuid4()), "traits": {f"trait-{i}": i for i in range(100)}})
+
+
+async def sync_track_like(redis: RedisClient, key: str):
+    # Blocking calls inside a coroutine - this is how the tracker used redis before
+    redis.exists(f"lock:{key}")
+    redis.set(f"lock:{key}", b"1", ex=3)
+    redis.get(f"profile:{key}")
+    redis.set(f"profile:{key}", payload, ex=60)
+    redis.delete(f"lock:{key}")
+    # Simulates other non-blocking work in the request (e.g. elastic save)
+    await asyncio.sleep(0.001)
+
+
+async def async_track_like(redis: AsyncRedisClient, key: str):
+    await redis.exists(f"lock:{key}")
+    await redis.set(f"lock:{key}", b"1", ex=3)
+    await redis.get(f"profile:{key}")
+    await redis.set(f"profile:{key}", payload, ex=60)
+    await redis.delete(f"lock:{key}")
+    await asyncio.sleep(0.001)
+
+
+async def run(name, func, redis, concurrency):
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _one(i):
+        async with semaphore:
+            await func(redis, f"bench:{i % 500}")
+
+    start = time.perf_counter()
+    await asyncio.gather(*[_one(i) for i in range(REQUESTS)])
+    duration = time.perf_counter() - start
+    print(f"{name:6} concurrency={concurrency:4} requests/s={REQUESTS / duration:10.1f} total={duration:.3f}s")
+
+
+async def main():
+    sync_redis = RedisClient()
+    async_redis = AsyncRedisClient()
+    for concurrency in CONCURRENCY:
+        await run("sync", sync_track_like, sync_redis, concurrency)
+        await run("async", async_track_like, async_redis, concurrency)
+
+
+if __name__ == "__main__":
+    with ServerContext(Context(production=False, tenant="bench")):
+        asyncio.run(main())
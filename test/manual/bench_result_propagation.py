@@ -0,0 +1,115 @@
+"""
+Runs a wide fan-out flow with a large payload and reports time and memory allocated per run. Nodes that
+declare `mutates_input` get a deep copy of the payload, other nodes share the upstream result.
+
+Run: python test/manual/bench_result_propagation.py
+"""
+
+import asyncio
+import time
+import tracemalloc
+
+from tracardi.context import ServerContext, Context
+from tracardi.domain.entity import Entity
+from tracardi.domain.event import Event, EventSession
+from tracardi.domain.event_metadata import EventMetadata
+from tracardi.domain.flow import Flow
+from tracardi.domain.profile import Profile
+from tracardi.domain.time import EventTime
+from tracardi.service.plugin.domain.register import Plugin, Spec, MetaData
+from tracardi.service.plugin.domain.result import Result
+from tracardi.service.plugin.runner import ActionRunner
+from tracardi.service.wf.domain.debug_info import DebugInfo, FlowDebugInfo
+from tracardi.service.wf.domain.entity import Entity as WfEntity
+from tracardi.service.wf.domain.flow_history import FlowHistory
+from tracardi.service.wf.service.builders import action
+from tracardi.service.wf.utils.dag_processor import DagProcessor
+from tracardi.service.wf.utils.flow_graph_converter import FlowGraphConverter
+
+FAN_OUT = [1, 5, 20]
+PAYLOAD_ITEMS = 5000
+RUNS = 10
+
+payload = {"items": [{"id": i, "name": f"item-{i}", "tags": ["a", "b", "c"]} for i in range(PAYLOAD_ITEMS)]}
+
+
+class SourceAction(ActionRunner):
+
+    async def run(self, payload: dict, in_edge=None):
+        return Result(port="payload", value=globals()['payload'])
+
+
+class PassAction(ActionRunner):
+
+    async def run(self, payload: dict, in_edge=None):
+        return Result(port="payload", value=payload)
+
+
+class MutatingPassAction(PassAction):
+    mutates_input = True
+
+
+def register() -> Plugin:
+    return Plugin(
+        start=False,
+        spec=Spec(module=__name__, className='PassAction', inputs=["payload"], outputs=["payload"], version='0.1'),
+        metadata=MetaData(name='Pass')
+    )
+
+
+def _node(plugin, start=False):
+    node = action(plugin)
+    node.data.spec.className = plugin.__name__
+    node.data.start = start
+    return node
+
+
+def build_flow(fan_out: int, plugin) -> Flow:
+    # source -> fan_out nodes -> one node each
+    source = _node(SourceAction, start=True)
+    flow = Flow.build("Bench", id="bench")
+    for _ in range(fan_out):
+        node = _node(plugin)
+        flow += source('payload') >> node('payload')
+        flow += node('payload') >> _node(plugin)('payload')
+    return flow
+
+
+async def run_flow(flow: Flow, event: Event):
+    dag_graph = FlowGraphConverter(flow.flowGraph.model_dump()).convert_to_dag_graph()
+    dag = DagProcessor(dag_graph)
+    exec_dag = dag.make_execution_dag(start_nodes=dag.find_start_nodes(), debug=False)
+    debug_info = DebugInfo(timestamp=time.time(), flow=FlowDebugInfo(id=flow.id, name=flow.name),
+                           event=WfEntity(id=event.id))
+    profile = Profile(id="1")
+    await exec_dag.init(debug_info, [], flow, FlowHistory(history=[]), event, None, profile, None, [])
+    await exec_dag.run(payload={}, event=event, profile=profile, session=None, debug_info=debug_info, log_list=[])
+    await exec_dag.close()
+
+
+async def main():
+    event = Event(id='1', type='bench', metadata=EventMetadata(time=EventTime()), session=EventSession(id='1'),
+                  source=Entity(id='1'))
+
+    for fan_out in FAN_OUT:
+        for plugin in (PassAction, MutatingPassAction):
+            flow = build_flow(fan_out, plugin)
+            await run_flow(flow, event)  # Warm up
+
+            start = time.perf_counter()
+            for _ in range(RUNS):
+                await run_flow(flow, event)
+            duration = time.perf_counter() - start
+
+            tracemalloc.start()
+            await run_flow(flow, event)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            print(f"{plugin.__name__:18} fan-out={fan_out:3} run={duration / RUNS * 1000:8.2f}ms "
+                  f"allocated per run (peak)={peak / 1024 / 1024:8.2f}MB")
+
+
+if __name__ == "__main__":
+    with ServerContext(Context(production=False, tenant="bench")):
+        asyncio.run(main())
@@ -0,0 +1,75 @@
+"""
+Speed comparison of the earley (uql_expr.lark) and LALR (uql_expr_lalr.lark) condition grammars on
+thousands of generated conditions. Also reports how many conditions only earley could parse.
+
+Run: python test/manual/bench_tql_parser.py
+"""
+
+import random
+import time
+
+from lark.exceptions import UnexpectedInput
+
+from tracardi.process_engine.tql.parser import Parser
+
+NUMBER_OF_CONDITIONS = 3000
+
+fields = ['payload@a.b', 'profile@traits.age', 'event@type', 'session@context.browser.local.device.platform',
+          'profile@data.contact.email.main', 'event@properties.price', 'profile@metadata.time.insert']
+values = ['1', '-1.5', '"page-view"', 'TRUE', 'null', '[1,2,"3"]', 'now()', 'datetime("2023-01-01")',
+          'now.offset("-1d")']
+templates = [
+    '{field} {op} {value}',
+    '{field} {op} {field2}',
+    '{field} exists',
+    '{field} not exists',
+    '{field} empty',
+    '{field} not empty',
+    '{field} is null',
+    '{field} is not null',
+    '{field} contains {value}',
+    '{field} starts with "a"',
+    '{field} between {value} and {value2}',
+    'datetime({field}) < {value}',
+]
+
+
+def _condition():
+    def _single():
+        return random.choice(templates).format(
+            field=random.choice(fields), field2=random.choice(fields), value=random.choice(values),
+            value2=random.choice(values), op=random.choice(['==', '!=', '>', '<=', '=>']))
+
+    conditions = [_single() for _ in range(random.randint(1, 4))]
+    operator = random.choice([' and ', ' OR '])
+    condition = operator.join(conditions)
+    if random.random() > 0.7:
+        condition = f"({condition}) and {_single()}"
+    return condition
+
+
+def _run(parser, conditions):
+    results = []
+    start = time.perf_counter()
+    for condition in conditions:
+        try:
+            results.append(parser.parse(condition))
+        except UnexpectedInput as e:
+            results.append(type(e))
+    return results, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    random.seed(1)
+    conditions = [_condition() for _ in range(NUMBER_OF_CONDITIONS)]
+
+    earley = Parser(Parser.read('grammar/uql_expr.lark'), start='expr')
+    lalr = Parser(Parser.read('grammar/uql_expr_lalr.lark'), start='expr', parser='lalr')
+
+    earley_results, earley_time = _run(earley, conditions)
+    lalr_results, lalr_time = _run(lalr, conditions)
+
+    print(f"earley: {len(conditions) / earley_time:10.1f} conditions/s")
+    print(f"lalr:   {len(conditions) / lalr_time:10.1f} conditions/s ({earley_time / lalr_time:.1f}x)")
+    fallbacks = sum(1 for e, l in zip(earley_results, lalr_results) if isinstance(l, type) and not isinstance(e, type))
+    print(f"conditions that need earley fallback: {fallbacks}")
@@ -0,0 +1,164 @@
+"""
+End-to-end benchmark of os_tracker. Streams fake tracker payloads (service/fake_data_maker) through the tracker,
+CONCURRENCY payloads at a time, and reports latency (p50, p99) and events/s of the whole tracker and of its
+stages: loading, compute, save, dispatch and workflow. Stage functions are wrapped in the tracker module, so
+the tracker code is measured as it is.
+
+Redis is replaced by fakeredis and the elasticsearch and mysql calls of the tracker by in-process stubs (no
+event mappings, destinations or workflow triggers), so no services are needed. The numbers show the cost of
+the tracker code (with in-process redis), not of the databases. Run: python test/manual/bench_tracker.py
+"""
+
+import asyncio
+import math
+import time
+from collections import defaultdict
+from contextvars import ContextVar
+from typing import Callable, Dict, List
+
+from dotty_dict import Dotty
+from fakeredis import FakeRedis, aioredis
+
+from tracardi.context import ServerContext, Context
+from tracardi.domain.event_source import EventSource
+from tracardi.domain.named_entity import NamedEntity
+from tracardi.domain.payload.tracker_payload import TrackerPayload
+from tracardi.service.destination import dispatchers
+from tracardi.service.fake_data_maker.generate_payload import generate_payload
+from tracardi.service.storage.driver.elastic import profile as profile_db
+from tracardi.service.storage.driver.elastic import field_update_log as field_update_log_db
+from tracardi.service.storage.mysql.service.workflow_trigger_service import WorkflowTriggerService
+from tracardi.service.storage.redis_client import RedisClient, AsyncRedisClient
+from tracardi.service.tracker_config import TrackerConfig
+from tracardi.service.tracking import tracker, locking, event_data_computation
+from tracardi.service.tracking.storage import session_storage
+from tracardi.service.wf import triggers
+
+PAYLOADS = 1000
+WARM_UP = 50
+CONCURRENCY = [1, 10, 50]
+
+STAGES = {
+    "tracker_loading": "loading",
+    "compute_data": "compute",
+    "save_profile": "save",
+    "save_session": "save",
+    "save_events_in_db": "save",
+    "sync_event_destination": "dispatch",
+    "sync_profile_destination": "dispatch",
+    "exec_workflow": "workflow",
+}
+
+# Stage -> list of (duration, number of events)
+timings: Dict[str, List[tuple]] = defaultdict(list)
+# Number of events of the tracked payload, set per payload task
+payload_events: ContextVar[int] = ContextVar("payload_events", default=0)
+
+
+async def _none(*args, **kwargs):
+    return None
+
+
+async def _empty(*args, **kwargs):
+    return []
+
+
+def _use_local_storage():
+    redis = aioredis.FakeRedis()
+    RedisClient().client = FakeRedis()
+    AsyncRedisClient().client = redis
+    for script in (locking._acquire_script, locking._break_in_script, locking._release_script):
+        script.registered_client = redis
+
+    # Elasticsearch
+    profile_db.save = _none
+    profile_db.load_by_id = _none
+    field_update_log_db.upsert = _none
+    session_storage.save_session_to_db = _none
+    session_storage.load_session_from_db = _none
+    triggers.save_session_to_db = _none
+    tracker.save_events_in_db = _none
+
+    # Mysql
+    event_data_computation.load_event_mapping = _none
+    event_data_computation.load_event_to_profile = _empty
+    dispatchers.load_event_destinations = _empty
+    dispatchers.load_profile_destinations = _empty
+    WorkflowTriggerService.load_by_source_and_events = _none
+
+    # Tracardi's dotty-dict fork returns the wrapped dict. Upstream dotty-dict converts it to json and back,
+    # which fails on profile datetimes.
+    Dotty.to_dict = lambda self: self._data
+
+
+def _timed(stage: str, func: Callable):
+    async def _wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            timings[stage].append((time.perf_counter() - start, payload_events.get()))
+    return _wrapper
+
+
+def _percentile(values: List[float], percent: float) -> float:
+    values = sorted(values)
+    return values[max(math.ceil(len(values) * percent) - 1, 0)] * 1000
+
+
+def _report(name: str, durations: List[float], events: int, wall_time: float):
+    print(f"  {name:10} calls={len(durations):6} p50={_percentile(durations, 0.5):8.2f}ms "
+          f"p99={_percentile(durations, 0.99):8.2f}ms events/s={events / wall_time:10.1f}")
+
+
+async def _track(source: EventSource, tracker_config: TrackerConfig, payload: dict):
+    tracker_payload = TrackerPayload(**payload)
+    tracker_payload.source = source
+    payload_events.set(len(tracker_payload.events))
+    start = time.perf_counter()
+    await tracker.os_tracker(source, tracker_payload, tracker_config, time.time())
+    timings["tracker"].append((time.perf_counter() - start, len(tracker_payload.events)))
+
+
+async def run(concurrency: int, source: EventSource, tracker_config: TrackerConfig):
+    payloads = [generate_payload(source.id) for _ in range(PAYLOADS + WARM_UP)]
+    limit = asyncio.Semaphore(concurrency)
+
+    async def _limited(payload):
+        async with limit:
+            await _track(source, tracker_config, payload)
+
+    await asyncio.gather(*[_limited(payload) for payload in payloads[:WARM_UP]])
+    timings.clear()
+
+    start = time.perf_counter()
+    await asyncio.gather(*[_limited(payload) for payload in payloads[WARM_UP:]])
+    wall_time = time.perf_counter() - start
+
+    # Tracker events/s is the throughput, stage events/s is events per second spent in the stage.
+    print(f"concurrency={concurrency}")
+    for stage in ["tracker", "loading", "compute", "save", "dispatch", "workflow"]:
+        if timings[stage]:
+            durations = [duration for duration, _ in timings[stage]]
+            _report(stage,
+                    durations,
+                    sum(events for _, events in timings["tracker"]),
+                    wall_time if stage == "tracker" else sum(durations))
+
+
+async def main():
+    _use_local_storage()
+    for name, stage in STAGES.items():
+        setattr(tracker, name, _timed(stage, getattr(tracker, name)))
+
+    source = EventSource(id="bench-source", type=["rest"], name="Benchmark",
+                         bridge=NamedEntity(id="778ded05-4ff3-4e08-9a86-72c0195fa95d", name="REST API Bridge"))
+    tracker_config = TrackerConfig(ip="127.0.0.1", allowed_bridges=["rest"])
+
+    for concurrency in CONCURRENCY:
+        await run(concurrency, source, tracker_config)
+
+
+if __name__ == "__main__":
+    with ServerContext(Context(production=False)):
+        asyncio.run(main())
@@ -0,0 +1,48 @@
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from tracardi.context import ServerContext, Context
+from tracardi.domain.profile import Profile
+from tracardi.domain.resource import Resource, ResourceCredentials
+from tracardi.process_engine.action.v1.connectors.api_call import plugin as api_call
+from tracardi.process_engine.action.v1.connectors.api_call.plugin import RemoteCallAction
+from tracardi.service.plugin.domain.console import Console
+from tracardi.service.wf.domain.node import Node
+
+
+@pytest.mark.asyncio
+async def test_pooled_api_call_uses_changed_resource(monkeypatch):
+    resource = Resource(id="api", name="Api", type="api",
+                        credentials=ResourceCredentials(test={"url": "http://localhost", "headers": {"Key": "old"}}))
+
+    async def load_resource(resource_id):
+        return resource
+
+    monkeypatch.setattr(api_call, "load_resource", load_resource)
+
+    async def endpoint(request: web.Request):
+        return web.json_response({"key": request.headers.get("Key")})
+
+    app = web.Application()
+    app.router.add_get('/endpoint', endpoint)
+
+    with ServerContext(Context(production=False)):
+        async with TestServer(app) as server:
+            resource.credentials.test['url'] = str(server.make_url('/'))
+
+            action = RemoteCallAction()
+            action.console = Console("Test", "test", "abc")
+            action.profile = Profile(id="1")
+            action.node = Node(id="node", name="Api call", className="RemoteCallAction", module=api_call.__name__)
+            await action.set_up({"source": {"id": "api", "name": "Api"}, "endpoint": "/endpoint",
+                                 "method": "get", "body": {"type": "application/json", "content": "{}"}})
+
+            result = await action.run({})
+            assert result.value['content'] == {"key": "old"}
+
+            # Pooled instance is reused after the resource changed.
+            resource.credentials = ResourceCredentials(test={"url": str(server.make_url('/')),
+                                                             "headers": {"Key": "new"}})
+            result = await action.run({})
+            assert result.value['content'] == {"key": "new"}
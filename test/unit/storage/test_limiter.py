@@ -1,8 +1,11 @@
+import asyncio
+import pytest
+from fakeredis import aioredis
 from time import sleep
 from uuid import uuid4
 
 from tracardi.context import ServerContext, Context
-from tracardi.service.throttle import Limiter
+from tracardi.service.throttle import Limiter, AsyncLimiter
 
 
 def test_should_limit_calls():
@@ -21,3 +24,22 @@ def test_should_limit_calls():
 
         assert passes == limit
 
+
+
+@pytest.mark.asyncio
+async def test_should_limit_calls_async(monkeypatch):
+    with ServerContext(Context(production=False)):
+        limit = 3
+        limiter = AsyncLimiter(limit=limit, ttl=10)
+        monkeypatch.setattr(limiter._redis, "client", aioredis.FakeRedis())
+        key = str(uuid4())
+        passes = 0
+        while True:
+            block, ttl = await limiter.limit(key)
+
+            if block is False:
+                break
+            passes += 1
+            await asyncio.sleep(0.01)
+
+        assert passes == limit
@@ -0,0 +1,131 @@
+import asyncio
+
+import pytest
+from fakeredis import aioredis
+
+from tracardi.context import ServerContext, Context, get_context
+from tracardi.service.storage.redis.collections import Collection
+from tracardi.service.tracking import locking
+from tracardi.service.tracking.locking import AsyncLock, Lock, async_mutex, LOCKED, BROKE
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    client = aioredis.FakeRedis()
+    monkeypatch.setattr(locking._async_redis, "client", client)
+    for script in (locking._acquire_script, locking._break_in_script, locking._release_script):
+        monkeypatch.setattr(script, "registered_client", client)
+    with ServerContext(Context(production=False)):
+        yield client
+
+
+def _lock(profile_id: str = "1") -> AsyncLock:
+    return AsyncLock(locking._async_redis, Lock.get_key(Collection.lock_tracker, "profile", profile_id),
+                     default_lock_ttl=3)
+
+
+@pytest.mark.asyncio
+async def test_lock_is_acquired_once_with_increasing_fencing_tokens(redis):
+    lock = _lock()
+    acquired, metadata = await lock.acquire("first")
+    assert acquired
+    assert metadata.name == "first" and metadata.state == LOCKED and metadata.token == "1"
+    assert lock.token == "1"
+
+    other = _lock()
+    acquired, holder = await other.acquire("second")
+    assert not acquired
+    assert holder.name == "first" and holder.token == "1"
+    assert 0 < holder.ttl <= 3000
+    assert other.token is None
+
+    await lock.unlock()
+    assert not await lock.is_locked()
+
+    acquired, metadata = await other.acquire("second")
+    assert acquired and metadata.token == "2"
+
+
+@pytest.mark.asyncio
+async def test_only_holder_of_current_token_releases_lock(redis):
+    lock = _lock()
+    await lock.acquire("first")
+
+    stale = _lock()
+    stale._token = "0"
+    await stale.unlock()
+    assert await lock.is_locked()
+
+    # Other profile locks have their own keys.
+    acquired, _ = await _lock("2").acquire("second")
+    assert acquired
+
+    await lock.unlock()
+    assert not await lock.is_locked()
+    assert await _lock("2").is_locked()
+
+
+@pytest.mark.asyncio
+async def test_break_in_takes_over_lock_of_the_holder(redis):
+    lock = _lock()
+    _, holder = await lock.acquire("first")
+
+    intruder = _lock()
+    assert await intruder.break_in("second", holder)
+    assert intruder.token == "2"
+    assert await intruder.get_state() == BROKE
+    assert await intruder.get_locked_inside() == "second"
+
+    # Lock changed hands, so it can not be broken with the old holder again.
+    assert not await _lock().break_in("third", holder)
+
+    # Previous holder can not release the lock it lost.
+    await lock.unlock()
+    assert await intruder.is_locked()
+
+    await intruder.unlock()
+    assert not await intruder.is_locked()
+
+
+@pytest.mark.asyncio
+async def test_release_is_announced_on_tenant_prefixed_channel(redis):
+    lock = _lock()
+    tenant = get_context().tenant
+    assert lock.channel == f"{tenant}:{Collection.lock_release}{lock.key}"
+
+    released = locking._lock_release_listener.watch(lock.channel)
+    try:
+        for _ in range(100):
+            if locking._lock_release_listener.subscribed:
+                break
+            await asyncio.sleep(0.01)
+        assert locking._lock_release_listener.subscribed
+        assert f"{tenant}:{Collection.lock_release}*" in locking._lock_release_listener._subscribed
+
+        await lock.acquire("first")
+        assert not released.is_set()
+        await lock.unlock()
+        await asyncio.wait_for(released.wait(), 1)
+    finally:
+        locking._lock_release_listener.unwatch(lock.channel, released)
+
+
+@pytest.mark.asyncio
+async def test_waiting_mutex_acquires_lock_when_released(redis):
+    lock = _lock()
+    await lock.acquire("first")
+
+    order = []
+
+    async def _wait_for_lock():
+        async with async_mutex(_lock(), "second", break_after_time=10) as acquired:
+            order.append(("second", acquired.token))
+
+    waiting = asyncio.create_task(_wait_for_lock())
+    await asyncio.sleep(0.1)
+    order.append(("first", lock.token))
+    await lock.unlock()
+    await asyncio.wait_for(waiting, 1)
+
+    assert order == [("first", "1"), ("second", "2")]
+    assert not await lock.is_locked()
@@ -0,0 +1,104 @@
+import pytest
+
+from tracardi.context import ServerContext, Context
+from tracardi.domain.entity import Entity
+from tracardi.domain.payload.tracker_payload import TrackerPayload
+from tracardi.domain.profile import Profile
+from tracardi.domain.session import Session
+from tracardi.service.tracker_config import TrackerConfig
+from tracardi.service.tracking import bulk_tracker
+
+
+def _payload(profile_id=None, session_id="s1", events=("page-view",), context=None, profile_less=False):
+    return TrackerPayload(
+        source=Entity(id="source"),
+        profile={"id": profile_id} if profile_id else None,
+        session=Entity(id=session_id) if session_id else None,
+        context=context or {},
+        profile_less=profile_less,
+        events=[{"type": event_type} for event_type in events]
+    )
+
+
+def test_consecutive_payloads_of_profile_are_joined():
+    groups = bulk_tracker.group_payloads([
+        _payload("p1", events=("a",)),
+        _payload("p2", events=("b",)),
+        _payload("p1", events=("c", "d")),
+        _payload("p1", session_id="s2", events=("e",)),
+        _payload("p1", session_id="s2", events=("f",), context={"page": 1}),
+        _payload(None, events=("g",)),
+        _payload(None, events=("h",)),
+        _payload(None, events=("i",), profile_less=True),
+        _payload(None, events=("j",), profile_less=True),
+    ])
+
+    assert [[payload.get_event_types() for payload in group.payloads] for group in groups] == [
+        [["a", "c", "d"], ["e"], ["f"]],
+        [["b"]],
+        [["g"]],
+        [["h"]],
+        [["i"]],
+        [["j"]]
+    ]
+
+
+@pytest.mark.asyncio
+async def test_batch_is_computed_per_group_and_saved_in_bulk(monkeypatch):
+    computed = []
+    saved = {}
+    cached = {}
+
+    async def load_caches(ids, context):
+        return {}
+
+    async def load_or_create_session(tracker_payload, cached_session=None):
+        return Session.new(id=tracker_payload.session.id), tracker_payload
+
+    async def load_profile_and_session(session, tracker_config, tracker_payload, cached_profile=None):
+        return cached_profile or Profile.new(id=tracker_payload.profile.id), session
+
+    async def compute_data(profile, session, tracker_payload, tracker_config, source):
+        computed.append((profile.id, tracker_payload.get_event_types()))
+        profile.set_updated()
+        return profile, session, tracker_payload.events, tracker_payload, None
+
+    def save(name):
+        async def _save(entities, chunk_size):
+            saved[name] = [entity.id if hasattr(entity, 'id') else entity.type for entity in entities]
+            return bulk_tracker.profile_db.BulkInsertResult()
+        return _save
+
+    async def save_cache(entities, context):
+        cached.setdefault('calls', 0)
+        cached['calls'] += 1
+
+    async def dispatch(*args):
+        raise AssertionError("Destinations and workflows must not run.")
+
+    monkeypatch.setattr(bulk_tracker, "load_profile_caches", load_caches)
+    monkeypatch.setattr(bulk_tracker, "load_session_caches", load_caches)
+    monkeypatch.setattr(bulk_tracker, "load_or_create_session", load_or_create_session)
+    monkeypatch.setattr(bulk_tracker, "load_profile_and_session", load_profile_and_session)
+    monkeypatch.setattr(bulk_tracker, "compute_data", compute_data)
+    monkeypatch.setattr(bulk_tracker.profile_db, "save_in_chunks", save("profiles"))
+    monkeypatch.setattr(bulk_tracker.session_db, "save_in_chunks", save("sessions"))
+    monkeypatch.setattr(bulk_tracker.event_db, "save_in_chunks", save("events"))
+    monkeypatch.setattr(bulk_tracker, "save_profile_cache", save_cache)
+    monkeypatch.setattr(bulk_tracker, "save_session_cache", save_cache)
+    monkeypatch.setattr(bulk_tracker, "_dispatch", dispatch)
+
+    with ServerContext(Context(production=False)):
+        result = await bulk_tracker.bulk_tracker([
+            _payload("p1", events=("a",)),
+            _payload("p2", events=("b",)),
+            _payload("p1", events=("c",)),
+            _payload("p1", session_id="s2", events=("d",)),
+        ], TrackerConfig(ip="127.0.0.1", allowed_bridges=["rest"]), 0)
+
+    assert computed == [("p1", ["a", "c"]), ("p1", ["d"]), ("p2", ["b"])]
+    assert sorted(saved["profiles"]) == ["p1", "p2"]
+    assert sorted(saved["sessions"]) == ["s1", "s2"]
+    assert len(saved["events"]) == 4
+    assert cached['calls'] == 2
+    assert result == {"profiles": 2, "sessions": 2, "events": 4, "errors": []}
@@ -0,0 +1,98 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from tracardi.context import ServerContext, Context, get_context
+from tracardi.domain.profile import Profile
+from tracardi.process_engine.destination.destination_interface import DestinationInterface
+from tracardi.service.destination.dispatch_engine import DestinationDispatchEngine, DispatchJob
+
+calls = []
+running = {}
+max_running = {}
+
+
+class SlowDestination(DestinationInterface):
+
+    async def dispatch_event(self, data, profile, session, event):
+        destination_id = self.destination.id
+        running[destination_id] = running.get(destination_id, 0) + 1
+        max_running[destination_id] = max(max_running.get(destination_id, 0), running[destination_id])
+        await asyncio.sleep(0.01)
+        running[destination_id] -= 1
+        calls.append((destination_id, data, get_context().production))
+
+    async def dispatch_profile(self, data, profile, session, changed_fields=None):
+        raise ValueError("Failed")
+
+
+def _jobs(destination_class, destination_id, count):
+    destination = destination_class(False, None, SimpleNamespace(id=destination_id))
+    return [DispatchJob(destination, n, Profile(id="1"), None, event=SimpleNamespace(id=str(n)))
+            for n in range(count)]
+
+
+def _clear():
+    calls.clear()
+    running.clear()
+    max_running.clear()
+
+
+@pytest.mark.asyncio
+async def test_destinations_are_dispatched_concurrently_within_limits():
+    _clear()
+    engine = DestinationDispatchEngine(concurrency=2, buffered=False, batch_size=10, batch_wait=0.01,
+                                       buffer_size=10)
+    with ServerContext(Context(production=False, tenant="test")):
+        await engine.dispatch(_jobs(SlowDestination, "a", 6) + _jobs(SlowDestination, "b", 2))
+
+    assert max_running == {"a": 2, "b": 2}
+    assert len([call for call in calls if call[0] == "a"]) == 6
+    assert len([call for call in calls if call[0] == "b"]) == 2
+
+
+@pytest.mark.asyncio
+async def test_dispatch_errors_do_not_stop_other_destinations():
+    _clear()
+    engine = DestinationDispatchEngine(concurrency=2, buffered=False, batch_size=10, batch_wait=0.01,
+                                       buffer_size=10)
+    destination = SlowDestination(False, None, SimpleNamespace(id="a"))
+    with ServerContext(Context(production=False, tenant="test")):
+        await engine.dispatch([DispatchJob(destination, 1, Profile(id="1"), None, changed_fields=[])] +
+                              _jobs(SlowDestination, "b", 1))
+
+    assert calls == [("b", 0, False)]
+
+
+@pytest.mark.asyncio
+async def test_buffered_dispatch_runs_outside_request_in_request_context():
+    _clear()
+    engine = DestinationDispatchEngine(concurrency=2, buffered=True, batch_size=10, batch_wait=0.01, buffer_size=100)
+    with ServerContext(Context(production=True, tenant="test")):
+        await engine.dispatch(_jobs(SlowDestination, "a", 3))
+    with ServerContext(Context(production=False, tenant="test")):
+        await engine.dispatch(_jobs(SlowDestination, "b", 2))
+
+    assert calls == []
+
+    await engine.flush()
+
+    assert sorted(call for call in calls if call[0] == "a") == [("a", 0, True), ("a", 1, True),
+                                                                 ("a", 2, True)]
+    assert sorted(call for call in calls if call[0] == "b") == [("b", 0, False), ("b", 1, False)]
+
+
+@pytest.mark.asyncio
+async def test_shutdown_flushes_buffered_dispatches(monkeypatch):
+    from tracardi.service import shutdown as shutdown_module
+
+    _clear()
+    engine = DestinationDispatchEngine(concurrency=2, buffered=True, batch_size=10, batch_wait=0.01, buffer_size=100)
+    monkeypatch.setattr(shutdown_module, "dispatch_engine", engine)
+    with ServerContext(Context(production=False, tenant="test")):
+        await engine.dispatch(_jobs(SlowDestination, "a", 2))
+
+    await shutdown_module.shutdown()
+
+    assert len(calls) == 2
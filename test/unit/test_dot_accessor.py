@@ -1,3 +1,11 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+from tracardi.domain.profile import Profile
+from tracardi.domain.metadata import ProfileMetadata
+from tracardi.domain.time import ProfileTime
+
 from tracardi.service.notation.dot_accessor import DotAccessor
 
 
@@ -156,3 +164,72 @@ def test_should_cast_values():
     assert array_value == [1, 2, 3]
     assert object_value == {"key": "1.02"}
     assert memory_casted
+
+
+def test_dot_accessor_converts_sources_on_first_access():
+    dumps = []
+
+    class Model(BaseModel):
+        a: int = 1
+
+        def model_dump(self, **kwargs):
+            dumps.append(kwargs)
+            return super().model_dump(**kwargs)
+
+    dot = DotAccessor(profile=Model(), session=Model(), event=Model())
+    assert dumps == []
+
+    assert dot['profile@a'] == 1
+    assert dumps == []
+
+    assert dot['profile@...'] == {"a": 1}
+    assert 'a' in dot.profile
+    assert dumps == [{"mode": "json"}]
+
+
+def test_dot_accessor_reads_models_as_dumped():
+    profile = Profile(id="1", traits={"a": [{"b": 1}, 0]}, metadata=ProfileMetadata(time=ProfileTime(
+        insert=datetime(2024, 1, 1))))
+    eager = DotAccessor(profile=profile.model_dump(mode="json"))
+    dot = DotAccessor(profile=profile)
+
+    for path in ['profile@id', 'profile@traits', 'profile@traits.a.0.b', 'profile@metadata.time.insert',
+                 'profile@metadata.time', 'profile@stats.visits', 'profile@traits.a.1', 'profile@traits.a.0:1',
+                 'profile@traits.x', 'profile@missing', 'profile@ids.0']:
+        if path in eager:
+            assert dot[path] == eager[path]
+        else:
+            assert path not in dot
+
+
+def test_dot_accessor_keeps_storage_in_sync():
+    data = {"a": {"b": 1}}
+    dot = DotAccessor(payload=data)
+    dot['payload@a.c'] = 2
+    assert data == {"a": {"b": 1, "c": 2}}
+
+    dot = DotAccessor(profile=Profile(id="1", traits={"a": [1]}))
+    dot['profile@traits.a'].append(2)
+    assert dot['profile@traits.a'] == [1, 2]
+
+    dot.set_storage('event', {"type": "page-view"})
+    assert dot['event@type'] == "page-view"
+    assert dot.event['type'] == "page-view"
+
+    dot.session = {"id": "1"}
+    assert dot['session@id'] == "1"
+    assert dot.storage['session@'] == {"id": "1"}
+
+    try:
+        DotAccessor(profile=1)
+        assert False
+    except ValueError:
+        assert True
+
+
+def test_dot_accessor_escaped_paths():
+    dot = DotAccessor(profile={"a.b": 1, "c": [{"d": 2}]})
+    assert dot['profile@a\\.b'] == 1
+    assert dot['profile@c.0.d'] == 2
+    assert dot['profile@c.0.d'] == 2
+    assert 'profile@c.1.d' not in dot
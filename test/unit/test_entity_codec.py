@@ -0,0 +1,91 @@
+from datetime import datetime, timezone, time
+from decimal import Decimal
+from uuid import uuid4
+
+import msgpack
+
+from tracardi.domain.profile import Profile, ConsentRevoke
+from tracardi.domain.session import Session, SessionContext, SessionMetadata, SessionTime
+from tracardi.domain.storage_record import RecordMetadata
+from tracardi.service.tracking.cache import entity_codec
+from tracardi.service.tracking.cache.profile_cache import profile_from_cache
+
+
+def _profile() -> Profile:
+    return Profile(
+        id="1",
+        ids=["1", "2"],
+        traits={"a": {"b": [1, 2, 3]}},
+        consents={"marketing": {"revoke": datetime(2024, 1, 1, tzinfo=timezone.utc)}},
+        data={
+            "pii": {"birthday": datetime(2000, 1, 1)},
+            "devices": {"last": {"geo": {"latitude": 1.0, "longitude": 2.0}}}
+        }
+    )
+
+
+def _legacy(entity):
+    return type(entity)(**entity.model_dump(mode="json", exclude_defaults=True, exclude={"operation": ...}))
+
+
+def test_profile_round_trip_equals_validated_profile():
+    profile = _profile()
+    value = entity_codec.encode(profile, {"production": False}, RecordMetadata(id="1", index="index"))
+
+    assert entity_codec.is_encoded(value)
+
+    result, metadata = entity_codec.decode(Profile, value)
+
+    assert result == _legacy(profile)
+    assert result.model_fields_set == _legacy(profile).model_fields_set
+    assert metadata == {"id": "1", "index": "index"}
+    assert isinstance(result.consents["marketing"], ConsentRevoke)
+    assert result.data.pii.birthday == datetime(2000, 1, 1)
+    assert result.data.devices.last.geo.location == (2.0, 1.0)
+
+
+def test_session_round_trip_equals_validated_session():
+    session = Session(id="1", profile={"id": "2"},
+                      metadata=SessionMetadata(time=SessionTime(insert=datetime(2024, 1, 1))))
+    session.context = SessionContext({"a": 1})
+
+    result, _ = entity_codec.decode(Session, entity_codec.encode(session, {}, RecordMetadata(id="1", index="i")))
+
+    assert result == _legacy(session)
+    assert isinstance(result.context, SessionContext)
+    assert result.metadata.time.insert == _legacy(session).metadata.time.insert
+
+
+def test_changed_schema_is_validated():
+    profile = _profile()
+    value = entity_codec.encode(profile, {}, RecordMetadata(id="1", index="index"))
+    _, context, data, metadata = msgpack.unpackb(value[4:], ext_hook=entity_codec._ext_hook)
+    value = value[:4] + msgpack.packb((0, context, data, metadata), default=entity_codec._default)
+
+    result, _ = entity_codec.decode(Profile, value)
+
+    assert result == _legacy(profile)
+
+
+def test_unknown_format_version_is_not_read():
+    value = entity_codec.encode(_profile(), {}, RecordMetadata(id="1", index="index"))
+    assert entity_codec.decode(Profile, b'TC' + bytes([1]) + value[3:]) is None
+
+
+def test_legacy_cache_format_is_read():
+    profile = _profile()
+    value = ({}, profile.model_dump(mode="json", exclude_defaults=True), None, {"id": "1", "index": "index"})
+
+    result = profile_from_cache(value)
+
+    assert result == _legacy(profile)
+    assert result.get_meta_data().index == "index"
+
+
+def test_values_without_msgpack_type_are_cached_as_json():
+    profile = Profile(id="1", traits={"uuid": uuid4(), "decimal": Decimal("1.50"), "time": time(10, 30)})
+    value = entity_codec.encode(profile, {"production": False}, RecordMetadata(id="1", index="index"))
+
+    result, _ = entity_codec.decode(Profile, value)
+
+    assert result.traits == profile.model_dump(mode="json")["traits"]
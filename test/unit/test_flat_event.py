@@ -0,0 +1,57 @@
+from tracardi.domain.event import Event, FlatEvent
+from tracardi.domain.profile import FlatProfile
+from tracardi.service.tracking.event_data_computation import _remove_empty_event_dicts
+
+
+def _event(properties=None):
+    return Event(id="1", type="page-view", metadata={"time": {"insert": "2023-06-18 21:40:35"}},
+                 source={"id": "1"}, properties=properties or {})
+
+
+def test_flat_event_reads_and_writes_event():
+    event = _event({"page": {"url": "http://localhost"}, "list": [{"a": 1}]})
+    flat_event = FlatEvent(event)
+
+    assert flat_event['type'] == "page-view"
+    assert flat_event['properties.page.url'] == "http://localhost"
+    assert flat_event['properties.list.0.a'] == 1
+    assert 'properties.page' in flat_event
+    assert 'properties.page.title' not in flat_event
+    assert 'properties.list.1' not in flat_event
+    assert flat_event.get('session.id') is None
+    assert flat_event.get('properties.missing', 1) == 1
+
+    flat_event['data.pii.firstname'] = "John"
+    flat_event['journey.state'] = "awareness"
+    flat_event['tags.values'] = ("tag",)
+
+    assert event.data == {"pii": {"firstname": "John"}}
+    assert event.journey.state == "awareness"
+    assert event.tags.values == ("tag",)
+
+
+def test_flat_event_does_not_add_event_fields():
+    flat_event = FlatEvent(_event())
+    try:
+        flat_event['unknown.field'] = 1
+        assert False
+    except KeyError:
+        assert 'unknown' not in flat_event.event.__dict__
+
+
+def test_empty_dicts_are_removed_without_changing_payload_data():
+    properties = {"a": {"b": {}}, "c": 1}
+    event = _event(properties)
+    event.__dict__['properties'] = properties
+
+    _remove_empty_event_dicts(event)
+
+    assert event.properties == {"c": 1}
+    assert properties == {"a": {"b": {}}, "c": 1}
+
+
+def test_flat_profile_is_marked_changed():
+    flat_profile = FlatProfile({"id": "1", "traits": {}})
+    assert flat_profile.changed is False
+    flat_profile['traits.a'] = 1
+    assert flat_profile.changed is True
@@ -1,6 +1,7 @@
 import asyncio
 
-from tracardi.service.decorators.function_memory_cache import cache_for, cache, async_cache_for, delete_cache
+from tracardi.service.decorators.function_memory_cache import cache_for, cache, async_cache_for, delete_cache, \
+    cache_invalidation, cache_stats
 import time
 
 
@@ -63,4 +64,73 @@ def test_delete():
 
     delete_cache(x, 1)
 
-    assert len(cache['unit.test_function_memory_cache:x'].memory_buffer) == 0
\ No newline at end of file
+    assert len(cache['unit.test_function_memory_cache:x'].memory_buffer) == 0
+
+calls = []
+
+
+@async_cache_for(0.2, stale_ttl=1, invalidated_by=['test_table'])
+async def z(a):
+    calls.append(a)
+    await asyncio.sleep(0.05)
+    return len(calls)
+
+
+def test_async_single_flight_and_stale_while_revalidate():
+    async def main():
+        calls.clear()
+        assert await asyncio.gather(*[z(1) for _ in range(10)]) == [1] * 10
+        assert calls == [1]
+
+        await asyncio.sleep(0.3)
+
+        # Stale value is returned and refreshed in the background once
+        assert await asyncio.gather(*[z(1) for _ in range(10)]) == [1] * 10
+        await asyncio.sleep(0.1)
+        assert calls == [1, 1]
+        assert await z(1) == 2
+
+    asyncio.run(main())
+
+
+def test_async_cache_invalidation():
+    async def main():
+        calls.clear()
+        assert await z(2) == 1
+
+        cache_invalidation.clear('other_table')
+        assert await z(2) == 1
+
+        cache_invalidation.clear('test_table')
+        assert await z(2) == 2
+
+        # Value loaded before the change is not cached
+        load = asyncio.create_task(z(3))
+        await asyncio.sleep(0.01)
+        cache_invalidation.clear('test_table')
+        assert await load == 3
+        assert await z(3) == 4
+
+    asyncio.run(main())
+
+
+@async_cache_for(0.2)
+async def counted(a):
+    return a
+
+
+def test_async_cache_counts_hits_and_misses():
+    async def main():
+        for _ in range(5):
+            assert await counted(1) == 1
+
+        stats = cache_stats()['unit.test_function_memory_cache:counted']
+        assert (stats['size'], stats['hits'], stats['misses']) == (1, 4, 1)
+
+        # Expired value is a miss
+        await asyncio.sleep(0.3)
+        assert await counted(1) == 1
+        stats = cache_stats()['unit.test_function_memory_cache:counted']
+        assert (stats['hits'], stats['misses'], stats['expirations']) == (4, 2, 1)
+
+    asyncio.run(main())
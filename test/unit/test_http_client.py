@@ -0,0 +1,71 @@
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from tracardi.service.tracardi_http_client import HttpClient, http_client_pool
+
+
+async def _handler(request: web.Request):
+    response = web.json_response({
+        "auth": request.headers.get('Authorization'),
+        "type": request.headers.get('X-Type'),
+        "cookie": request.cookies.get('session')
+    })
+    response.set_cookie('session', '1')
+    return response
+
+
+def _host_stats(host) -> dict:
+    return http_client_pool.stats()['hosts'].get(host, {"requests": 0, "new_connections": 0, "reused_connections": 0})
+
+
+async def _error_handler(request: web.Request):
+    return web.Response(status=500)
+
+
+@pytest.mark.asyncio
+async def test_http_client_reuses_pooled_connections():
+    app = web.Application()
+    app.router.add_get('/', _handler)
+
+    async with TestServer(app) as server:
+        await http_client_pool.close()
+        url = str(server.make_url('/'))
+        before = _host_stats(server.host)
+
+        for _ in range(3):
+            async with HttpClient(headers={"Authorization": "Bearer 1"}) as client:
+                async with client.get(url, headers={"x-type": "a"}) as response:
+                    assert response.status == 200
+                    result = await response.json()
+
+            assert result == {"auth": "Bearer 1", "type": "a", "cookie": None}
+
+        stats = http_client_pool.stats()
+        host = stats['hosts'][server.host]
+        assert host['new_connections'] - before['new_connections'] == 1
+        assert host['reused_connections'] - before['reused_connections'] == 2
+        assert stats['pool']['idle'] == 1
+
+        await http_client_pool.close()
+
+
+@pytest.mark.asyncio
+async def test_http_client_releases_not_accepted_responses_before_retry():
+    app = web.Application()
+    app.router.add_get('/', _error_handler)
+
+    async with TestServer(app) as server:
+        await http_client_pool.close()
+        before = _host_stats(server.host)
+
+        async with HttpClient(retries=3) as client:
+            async with client.get(str(server.make_url('/'))) as response:
+                assert response.status == 500
+
+        stats = http_client_pool.stats()
+        assert stats['hosts'][server.host]['requests'] - before['requests'] == 3
+        assert stats['hosts'][server.host]['new_connections'] - before['new_connections'] == 1
+        assert stats['pool']['acquired'] == 0
+
+        await http_client_pool.close()
@@ -33,3 +33,19 @@ def test_if_condition_for_spaces():
         assert result is False
 
     asyncio.run(main())
+
+
+def test_if_condition_reuses_parsed_tree():
+    async def main():
+        condition = Condition()
+        condition.clear_cache()
+
+        result = await condition.evaluate("payload@A.a==1", DotAccessor(payload={"A": {"a": 1}}))
+        assert result is True
+        result = await condition.evaluate("payload@A.a==1", DotAccessor(payload={"A": {"a": 2}}))
+        assert result is False
+
+        info = condition.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+    asyncio.run(main())
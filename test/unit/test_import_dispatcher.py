@@ -0,0 +1,184 @@
+import asyncio
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from tracardi.domain.event_source import EventSource
+from tracardi.domain.named_entity import NamedEntity
+from tracardi.worker.domain.import_batch import ImportBatch
+from tracardi.worker.service import import_dispatcher
+from tracardi.worker.service.import_dispatcher import ImportDispatcher
+
+
+class Importer:
+
+    def __init__(self, records: int, batch: int):
+        self.records = records
+        self.batch = batch
+        self.checkpoint = None
+
+    def batches(self, credentials, checkpoint=None):
+        self.checkpoint = checkpoint
+        start = checkpoint['records'] if checkpoint else 0
+        for batch_number, position in enumerate(range(start, self.records, self.batch), start=1):
+            records = [{"id": n} for n in range(position, min(position + self.batch, self.records))]
+            done = position + len(records)
+            yield ImportBatch(records, done / self.records * 100, batch_number,
+                              {"position": done, "records": done, "batch": batch_number})
+
+
+@pytest.fixture
+def checkpoints(monkeypatch):
+    saved = {}
+
+    async def checkpoint_load(key):
+        return saved.get(key, None)
+
+    async def checkpoint_save(key, checkpoint):
+        saved[key] = checkpoint
+
+    async def checkpoint_delete(key):
+        saved.pop(key, None)
+
+    monkeypatch.setattr(import_dispatcher, "checkpoint_load", checkpoint_load)
+    monkeypatch.setattr(import_dispatcher, "checkpoint_save", checkpoint_save)
+    monkeypatch.setattr(import_dispatcher, "checkpoint_delete", checkpoint_delete)
+    return saved
+
+
+@pytest.fixture
+def event_source(monkeypatch):
+    source = EventSource(id="source", type=["rest"], name="Import",
+                         bridge=NamedEntity(id="778ded05-4ff3-4e08-9a86-72c0195fa95d", name="REST API Bridge"))
+
+    async def load_event_source(source_id):
+        return source if source_id == source.id else None
+
+    monkeypatch.setattr(import_dispatcher, "load_event_source", load_event_source)
+    return source
+
+
+def _tracker(payloads: list, fail_after: int = None, delay=None):
+    async def track(request: web.Request):
+        payload = await request.json()
+        record = payload['events'][0]['properties'] if 'events' in payload else payload
+        if delay is not None:
+            await delay(record)
+        if fail_after is not None and record['id'] >= fail_after:
+            return web.Response(status=500)
+        payloads.append(payload if 'events' in payload else {"path": request.path, "record": payload})
+        return web.json_response({})
+
+    app = web.Application()
+    app.router.add_post('/track', track)
+    app.router.add_post('/collect/{event_type}/{source_id}', track)
+    return TestServer(app)
+
+
+@pytest.mark.asyncio
+async def test_records_are_sent_as_batched_tracker_payloads(checkpoints, event_source):
+    payloads = []
+    async with _tracker(payloads) as server:
+        dispatcher = ImportDispatcher(None, Importer(records=25, batch=10), event_source_id="source",
+                                      event_type="imported", checkpoint_key="import", events_per_request=4,
+                                      concurrency=2)
+        progress = [item async for item in dispatcher.run(str(server.make_url('/')))]
+
+    assert progress == [(40.0, 1), (80.0, 2), (100.0, 3)]
+    assert len(payloads) == 8  # 4 + 4 + 2 per batch of 10
+    assert sorted(event['properties']['id'] for payload in payloads for event in payload['events']) == list(range(25))
+    assert all(payload['source'] == {"id": "source"} and payload['profile_less'] for payload in payloads)
+    assert {event['type'] for payload in payloads for event in payload['events']} == {"imported"}
+    assert checkpoints == {}
+
+
+@pytest.mark.asyncio
+async def test_failed_import_resumes_from_checkpoint(checkpoints, event_source):
+    payloads = []
+    async with _tracker(payloads, fail_after=20) as server:
+        dispatcher = ImportDispatcher(None, Importer(records=25, batch=10), event_source_id="source",
+                                      event_type="imported", checkpoint_key="import", events_per_request=10)
+        with pytest.raises(ValueError):
+            async for _ in dispatcher.run(str(server.make_url('/'))):
+                pass
+
+    assert checkpoints == {"import": {"position": 20, "records": 20, "batch": 2}}
+
+    payloads.clear()
+    importer = Importer(records=25, batch=10)
+    async with _tracker(payloads) as server:
+        dispatcher = ImportDispatcher(None, importer, event_source_id="source", event_type="imported",
+                                      checkpoint_key="import", events_per_request=10)
+        progress = [item async for item in dispatcher.run(str(server.make_url('/')))]
+
+    assert importer.checkpoint == {"position": 20, "records": 20, "batch": 2}
+    assert progress == [(100.0, 1)]
+    assert [event['properties']['id'] for event in payloads[0]['events']] == [20, 21, 22, 23, 24]
+    assert checkpoints == {}
+
+
+@pytest.mark.asyncio
+async def test_requests_are_in_flight_across_batches_and_checkpoints_are_saved_in_order(checkpoints, event_source,
+                                                                                      monkeypatch):
+    saved = []
+    checkpoint_save = import_dispatcher.checkpoint_save
+
+    async def _checkpoint_save(key, checkpoint):
+        saved.append(checkpoint['batch'])
+        await checkpoint_save(key, checkpoint)
+
+    monkeypatch.setattr(import_dispatcher, "checkpoint_save", _checkpoint_save)
+
+    in_flight = []
+    max_in_flight = 0
+
+    async def delay(record):
+        nonlocal max_in_flight
+        in_flight.append(record['id'])
+        max_in_flight = max(max_in_flight, len(in_flight))
+        # First request is the slowest, so later batches are sent before the first one.
+        await asyncio.sleep(0.2 if record['id'] == 0 else 0.02)
+        in_flight.remove(record['id'])
+
+    payloads = []
+    async with _tracker(payloads, delay=delay) as server:
+        dispatcher = ImportDispatcher(None, Importer(records=12, batch=2), event_source_id="source",
+                                      event_type="imported", checkpoint_key="import", events_per_request=1,
+                                      concurrency=4)
+        progress = [item async for item in dispatcher.run(str(server.make_url('/')))]
+
+    assert max_in_flight == 4  # 2 requests per batch
+    assert [batch for _, batch in progress] == [1, 2, 3, 4, 5, 6]
+    assert saved == [1, 2, 3, 4, 5, 6]
+    assert len(payloads) == 12
+    assert checkpoints == {}
+
+
+@pytest.mark.asyncio
+async def test_records_are_sent_one_per_request_to_webhook_source(checkpoints, event_source):
+    event_source.type = ["webhook"]
+    payloads = []
+    async with _tracker(payloads) as server:
+        dispatcher = ImportDispatcher(None, Importer(records=5, batch=2), event_source_id="source",
+                                      event_type="imported", checkpoint_key="import", events_per_request=4)
+        progress = [item async for item in dispatcher.run(str(server.make_url('/')))]
+
+    assert progress == [(40.0, 1), (80.0, 2), (100.0, 3)]
+    assert sorted(payload['record']['id'] for payload in payloads) == list(range(5))
+    assert {payload['path'] for payload in payloads} == {"/collect/imported/source"}
+
+
+@pytest.mark.asyncio
+async def test_import_to_not_supported_source_is_rejected(checkpoints, event_source):
+    event_source.type = ["internal"]
+    importer = Importer(records=5, batch=2)
+    importer.checkpoint = "not started"
+    dispatcher = ImportDispatcher(None, importer, event_source_id="source", event_type="imported",
+                                  checkpoint_key="import")
+    with pytest.raises(ValueError):
+        async for _ in dispatcher.run("http://localhost:8686"):
+            pass
+
+    assert importer.checkpoint == "not started"
+    assert checkpoints == {}
@@ -0,0 +1,87 @@
+import asyncio
+import logging
+
+import pytest
+
+from tracardi.context import ServerContext, Context, get_context
+from tracardi.exceptions.log_handler import ElasticLogHandler, _get_sample_rates
+from tracardi.service import logger_manager
+from tracardi.service.logger_manager import LogFlusher
+
+
+def _logger(handler: ElasticLogHandler, name: str) -> logging.Logger:
+    logger = logging.Logger(name)
+    logger.propagate = False
+    logger.addHandler(handler)
+    return logger
+
+
+def test_buffer_is_bounded_and_repeats_are_counted():
+    handler = ElasticLogHandler(buffer_size=3)
+    logger = _logger(handler, "test-buffer")
+
+    for _ in range(5):
+        logger.warning("repeated")
+    for i in range(4):
+        logger.warning(f"log {i}")
+
+    assert handler.stats() == {"buffered": 3, "buffer_size": 3, "dropped": 2, "sampled_out": 0,
+                               "deduplicated": 4}
+    assert [log['message'] for _, log in handler.drain()] == ["log 1", "log 2", "log 3"]
+
+    for _ in range(2):
+        logger.warning("repeated")
+    assert [log['message'] for log in handler.collection] == ["repeated [Repeated 1 times]"]
+    assert '_repeat_key' not in handler.collection[0]
+    assert handler.has_logs()
+
+    logs = handler.drain()
+    assert [log['message'] for _, log in logs] == ["repeated [Repeated 1 times]"]
+    assert '_repeat_key' not in logs[0][1]
+    assert not handler.has_logs()
+
+
+def test_levels_are_sampled():
+    assert _get_sample_rates("debug:0, info:50,bad,warning:x") == {"DEBUG": 0, "INFO": 0.5}
+
+    handler = ElasticLogHandler(sample_rates={"INFO": 0})
+    logger = _logger(handler, "test-sampling")
+    logger.info("info")
+    logger.error("error")
+
+    assert [log['level'] for _, log in handler.drain()] == ["ERROR"]
+    assert handler.sampled_out == 1
+
+
+@pytest.mark.asyncio
+async def test_logs_are_saved_in_background_per_context(monkeypatch):
+    saved = []
+
+    async def has_logs_index(context):
+        return True
+
+    async def save(logs):
+        saved.append((get_context().production, [log['message'] for log in logs]))
+
+    monkeypatch.setattr(logger_manager.installation_status, "has_logs_index", has_logs_index)
+    monkeypatch.setattr(logger_manager.log_db, "save", save)
+    monkeypatch.setattr(logger_manager.License, "has_license", staticmethod(lambda: False))
+
+    handler = ElasticLogHandler()
+    flusher = LogFlusher(handler, flush_size=2, flush_interval=60)
+    logger = _logger(handler, "test-flusher")
+
+    flusher.start()
+    with ServerContext(Context(production=True)):
+        logger.warning("production")
+    with ServerContext(Context(production=False)):
+        logger.warning("staging")
+
+    # Flush size reached
+    for _ in range(10):
+        await asyncio.sleep(0)
+    flusher._worker.cancel()
+
+    assert sorted(saved) == [(False, ["staging"]), (True, ["production"])]
+    assert flusher.stats()['saved'] == 2
+    assert flusher.stats()['flushes'] == 1
@@ -92,3 +92,29 @@ def test_must_work_per_context():
         assert 'test' in cache
     with ServerContext(Context(production=False)):
         assert 'test' not in cache
+
+
+def test_should_evict_least_recently_used():
+    cache = MemoryCache("test", max_pool=2)
+    cache['test1'] = CacheItem(data='xxx', ttl=5)
+    cache['test2'] = CacheItem(data='yyy', ttl=5)
+    assert cache['test1'].data == 'xxx'
+    cache['test3'] = CacheItem(data='zzz', ttl=5)
+
+    assert len(cache) == 2
+    assert 'test2' not in cache
+    assert 'test1' in cache
+    assert 'test3' in cache
+    assert cache.stats() == {"size": 2, "max_size": 2, "hits": 3, "misses": 1, "evictions": 1, "expirations": 0}
+
+
+def test_should_drop_expired_items_on_insert():
+    cache = MemoryCache("test", max_pool=100)
+    cache['test1'] = CacheItem(data='xxx', ttl=0.2)
+    cache['test2'] = CacheItem(data='yyy', ttl=0.2)
+    cache['test2'] = CacheItem(data='yyy', ttl=5)
+    sleep(0.5)
+    cache['test3'] = CacheItem(data='zzz', ttl=5)
+
+    assert list(cache.memory_buffer) == ['test2', 'test3']
+    assert cache.expirations == 1
@@ -1,7 +1,7 @@
 from datetime import datetime, timedelta
 
 from tracardi.domain.profile import ConsentRevoke
-from tracardi.service.merging.merger import (merge as dict_merge, list_merge, get_conflicted_values,
+from tracardi.service.merging.merger import (merge as dict_merge, list_merge, get_conflicted_values, merge_with_conflicts,
                                              get_added_values, get_changed_values, MergingStrategy)
 
 
@@ -268,3 +268,19 @@ def test_override_strings():
                                         no_single_value_list=True,
                                         default_string_strategy="override"))
     assert result == {"d": "a"}
+
+
+def test_merge_with_conflicts():
+    dicts = [
+        {"a": "x", "n": 1, "d": {"q": 1, "w": "s"}, "same": "s", "e": None},
+        {"a": "y", "n": 2, "d": {"q": 1, "w": "t"}, "same": "s", "e": "e"}
+    ]
+    strategy = MergingStrategy(default_string_strategy='append')
+
+    result, conflicts = merge_with_conflicts(dicts, strategy)
+
+    assert result == dict_merge({}, dicts, strategy)
+    assert set(conflicts) == {"a", "n", "d"}
+    assert set(conflicts['a']) == {"x", "y"}
+    assert conflicts['n'] == 3
+    assert set(conflicts['d']['w']) == {"s", "t"}
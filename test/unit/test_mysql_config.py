@@ -31,4 +31,13 @@ def test_initializes_without_creds():
     assert config.mysql_port == 3306
     assert config.mysql_database == "tracardi"
     assert config.mysql_echo == False
-    assert config.mysql_database_uri == "mysql+aiomysql://localhost:3306"
\ No newline at end of file
+    assert config.mysql_database_uri == "mysql+aiomysql://localhost:3306"
+
+def test_initializes_pool_with_default_values():
+    config = MysqlConfig({})
+
+    assert config.mysql_pool_size == 10
+    assert config.mysql_max_overflow == 10
+    assert config.mysql_pool_timeout == 10
+    assert config.mysql_pool_recycle == 1800
+    assert config.mysql_query_cache_size == 1000
@@ -0,0 +1,22 @@
+from tracardi.config import mysql
+from tracardi.service.storage.mysql.engine import AsyncMySqlEngine, PoolWaitStats
+
+
+def test_engine_uses_configured_pool_and_one_session_factory():
+    client = AsyncMySqlEngine()
+    engine = client.get_engine_for_database()
+
+    assert engine is client.get_engine_for_database()
+    assert engine.pool.size() == mysql.mysql_pool_size
+    assert client.get_session(engine) is client.get_session(engine)
+    assert set(client.stats()) == {"pool", "wait", "compiled_statements"}
+
+
+def test_pool_wait_stats():
+    stats = PoolWaitStats()
+    assert stats.report() == {"checkouts": 0, "avg_wait_ms": 0, "max_wait_ms": 0}
+
+    stats.add(0.001)
+    stats.add(0.003)
+
+    assert stats.report() == {"checkouts": 2, "avg_wait_ms": 2.0, "max_wait_ms": 3.0}
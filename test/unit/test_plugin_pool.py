@@ -0,0 +1,148 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from tracardi.context import ServerContext, Context
+from tracardi.domain.flow import Flow
+from tracardi.service.plugin.runner import ActionRunner
+from tracardi.service.wf.domain.node import Node
+from tracardi.service.wf.service.life_cycle import plugin as life_cycle
+from tracardi.service.wf.service.plugin_pool import PluginPool, plugin_pool, set_up_timer
+
+
+class PooledAction(ActionRunner):
+    pooled = True
+    set_ups = 0
+    closed = 0
+
+    async def set_up(self, init):
+        type(self).set_ups += 1
+        await asyncio.sleep(0.001)
+
+    async def run(self, payload: dict, in_edge=None):
+        return None
+
+    async def close(self):
+        type(self).closed += 1
+
+
+class Action(PooledAction):
+    pooled = False
+
+
+def _node(class_name):
+    return Node(id="node-1", name="node", className=class_name, module=__name__)
+
+
+async def _run(node, flow):
+    node.object = await life_cycle.create_instance(node, flow)
+    node.object.flow = flow
+    await life_cycle.execute(node, {"payload": {}})
+    instance = node.object
+    await life_cycle.release_instance(node)
+    return instance
+
+
+@pytest.mark.asyncio
+async def test_pooled_plugin_is_reused_within_flow_version():
+    with ServerContext(Context(production=False, tenant="test")):
+        await plugin_pool.clear()
+        set_up_timer.clear()
+        PooledAction.set_ups = 0
+        PooledAction.closed = 0
+
+        flow = Flow.new(id="flow-1")
+        node = _node("PooledAction")
+
+        first = await _run(node, flow)
+        second = await _run(node, flow)
+
+        assert first is second
+        assert first.flow is None
+        assert PooledAction.set_ups == 1
+        assert PooledAction.closed == 0
+
+        # New flow version gets new instance
+        new_version = Flow.new(id="flow-1")
+        new_version.timestamp = datetime(2000, 1, 1)
+        third = await _run(node, new_version)
+        assert third is not first
+        assert PooledAction.set_ups == 2
+
+        report = set_up_timer.report()
+        assert report[0]['flow_id'] == "flow-1"
+        assert report[0]['calls'] == 2
+        assert report[0]['skipped'] == 1
+
+        await plugin_pool.clear()
+        assert PooledAction.closed == 2
+
+
+@pytest.mark.asyncio
+async def test_not_pooled_plugin_is_closed_after_run():
+    with ServerContext(Context(production=False, tenant="test")):
+        await plugin_pool.clear()
+        Action.set_ups = 0
+        Action.closed = 0
+
+        flow = Flow.new(id="flow-1")
+        node = _node("Action")
+
+        first = await _run(node, flow)
+        second = await _run(node, flow)
+
+        assert first is not second
+        assert Action.set_ups == 2
+        assert Action.closed == 2
+        assert len(plugin_pool) == 0
+
+
+@pytest.mark.asyncio
+async def test_pool_evicts_and_closes_instances():
+    with ServerContext(Context(production=False, tenant="test")):
+        PooledAction.closed = 0
+        pool = PluginPool(ttl=60, max_idle=1, max_nodes=1)
+        flow = Flow.new(id="flow-1")
+        node = _node("PooledAction")
+
+        for _ in range(2):
+            instance = PooledAction()
+            instance.flow = flow
+            await pool.release(node, instance)
+
+        assert len(pool) == 1
+        assert PooledAction.closed == 1
+
+        instance = PooledAction()
+        instance.flow = Flow.new(id="flow-2")
+        await pool.release(node, instance)
+
+        assert len(pool) == 1
+        assert PooledAction.closed == 2
+        assert await pool.acquire(flow, node) is None
+
+
+
+@pytest.mark.asyncio
+async def test_sweep_closes_expired_instances_of_all_nodes():
+    with ServerContext(Context(production=False, tenant="test")):
+        PooledAction.closed = 0
+        pool = PluginPool(ttl=60, max_idle=8, max_nodes=100)
+        node = _node("PooledAction")
+
+        flows = [Flow.new(id=flow_id) for flow_id in ["flow-1", "flow-2", "flow-3"]]
+        for flow in flows:
+            instance = PooledAction()
+            instance.flow = flow
+            await pool.release(node, instance)
+
+        # Instances of flow versions that are not run any more
+        for key in list(pool._idle)[:2]:
+            pool._idle[key] = [(created - 120, instance) for created, instance in pool._idle[key]]
+
+        await pool.sweep()
+
+        assert len(pool) == 1
+        assert PooledAction.closed == 2
+        assert await pool.acquire(flows[2], node) is not None
@@ -1,6 +1,7 @@
 import asyncio
 
 from tracardi.domain.profile import Profile
+from tracardi.domain.storage_record import RecordMetadata
 from tracardi.service.profile_merger import ProfileMerger
 
 
@@ -76,3 +77,36 @@ def test_new_data_override_merging():
         assert set(merged_profile.data.devices.push) == {'a', 'b', 'c'}
 
     asyncio.run(main())
+
+
+def test_merge_reassigns_and_deletes_duplicates_and_waits_for_profile_refresh(monkeypatch):
+    from tracardi.service import profile_merger
+
+    calls = []
+
+    async def save_profile(profile, refresh=False):
+        calls.append(("save", refresh))
+
+    async def reassign(old_profiles, merged_id):
+        calls.append(("reassign", sorted((profile_id, metadata.index) for profile_id, metadata in old_profiles)))
+
+    async def refresh(index):
+        calls.append(("refresh", index))
+
+    monkeypatch.setattr(profile_merger, "save_profile", save_profile)
+    monkeypatch.setattr(profile_merger.reassignment_engine, "reassign", reassign)
+    monkeypatch.setattr(profile_merger.refresh_coordinator, "refresh", refresh)
+
+    async def main():
+        profile = Profile(id="1")
+        merger = ProfileMerger(profile)
+        duplicates = [Profile(id="2", traits={"a": 1}), Profile(id="3", traits={"b": 1})]
+        for duplicate in duplicates:
+            duplicate.set_meta_data(RecordMetadata(id=duplicate.id, index="profile-index"))
+        return await merger.compute_one_profile(duplicates)
+
+    merged_profile = asyncio.run(main())
+
+    assert merged_profile is not None
+    assert calls[0] == ("save", True)
+    assert calls[1:] == [("reassign", [("2", "profile-index"), ("3", "profile-index")]), ("refresh", "profile")]
@@ -0,0 +1,140 @@
+import pytest
+
+from tracardi.context import ServerContext, Context, get_context
+from tracardi.domain.storage_record import RecordMetadata
+from tracardi.service.merging import reassignment_engine as engine_module
+from tracardi.service.merging.reassignment_engine import ProfileReassignmentEngine, coalesce
+
+
+def test_coalesce_follows_later_merges():
+    assert coalesce([{"a": "b"}, {"b": "c"}]) == {"a": "c", "b": "c"}
+    assert coalesce([{"a": "b", "x": "b"}, {"b": "c"}, {"d": "c"}]) == {"a": "c", "x": "c", "b": "c", "d": "c"}
+    assert coalesce([{"b": "a"}, {"a": "b"}]) == {"a": "b"}
+    assert coalesce([{"a": "a"}]) == {}
+
+
+@pytest.fixture
+def updates(monkeypatch):
+    calls = []
+
+    async def update_many_profile_ids(index, profile_ids):
+        calls.append((index, profile_ids, get_context().production))
+
+    async def refresh(index):
+        calls.append("refresh")
+
+    async def delete_profile(profile_id, index):
+        calls.append(("delete", profile_id, index))
+
+    monkeypatch.setattr(engine_module.raw_db, "update_many_profile_ids", update_many_profile_ids)
+    monkeypatch.setattr(engine_module.refresh_coordinator, "refresh", refresh)
+    monkeypatch.setattr(engine_module, "delete_profile", delete_profile)
+    return calls
+
+
+def _profiles(*profile_ids):
+    return [(profile_id, RecordMetadata(id=profile_id, index=f"profile-{profile_id}")) for profile_id in profile_ids]
+
+
+@pytest.mark.asyncio
+async def test_inline_reassignment_updates_each_index_once_per_batch(updates):
+    engine = ProfileReassignmentEngine(background=False, batch_size=2, batch_wait=0.01, buffer_size=10)
+    with ServerContext(Context(production=False, tenant="test")):
+        await engine.reassign(_profiles("1", "2", "3", "m"), "m")
+
+    assert updates == [
+        ("event", {"1": "m", "2": "m"}, False),
+        ("event", {"3": "m"}, False),
+        ("session", {"1": "m", "2": "m"}, False),
+        ("session", {"3": "m"}, False),
+        "refresh",
+        "refresh",
+        ("delete", "1", "profile-1"),
+        ("delete", "2", "profile-2"),
+        ("delete", "3", "profile-3"),
+        "refresh"
+    ]
+    assert engine.stats()["reassigned_profiles"] == 3
+
+
+@pytest.mark.asyncio
+async def test_background_merges_are_coalesced_per_context(updates):
+    engine = ProfileReassignmentEngine(background=True, batch_size=100, batch_wait=0.01, buffer_size=10)
+    with ServerContext(Context(production=False, tenant="test")):
+        await engine.reassign(_profiles("1", "2"), "3")
+        await engine.reassign(_profiles("3"), "4")
+    with ServerContext(Context(production=True, tenant="test")):
+        await engine.reassign(_profiles("5"), "6")
+
+    assert updates == []
+
+    await engine.flush()
+
+    assert ("event", {"1": "4", "2": "4", "3": "4"}, False) in updates
+    assert ("session", {"5": "6"}, True) in updates
+    assert updates.count("refresh") == 6
+    assert {update for update in updates if update[0] == "delete"} == {
+        ("delete", "1", "profile-1"), ("delete", "2", "profile-2"), ("delete", "3", "profile-3"),
+        ("delete", "5", "profile-5")
+    }
+    assert engine.stats() == {"jobs": 2, "failed_jobs": 0, "retried_jobs": 0, "reassigned_profiles": 4,
+                              "running": None, "queued_merges": 0}
+
+
+@pytest.mark.asyncio
+async def test_failed_background_job_is_retried(updates, monkeypatch):
+    failures = {"left": 2}
+
+    async def update_many_profile_ids(index, profile_ids):
+        if failures["left"]:
+            failures["left"] -= 1
+            raise ConnectionError("Elastic is not available")
+        updates.append((index, profile_ids, get_context().production))
+
+    monkeypatch.setattr(engine_module.raw_db, "update_many_profile_ids", update_many_profile_ids)
+
+    engine = ProfileReassignmentEngine(background=True, batch_size=100, batch_wait=0.01, buffer_size=10,
+                                       retries=2, retry_wait=0.001)
+    with ServerContext(Context(production=False, tenant="test")):
+        await engine.reassign(_profiles("1"), "2")
+
+    await engine.flush()
+
+    assert ("event", {"1": "2"}, False) in updates
+    assert ("session", {"1": "2"}, False) in updates
+    assert engine.stats()["retried_jobs"] == 2
+    assert engine.stats()["failed_jobs"] == 0
+    assert engine.stats()["reassigned_profiles"] == 1
+
+
+@pytest.mark.asyncio
+async def test_shutdown_flushes_queued_merges(updates, monkeypatch):
+    from tracardi.service import shutdown as shutdown_module
+
+    engine = ProfileReassignmentEngine(background=True, batch_size=100, batch_wait=0.01, buffer_size=10)
+    monkeypatch.setattr(shutdown_module, "reassignment_engine", engine)
+    with ServerContext(Context(production=False, tenant="test")):
+        await engine.reassign(_profiles("1"), "2")
+
+    await shutdown_module.shutdown()
+
+    assert engine.stats()["reassigned_profiles"] == 1
+
+
+@pytest.mark.asyncio
+async def test_profiles_are_not_deleted_when_reassignment_fails(updates, monkeypatch):
+    async def update_many_profile_ids(index, profile_ids):
+        raise ConnectionError("Elastic is not available")
+
+    monkeypatch.setattr(engine_module.raw_db, "update_many_profile_ids", update_many_profile_ids)
+
+    engine = ProfileReassignmentEngine(background=True, batch_size=100, batch_wait=0.01, buffer_size=10,
+                                       retries=1, retry_wait=0.001)
+    with ServerContext(Context(production=False, tenant="test")):
+        await engine.reassign(_profiles("1"), "2")
+
+    await engine.flush()
+
+    assert updates == []
+    assert engine.stats()["failed_jobs"] == 1
+    assert engine.stats()["reassigned_profiles"] == 0
@@ -0,0 +1,83 @@
+import pytest
+
+from tracardi.context import ServerContext, Context
+from tracardi.domain.profile import Profile
+from tracardi.domain.session import Session
+from tracardi.domain.storage_record import RecordMetadata
+from tracardi.service.tracking.cache import profile_cache, session_cache
+from tracardi.service.tracking.cache.profile_cache import save_profile_cache, load_profile_caches
+from tracardi.service.tracking.cache.profile_session_cache import load_profile_and_session_cache
+from tracardi.service.tracking.cache.session_cache import save_session_cache
+
+
+class RedisRecorder:
+
+    def __init__(self):
+        self.data = {}
+        self.calls = []
+
+    async def mget(self, names):
+        self.calls.append('mget')
+        return [self.data.get(name) for name in names]
+
+    async def set_many(self, mapping, ex=None):
+        self.calls.append('set_many')
+        self.data.update(mapping)
+
+    async def delete_many(self, names):
+        self.calls.append('delete_many')
+        for name in names:
+            self.data.pop(name, None)
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    redis = RedisRecorder()
+    monkeypatch.setattr(profile_cache.redis_cache, '_redis', redis)
+    monkeypatch.setattr(session_cache.redis_cache, '_redis', redis)
+    return redis
+
+
+def _profile(id):
+    profile = Profile(id=id, traits={"a": 1})
+    profile.set_meta_data(RecordMetadata(id=id, index="profile-index"))
+    return profile
+
+
+@pytest.mark.asyncio
+async def test_profile_and_session_are_loaded_in_one_round_trip(redis):
+    context = Context(production=False, tenant="test")
+    with ServerContext(context):
+        session = Session.new(id="s1")
+        session.set_meta_data(RecordMetadata(id="s1", index="session-index"))
+        await save_profile_cache(_profile("p1"), context)
+        await save_session_cache(session, context)
+        redis.calls.clear()
+
+        profile, session = await load_profile_and_session_cache("p1", "s1", context)
+
+        assert redis.calls == ['mget']
+        assert profile.id == "p1"
+        assert profile.traits == {"a": 1}
+        assert profile.get_meta_data().index == "profile-index"
+        assert session.id == "s1"
+
+        assert await load_profile_and_session_cache("p2", None, context) == (None, None)
+
+
+@pytest.mark.asyncio
+async def test_profiles_are_saved_and_loaded_in_batches(redis):
+    context = Context(production=False, tenant="test")
+    profile_cache.redis_cache.batch_size = 10
+    try:
+        with ServerContext(context):
+            await save_profile_cache([_profile(str(n)) for n in range(25)] + [Profile(id="no-metadata")], context)
+            assert redis.calls == ['delete_many', 'set_many', 'set_many', 'set_many']
+
+            redis.calls.clear()
+            profiles = await load_profile_caches([str(n) for n in range(25)] + ["missing"], context)
+            assert redis.calls == ['mget', 'mget', 'mget']
+            assert profiles["24"].id == "24"
+            assert profiles["missing"] is None
+    finally:
+        profile_cache.redis_cache.batch_size = 1000
@@ -0,0 +1,51 @@
+import asyncio
+
+import pytest
+
+from tracardi.context import ServerContext, Context, get_context
+from tracardi.service.storage import refresh_coordinator as coordinator_module
+from tracardi.service.storage.refresh_coordinator import RefreshCoordinator
+
+
+class Storage:
+
+    def __init__(self, index, refreshes):
+        self.index = index
+        self.refreshes = refreshes
+
+    async def refresh(self):
+        self.refreshes.append((self.index, get_context().production))
+
+
+@pytest.fixture
+def refreshes(monkeypatch):
+    calls = []
+    monkeypatch.setattr(coordinator_module, "storage_manager", lambda index: Storage(index, calls))
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_refreshes_within_window_are_coalesced_per_index_and_context(refreshes):
+    coordinator = RefreshCoordinator(window=0.01)
+    with ServerContext(Context(production=False)):
+        for _ in range(5):
+            coordinator.request("profile")
+        waiting = coordinator.request("session")
+    with ServerContext(Context(production=True)):
+        coordinator.request("profile")
+
+    await waiting
+    await coordinator.flush()
+
+    assert sorted(refreshes) == [("profile", False), ("profile", True), ("session", False)]
+    assert coordinator.stats() == {"requested": 7, "refreshed": 3, "failed": 0, "pending": 0}
+
+
+@pytest.mark.asyncio
+async def test_request_after_window_needs_new_refresh(refreshes):
+    coordinator = RefreshCoordinator(window=0.01)
+    with ServerContext(Context(production=False)):
+        await coordinator.refresh("profile")
+        await asyncio.gather(coordinator.refresh("profile"), coordinator.refresh("profile"))
+
+    assert refreshes == [("profile", False), ("profile", False)]
@@ -0,0 +1,111 @@
+from time import time
+
+import pytest
+
+from tracardi.domain.entity import Entity
+from tracardi.domain.event import Event, EventSession
+from tracardi.domain.event_metadata import EventMetadata
+from tracardi.domain.flow import Flow
+from tracardi.domain.profile import Profile
+from tracardi.domain.time import EventTime
+from tracardi.service.plugin.domain.register import Plugin, Spec, MetaData
+from tracardi.service.plugin.domain.result import Result
+from tracardi.service.plugin.runner import ActionRunner
+from tracardi.service.wf.domain.debug_info import DebugInfo, FlowDebugInfo
+from tracardi.service.wf.domain.entity import Entity as WfEntity
+from tracardi.service.wf.domain.flow_history import FlowHistory
+from tracardi.service.wf.service.builders import action
+from tracardi.service.wf.utils.dag_processor import DagProcessor
+from tracardi.service.wf.utils.flow_graph_converter import FlowGraphConverter
+
+inputs = {}
+
+
+class SourceAction(ActionRunner):
+
+    async def run(self, payload: dict, in_edge=None):
+        return Result(port="payload", value={"data": {"a": 1}})
+
+
+class ReadAction(ActionRunner):
+
+    async def run(self, payload: dict, in_edge=None):
+        inputs[self.node.name] = payload
+        return None
+
+
+class MutateAction(ReadAction):
+    mutates_input = True
+
+    async def run(self, payload: dict, in_edge=None):
+        payload['data']['a'] = 2
+        return await super().run(payload, in_edge)
+
+
+def register() -> Plugin:
+    return Plugin(
+        start=False,
+        spec=Spec(
+            module=__name__,
+            className='ReadAction',
+            inputs=["payload"],
+            outputs=["payload"],
+            version='0.1'
+        ),
+        metadata=MetaData(
+            name='Test'
+        )
+    )
+
+
+def _node(plugin, name, start=False):
+    node = action(plugin)
+    node.data.spec.className = plugin.__name__
+    node.data.metadata.name = name
+    node.data.start = start
+    return node
+
+
+async def _run(debug=False):
+    source = _node(SourceAction, "source", start=True)
+    flow = Flow.build("Fan out", id="1")
+    flow += source('payload') >> _node(ReadAction, "read-1")('payload')
+    flow += source('payload') >> _node(ReadAction, "read-2")('payload')
+    flow += source('payload') >> _node(MutateAction, "mutate")('payload')
+
+    dag_graph = FlowGraphConverter(flow.flowGraph.model_dump()).convert_to_dag_graph()
+    dag = DagProcessor(dag_graph)
+    exec_dag = dag.make_execution_dag(start_nodes=dag.find_start_nodes(), debug=debug)
+
+    event = Event(
+        id='1',
+        type='text',
+        metadata=EventMetadata(time=EventTime()),
+        session=EventSession(id='1'),
+        source=Entity(id='1')
+    )
+    debug_info = DebugInfo(timestamp=time(), flow=FlowDebugInfo(id=flow.id, name=flow.name), event=WfEntity(id='1'))
+
+    inputs.clear()
+    await exec_dag.init(debug_info, [], flow, FlowHistory(history=[]), event, None, Profile(id="1"), None, [])
+    debug_info, _, _, _, _ = await exec_dag.run(payload={}, event=event, profile=Profile(id="1"), session=None,
+                                                debug_info=debug_info, log_list=[])
+    await exec_dag.close()
+    assert not debug_info.has_errors()
+
+
+@pytest.mark.asyncio
+async def test_results_are_shared_between_nodes_that_do_not_mutate_input():
+    await _run()
+
+    assert inputs['read-1'] is inputs['read-2']
+    assert inputs['read-1'] == {"data": {"a": 1}}
+    assert inputs['mutate'] == {"data": {"a": 2}}
+
+
+@pytest.mark.asyncio
+async def test_results_are_copied_in_debug_mode():
+    await _run(debug=True)
+
+    assert inputs['read-1'] is not inputs['read-2']
+    assert inputs['read-1'] == {"data": {"a": 1}}
@@ -0,0 +1,140 @@
+import pytest
+from lark import Tree
+from lark.exceptions import UnexpectedInput
+
+from tracardi.domain.profile import Profile
+from tracardi.process_engine.tql.condition import Condition
+from tracardi.process_engine.tql.parser import Parser
+from tracardi.process_engine.tql.transformer.expr_transformer import ExprTransformer
+from tracardi.service.notation.dot_accessor import DotAccessor
+
+earley = Parser(Parser.read('grammar/uql_expr.lark'), start='expr')
+lalr = Parser(Parser.read('grammar/uql_expr_lalr.lark'), start='expr', parser='lalr')
+
+corpus = [
+    'payload@a.b == 1',
+    'payload@a.b != 1',
+    'payload@a.b > .54543',
+    'payload@a.b < -1.845',
+    'payload@a.b => 1',
+    'payload@a.b =< 1.5',
+    'payload@a == 1e5',
+    'payload@a==+.5',
+    'payload@a == 10d',
+    'payload@a.e == "test"',
+    'payload@a == "a and b"',
+    'payload@a.g == True',
+    'payload@a.h == null',
+    'payload@a.b != NULL',
+    'payload@a == [1,"a",true,null]',
+    'payload@a == []',
+    'payload@a.b == payload@a.f',
+    'payload@a >= profile@b',
+    'profile@traits["a b"] == 1',
+    'payload@A["a[\\" b@ c"] exists',
+    'session@context.browser.local.device.platform == "Linux"',
+    'event@type == "page-view"',
+    'memory@a == 1',
+    'flow@x != null',
+    'payload@a.h exists',
+    'payload@a.h not exists',
+    'payload@a.c EMPTY',
+    'payload@a.c NOT EMPTY',
+    'datetime(payload@a) empty',
+    'datetime(payload@a) not empty',
+    'payload@a.h is null',
+    'payload@a.h is not null',
+    'now() is null',
+    'payload@a contains "x"',
+    'payload@a starts with "x"',
+    'payload@a ends with "x"',
+    'payload@a.d.aa between 1 and 2',
+    'payload@a between datetime("2020-01-01") and now()',
+    'datetime(payload@a.i) between datetime("2020-01-01") and datetime("2022-01-01")',
+    'datetime(payload@a.i) < now()',
+    'datetime(payload@a) >= datetime(profile@b)',
+    'payload@a == datetime(profile@b)',
+    'datetime.offset(payload@a.i, "-1m") < now()',
+    'datetime.timezone(payload@a.i, "europe/warsaw") < now.timezone("europe/paris")',
+    'datetime.from_timestamp(payload@a.m) == datetime.from_timestamp(payload@a.m)',
+    'now.offset("+1m") > now()',
+    'payload@a.h is not null AND datetime.offset(payload@a.h, "-1m") < now()',
+    'payload@a.d.aa between 1 and 2 and payload@a.e == "test"',
+    'payload@a.d.aa between 1 and 2 or payload@a.e != "test"',
+    'payload@a == 1 and payload@b == 2 and payload@c ==3 and payload@d == 4',
+    'payload@a == "x" or payload@b exists or payload@c not exists',
+    'payload@a\nAND\npayload@b exists',
+    '(payload@a.missing exists OR payload@a.b==1) AND payload@a.missing not exists',
+    'payload@a == 1 and (payload@b == 2 or payload@c == 3)',
+    '((payload@a == 1))',
+    # Not handled by LALR grammar, handled by fallback
+    'payload@a == lower(abc)',
+    'payload@a == 1 and 2',
+    'payload@a between 1 and 2 and 3',
+    # Incorrect in both grammars
+    'payload@a == 1 or payload@b exists and profile@x == 2',
+    'payload@a == "x" AND payload@b == "y" OR payload@c == "z"',
+    'payload@... exists',
+    'a and b',
+    'payload@a <> 1',
+]
+
+
+def _normalize(tree):
+    """
+    Flattens chains of and_expr/or_expr. Earley resolves the ambiguous `a and b and c` either way, both
+    operators are associative in ExprTransformer so the nesting does not change the result.
+    """
+
+    if not isinstance(tree, Tree):
+        return tree
+
+    children = []
+    for child in tree.children:
+        child = _normalize(child)
+        if tree.data in ('and_expr', 'or_expr') and isinstance(child, Tree) and child.data == tree.data:
+            children.extend(child.children)
+        else:
+            children.append(child)
+    return Tree(tree.data, children)
+
+
+def _parse(parser, condition):
+    try:
+        return parser.parse(condition)
+    except UnexpectedInput as e:
+        return e
+
+
+@pytest.mark.parametrize("condition", corpus)
+def test_lalr_parses_the_same_as_earley(condition):
+    expected = _parse(earley, condition)
+    result = _parse(lalr, condition)
+
+    if isinstance(result, Tree):
+        assert _normalize(result) == _normalize(expected)
+    elif isinstance(expected, Tree):
+        # LALR fails, condition parser falls back to earley
+        assert Condition().parse(condition) == expected
+    else:
+        with pytest.raises(UnexpectedInput):
+            Condition().parse(condition)
+
+
+def test_lalr_evaluates_the_same_as_earley():
+    dot = DotAccessor(profile=Profile(id="1"), payload={
+        "a": {"b": 1, "c": [1, 2, 3], "d": {"aa": 1}, "e": "test", "f": 1, "g": True, "h": None, "i": "2021-01-10"}
+    })
+    for condition in corpus:
+        expected = _parse(earley, condition)
+        if not isinstance(expected, Tree):
+            continue
+        try:
+            expected = ExprTransformer(dot=dot).transform(expected)
+        except Exception as e:
+            expected = type(e)
+        try:
+            result = ExprTransformer(dot=dot).transform(Condition().parse(condition))
+        except Exception as e:
+            result = type(e)
+        assert result == expected, condition
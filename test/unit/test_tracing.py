@@ -0,0 +1,73 @@
+import time
+
+from tracardi.service.tracing import Tracer, Histogram, _NOOP_SPAN
+
+
+def test_histogram_percentiles():
+    histogram = Histogram()
+    for _ in range(98):
+        histogram.observe(0.0008)  # 0.8ms
+    histogram.observe(0.03)
+    histogram.observe(0.2)
+
+    stats = histogram.stats()
+    assert stats['count'] == 100
+    assert stats['p50'] == 1
+    assert stats['p99'] == 50
+    assert stats['max'] == 200
+
+
+def test_spans_are_recorded_per_name():
+    tracer = Tracer(enabled=True)
+
+    with tracer.span("stage", profile_id="1"):
+        time.sleep(0.002)
+    try:
+        with tracer.span("stage"):
+            raise ValueError()
+    except ValueError:
+        pass
+
+    stats = tracer.stats()
+    assert list(stats) == ["stage"]
+    assert stats["stage"]["count"] == 2
+    assert stats["stage"]["max"] >= 2
+
+
+def test_disabled_tracer_does_not_record():
+    tracer = Tracer(enabled=False, otel=True)
+    span = tracer.span("stage")
+    with span:
+        pass
+
+    assert span is _NOOP_SPAN
+    assert tracer.otel_tracer is None
+    assert tracer.stats() == {}
+
+
+def test_otel_span_gets_error_of_failed_stage():
+    exits = []
+
+    class OtelSpan:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc_val, exc_tb):
+            exits.append(exc_type)
+
+    class OtelTracer:
+        def start_as_current_span(self, name, attributes=None):
+            return OtelSpan()
+
+    tracer = Tracer(enabled=True)
+    tracer.otel_tracer = OtelTracer()
+
+    with tracer.span("stage"):
+        pass
+    try:
+        with tracer.span("stage"):
+            raise ValueError()
+    except ValueError:
+        pass
+
+    assert exits == [None, ValueError]
@@ -3,6 +3,7 @@ from user_agents.parsers import UserAgent
 from tracardi.domain.entity import Entity
 from tracardi.domain.payload.tracker_payload import TrackerPayload
 from tracardi.domain.session import Session, SessionMetadata
+from tracardi.service.cache.user_agent import UserAgentCache
 from tracardi.service.tracking.session_data_computation import _get_user_agent
 
 def test_user_agent_string_from_tracker_payload():
@@ -107,3 +108,38 @@ def test_user_agent_string_bot():
     assert isinstance(result, UserAgent)
     assert result.is_bot
 
+
+
+def test_user_agent_is_parsed_once_and_shared():
+    cache = UserAgentCache(max_size=2)
+    chrome = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3'
+
+    assert cache.parse(None) is None
+    assert cache.parse(chrome) is cache.parse(chrome)
+    cache.parse("agent-1")
+    cache.parse(chrome)
+    cache.parse("agent-2")
+
+    # agent-1 was least recently used
+    assert cache.stats()['size'] == 2
+    assert cache.hits == 2
+    assert cache.misses == 3
+    cache.parse("agent-1")
+    assert cache.misses == 4
+
+
+def test_tracker_payload_and_session_share_parsed_user_agent():
+    session = Session(
+        id="1",
+        metadata=SessionMetadata()
+    )
+    tracker_payload = TrackerPayload(
+        source=Entity(id="1"),
+        request={
+            'headers': {
+                'user-agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/59.0 Safari/537.3'
+            }
+        }
+    )
+
+    assert _get_user_agent(session, tracker_payload) is tracker_payload.get_user_agent()
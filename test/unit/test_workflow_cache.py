@@ -0,0 +1,50 @@
+import time
+
+from tracardi.context import ServerContext, Context
+from tracardi.domain.flow import Flow
+from tracardi.service.cache.workflow import WorkflowCache
+
+
+def test_workflow_cache_is_versioned():
+    with ServerContext(Context(production=False, tenant="test")):
+        cache = WorkflowCache(ttl=60, max_size=10)
+        flow = Flow.new(id="1")
+        cache.set("1", 1, flow)
+
+        assert cache.get("1", 1) is flow
+        assert cache.get("1", 2) is None
+        assert cache.get("2", 1) is None
+
+    with ServerContext(Context(production=True, tenant="test")):
+        assert cache.get("1", 1) is None
+
+
+def test_workflow_cache_is_bounded():
+    with ServerContext(Context(production=False, tenant="test")):
+        cache = WorkflowCache(ttl=60, max_size=2)
+        cache.set("1", 0, Flow.new(id="1"))
+        cache.set("2", 0, Flow.new(id="2"))
+        cache.get("1", 0)
+        cache.set("3", 0, Flow.new(id="3"))
+
+        assert cache.get("1", 0) is not None
+        assert cache.get("2", 0) is None
+        assert cache.get("3", 0) is not None
+
+        cache = WorkflowCache(ttl=0.1, max_size=2)
+        cache.set("1", 0, Flow.new(id="1"))
+        time.sleep(0.2)
+        assert cache.get("1", 0) is None
+
+
+def test_flow_copy_for_run_does_not_share_state():
+    flow = Flow.new(id="1")
+    copy = flow.copy_for_run()
+
+    copy.response["key"] = {"a": 1}
+    copy.set_change("profile", "1", "1", "1", "1", "traits.a", 1, None)
+
+    assert copy.flowGraph is flow.flowGraph
+    assert flow.response == {}
+    assert flow.get_changes() == []
+    assert len(copy.get_changes()) == 1
@@ -21,15 +21,35 @@ logger = get_logger(__name__)
 
 class MemoryCacheConfig:
     def __init__(self, env):
-        self.event_to_profile_coping_ttl = get_env_as_int('EVENT_TO_PROFILE_COPY_CACHE_TTL', 2)
-        self.source_ttl = get_env_as_int('SOURCE_CACHE_TTL', 2)
+        # Configuration caches are cleared on every change (redis pub/sub), so TTLs can be long.
+        self.event_to_profile_coping_ttl = get_env_as_int('EVENT_TO_PROFILE_COPY_CACHE_TTL', 60)
+        self.source_ttl = get_env_as_int('SOURCE_CACHE_TTL', 60)
         self.session_cache_ttl = get_env_as_int('SESSION_CACHE_TTL', 2)
-        self.event_validation_cache_ttl = get_env_as_int('EVENT_VALIDATION_CACHE_TTL', 2)
-        self.event_metadata_cache_ttl = get_env_as_int('EVENT_METADATA_CACHE_TTL', 2)
-        self.event_destination_cache_ttl = get_env_as_int('EVENT_DESTINATION_CACHE_TTL', 2)
-        self.profile_destination_cache_ttl = get_env_as_int('PROFILE_DESTINATION_CACHE_TTL', 2)
-        self.data_compliance_cache_ttl = get_env_as_int('DATA_COMPLIANCE_CACHE_TTL', 2)
-        self.trigger_rule_cache_ttl = get_env_as_int('TRIGGER_RULE_CACHE_TTL', 5)
+        self.event_validation_cache_ttl = get_env_as_int('EVENT_VALIDATION_CACHE_TTL', 60)
+        self.event_metadata_cache_ttl = get_env_as_int('EVENT_METADATA_CACHE_TTL', 60)
+        self.event_destination_cache_ttl = get_env_as_int('EVENT_DESTINATION_CACHE_TTL', 60)
+        self.profile_destination_cache_ttl = get_env_as_int('PROFILE_DESTINATION_CACHE_TTL', 60)
+        self.data_compliance_cache_ttl = get_env_as_int('DATA_COMPLIANCE_CACHE_TTL', 60)
+        self.trigger_rule_cache_ttl = get_env_as_int('TRIGGER_RULE_CACHE_TTL', 60)
+        self.event_reshaping_cache_ttl = get_env_as_int('EVENT_RESHAPING_CACHE_TTL', 60)
+        self.resource_cache_ttl = get_env_as_int('RESOURCE_CACHE_TTL', 60)
+        # Expired cache values are returned for this long while they are reloaded in the background.
+        self.stale_cache_ttl = get_env_as_int('STALE_CACHE_TTL', 30)
+        self.condition_cache_size = get_env_as_int('CONDITION_CACHE_SIZE', 1024)
+        self.workflow_cache_ttl = get_env_as_int('WORKFLOW_CACHE_TTL', 300)
+        self.workflow_cache_size = get_env_as_int('WORKFLOW_CACHE_SIZE', 500)
+        self.user_agent_cache_size = get_env_as_int('USER_AGENT_CACHE_SIZE', 2048)
+        self.plugin_pool_ttl = get_env_as_int('PLUGIN_POOL_TTL', 60)
+        self.plugin_pool_max_idle = get_env_as_int('PLUGIN_POOL_MAX_IDLE', 8)
+        self.plugin_pool_max_nodes = get_env_as_int('PLUGIN_POOL_MAX_NODES', 1000)
+
+
+class HttpClientConfig:
+    def __init__(self, env):
+        self.http_pool_limit = get_env_as_int('HTTP_POOL_LIMIT', 100)
+        self.http_pool_limit_per_host = get_env_as_int('HTTP_POOL_LIMIT_PER_HOST', 20)
+        self.http_keepalive_timeout = get_env_as_int('HTTP_KEEPALIVE_TIMEOUT', 30)
+        self.http_dns_cache_ttl = get_env_as_int('HTTP_DNS_CACHE_TTL', 300)
 
 
 class MysqlConfig:
@@ -44,6 +64,12 @@ class MysqlConfig:
         self.mysql_port = env.get('MYSQL_PORT', 3306)
         self.mysql_database = env.get('MYSQL_DATABASE', "tracardi")
         self.mysql_echo = env.get('MYSQL_ECHO', "no") == "yes"
+        self.mysql_pool_size = get_env_as_int('MYSQL_POOL_SIZE', 10)
+        self.mysql_max_overflow = get_env_as_int('MYSQL_MAX_OVERFLOW', 10)
+        self.mysql_pool_timeout = get_env_as_int('MYSQL_POOL_TIMEOUT', 10)
+        self.mysql_pool_recycle = get_env_as_int('MYSQL_POOL_RECYCLE', 1800)
+        # Compiled SQL statements reused by queries of the same shape.
+        self.mysql_query_cache_size = get_env_as_int('MYSQL_QUERY_CACHE_SIZE', 1000)
 
         self.mysql_database = self.mysql_database.strip(" /")
 
@@ -95,6 +121,8 @@ class ElasticConfig:
         self.http_auth_password = self.env.get('ELASTIC_HTTP_AUTH_PASSWORD', None)
         self.scheme = self.env.get('ELASTIC_SCHEME', 'http')
         self.query_timeout = get_env_as_int('ELASTIC_QUERY_TIMEOUT', 12)
+        # Index refreshes requested within this window (milliseconds) are done with one refresh
+        self.refresh_window = get_env_as_int('ELASTIC_REFRESH_WINDOW', 1000)
         self.logging_level = _get_logging_level(
             env['ELASTIC_LOGGING_LEVEL']) if 'ELASTIC_LOGGING_LEVEL' in env else logging.ERROR
 
@@ -130,6 +158,7 @@ class RedisConfig:
         self.port = get_env_as_int('REDIS_PORT', 6379)
         self.redis_host = env.get('REDIS_HOST', 'redis://localhost:6379')
         self.redis_password = env.get('REDIS_PASSWORD', None)
+        self.redis_async_max_connections = get_env_as_int('REDIS_ASYNC_MAX_CONNECTIONS', 50)
 
         if self.host.startswith("redis://"):
             self.host = self.host[8:]
@@ -161,6 +190,7 @@ class RedisConfig:
 redis_config = RedisConfig(os.environ)
 elastic = ElasticConfig(os.environ)
 memory_cache = MemoryCacheConfig(os.environ)
+http_client_config = HttpClientConfig(os.environ)
 
 
 class TracardiConfig(metaclass=Singleton):
@@ -170,8 +200,29 @@ class TracardiConfig(metaclass=Singleton):
         _production = (env['PRODUCTION'].lower() == 'yes') if 'PRODUCTION' in env else False
         self.track_debug = env.get('TRACK_DEBUG', 'no').lower() == 'yes'
         self.save_logs = get_env_as_bool('SAVE_LOGS', 'yes')
+        # Logs are saved in background when LOG_FLUSH_SIZE logs are buffered or every LOG_FLUSH_INTERVAL
+        self.log_flush_size = get_env_as_int('LOG_FLUSH_SIZE', 500)
+        self.log_flush_interval = get_env_as_int('LOG_FLUSH_INTERVAL', 5000)  # milliseconds
         self.enable_event_destinations = get_env_as_bool('ENABLE_EVENT_DESTINATIONS', 'no')
         self.enable_profile_destinations = get_env_as_bool('ENABLE_PROFILE_DESTINATIONS', 'no')
+        self.destination_dispatch_mode = env.get('DESTINATION_DISPATCH_MODE', 'sync').lower()  # sync or buffered
+        self.destination_concurrency = get_env_as_int('DESTINATION_CONCURRENCY', 4)
+        self.destination_batch_size = get_env_as_int('DESTINATION_BATCH_SIZE', 100)
+        self.destination_batch_wait = get_env_as_int('DESTINATION_BATCH_WAIT', 100)  # milliseconds
+        self.destination_buffer_size = get_env_as_int('DESTINATION_BUFFER_SIZE', 10000)
+        # Moving events and sessions of merged profiles: background or inline
+        self.merge_reassignment_mode = env.get('MERGE_REASSIGNMENT_MODE', 'background').lower()
+        self.merge_reassignment_batch_size = get_env_as_int('MERGE_REASSIGNMENT_BATCH_SIZE', 1000)  # profile ids
+        self.merge_reassignment_batch_wait = get_env_as_int('MERGE_REASSIGNMENT_BATCH_WAIT', 1000)  # milliseconds
+        self.merge_reassignment_buffer_size = get_env_as_int('MERGE_REASSIGNMENT_BUFFER_SIZE', 10000)
+        self.merge_reassignment_retries = get_env_as_int('MERGE_REASSIGNMENT_RETRIES', 3)
+        self.import_events_per_request = get_env_as_int('IMPORT_EVENTS_PER_REQUEST', 100)
+        self.import_concurrency = get_env_as_int('IMPORT_CONCURRENCY', 4)
+        # Bulk ingestion: documents per elastic bulk request and profiles computed at the same time
+        self.bulk_ingest_chunk_size = get_env_as_int('BULK_INGEST_CHUNK_SIZE', 2000)
+        self.bulk_ingest_concurrency = get_env_as_int('BULK_INGEST_CONCURRENCY', 10)
+        # Stage timings: off, on (in-process histograms) or otel (histograms and OpenTelemetry spans)
+        self.tracing = env.get('TRACING', 'off').lower()
         self.enable_workflow = get_env_as_bool('ENABLE_WORKFLOW', 'yes')
         self.enable_event_validation = get_env_as_bool('ENABLE_EVENT_VALIDATION', 'yes')
         self.enable_event_reshaping = get_env_as_bool('ENABLE_EVENT_RESHAPING', 'yes')
@@ -184,6 +235,8 @@ class TracardiConfig(metaclass=Singleton):
         self.disallow_bot_traffic = get_env_as_bool('DISALLOW_BOT_TRAFFIC', 'yes')
         self.keep_profile_in_cache_for = get_env_as_int('KEEP_PROFILE_IN_CACHE_FOR', 60*60)
         self.keep_session_in_cache_for = get_env_as_int('KEEP_SESSION_IN_CACHE_FOR', 30 * 60)
+        # Cached profiles and sessions larger than this (bytes) are zstd compressed. Needs zstandard package.
+        self.cache_compress_above = get_env_as_int('CACHE_COMPRESS_ABOVE', 4096)
 
         self.skip_errors_on_profile_mapping = get_env_as_bool('SKIP_ERRORS_ON_PROFILE_MAPPING', 'no')
 
@@ -17,6 +17,9 @@ from ..service.string_manager import capitalize_event_type_id
 from ..service.utils.date import now_in_utc
 
 
+_MISSING = object()
+
+
 class Tags(BaseModel):
     values: Tuple['str', ...] = ()
     count: int = 0
@@ -381,3 +384,71 @@ class Event(NamedEntity):
                 "state": None
             }
         }
+
+
+class FlatEvent:
+    """
+    Dot notation access to event fields, e.g. `properties.page.url`, for event mappings. Reads and writes go
+    straight to the event, so the mapped event does not have to be dumped and validated again.
+    """
+
+    def __init__(self, event: Event):
+        self.event = event
+
+    @staticmethod
+    def _get(data, key: str):
+        if isinstance(data, dict):
+            return data.get(key, _MISSING)
+        if isinstance(data, BaseModel):
+            # Model field values are in __dict__
+            return data.__dict__.get(key, _MISSING)
+        if isinstance(data, (list, tuple)) and key.isdigit():
+            index = int(key)
+            return data[index] if index < len(data) else _MISSING
+        return _MISSING
+
+    @staticmethod
+    def _set(data, key: str, value):
+        if isinstance(data, dict):
+            data[key] = value
+        elif isinstance(data, BaseModel) and key in data.__dict__:
+            setattr(data, key, value)
+        elif isinstance(data, list) and key.isdigit():
+            data[int(key)] = value
+        else:
+            raise KeyError(key)
+
+    def _find(self, path: str):
+        data = self.event
+        for key in path.split('.'):
+            data = self._get(data, key)
+            if data is _MISSING:
+                break
+        return data
+
+    def __getitem__(self, path: str):
+        value = self._find(path)
+        if value is _MISSING:
+            raise KeyError(path)
+        return value
+
+    def __setitem__(self, path: str, value):
+        *parents, key = path.split('.')
+        data = self.event
+        for parent in parents:
+            child = self._get(data, parent)
+            if child is _MISSING or child is None:
+                child = {}
+                self._set(data, parent, child)
+            data = child
+        self._set(data, key, value)
+
+    def __contains__(self, path: str) -> bool:
+        return self._find(path) is not _MISSING
+
+    def get(self, path: str, default=None):
+        value = self._find(path)
+        return default if value is _MISSING else value
+
+    def to_dict(self) -> dict:
+        return self.event.model_dump()
@@ -12,7 +12,6 @@ from uuid import uuid4
 
 from dotty_dict import dotty
 from pydantic import PrivateAttr, BaseModel
-from user_agents import parse
 
 from tracardi.config import tracardi
 from .. import ExtraInfo
@@ -20,6 +19,7 @@ from ...exceptions.log_handler import get_logger
 
 from ...service.license import License, LICENSE
 from ...service.profile_merger import ProfileMerger
+from ...service.cache.user_agent import user_agent_cache
 from ..event_metadata import EventPayloadMetadata
 from ..event_source import EventSource
 from ..identification_point import IdentificationPoint
@@ -111,7 +111,7 @@ class TrackerPayload(BaseModel):
         if self._user_agent is None:
             try:
                 user_agent = self.request['headers']['user-agent']
-                self._user_agent = parse(user_agent)
+                self._user_agent = user_agent_cache.parse(user_agent)
             except Exception:
                 pass
 
@@ -358,6 +358,13 @@ class Profile(PrimaryEntity):
 
 class FlatProfile(Dotty):
 
+    # Set on any change. Unchanged flat profile does not have to be converted back to profile.
+    changed = False
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.changed = True
+
     def add_auto_merge_hashed_id(self, flat_field: str) -> Optional[str]:
         field_closure = FLAT_PROFILE_MAPPING.get(flat_field, None)
         if field_closure:
@@ -390,6 +397,7 @@ class FlatProfile(Dotty):
         added_ids = set()
         for flat_field, timestamp_data in field_timestamp_manager.get_timestamps():  # type: str, list
             self['metadata.fields'][flat_field] = timestamp_data
+            self.changed = True
             # If enabled hash emails and phone on field change
             if tracardi.is_apm_on():
                 # Adds hashed id for email, phone, etc.
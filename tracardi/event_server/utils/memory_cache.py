@@ -1,101 +1,135 @@
 import asyncio
+import heapq
+from collections import OrderedDict
 from time import time
 from typing import Any, Dict, List
 
-from pydantic import BaseModel
-
 from tracardi.exceptions.exception import ExpiredException
 
 
-class CacheItem(BaseModel):
-    data: Any = None
-    ttl: float = 60
-
-    def __init__(self, **data: Any):
-        if 'ttl' in data:
-            data['ttl'] = time() + float(data['ttl'])
+class CacheItem:
+    __slots__ = ('data', 'ttl')
 
-        super().__init__(**data)
+    def __init__(self, data: Any = None, ttl: float = 60):
+        self.data = data
+        # Absolute expiration timestamp
+        self.ttl = time() + float(ttl)
 
     def expired(self):
         return time() > self.ttl
 
+    def __repr__(self):
+        return f"CacheItem(data={self.data!r}, ttl={self.ttl})"
+
 
 class MemoryCache:
     """
-    The MemoryCache class implements an in-memory caching system with expiration capabilities for stored items.
-    It operates by maintaining a dictionary as an internal memory buffer, where each key-value pair corresponds
-    to a cache key and its associated CacheItem. Each CacheItem contains the actual data to be cached and a
-    time-to-live (TTL) value indicating how long the data should remain valid.
-
-    Here's a more streamlined explanation of how MemoryCache functions:
-    Caching and Expiration Logic
-
-    When an item is added to the cache, its TTL is converted into an absolute expiration timestamp. This
-    timestamp is then used to determine if the item is still valid whenever it is accessed.
-    The cache employs a lazy expiration mechanism. This means that items are only checked for expiration at the
-    moment they are accessed. If an item's expiration timestamp is past the current time, it is considered expired
-    and is automatically removed from the cache.
-
-    To prevent the cache from indefinitely growing, a max_pool limit is set, indicating the maximum number of items
-    the cache should ideally hold. When adding an item causes the cache to exceed this limit, the cache is purged
-    of expired items. However, this mechanism does not guarantee that the cache size will be immediately reduced to
-    below max_pool if all items within are still valid; it only removes those that have expired.
+    In-memory cache with expiration and LRU eviction.
+
+    Items are kept in an ordered dict in the order of use. Each item has an absolute expiration timestamp. Expired
+    items are removed when they are accessed and by a timer wheel: keys are put into 100ms slots by expiration
+    time, and on every insert the slots that have passed are dropped. When the cache grows above max_pool the least
+    recently used items are evicted, so the cache never holds more than max_pool items.
     """
 
+    _slot_size = 0.1  # Seconds
+
     def __init__(self, name: str, max_pool=1000, allow_null_values=False):
-        self.memory_buffer: Dict[str, CacheItem] = {}
+        self.memory_buffer: OrderedDict[str, CacheItem] = OrderedDict()
         self.name = name
         self.max_pool = max_pool
         self.counter = 0
         self.allow_null_values = allow_null_values
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._slots: Dict[int, List[str]] = {}
+        self._slot_heap: List[int] = []
 
     def __len__(self):
         return len(self.memory_buffer)
 
-    def __contains__(self, key: str):
-        if key in self.memory_buffer:
-            if self.memory_buffer[key].expired():
-                del self.memory_buffer[key]
+    def _remove_expired(self, key: str) -> bool:
+        item = self.memory_buffer.get(key, None)
+        if item is not None and item.expired():
+            del self.memory_buffer[key]
+            self.expirations += 1
+            return True
+        return False
 
-        return key in self.memory_buffer
+    def __contains__(self, key: str):
+        if self._remove_expired(key) or key not in self.memory_buffer:
+            self.misses += 1
+            return False
+        self.memory_buffer.move_to_end(key)
+        self.hits += 1
+        return True
 
     def is_expired(self, key: str) -> bool:
         return (key in self.memory_buffer and self.memory_buffer[key].expired()) or key not in self.memory_buffer
 
     def __getitem__(self, item: str) -> [CacheItem, None]:
         if item in self.memory_buffer:
-            cache_item = self.memory_buffer[item]  # type: CacheItem
-            if cache_item.expired():
-                del self.memory_buffer[item]
+            if self._remove_expired(item):
+                self.misses += 1
                 raise ExpiredException("MemoryCache item expired")
-            return cache_item
+            self.memory_buffer.move_to_end(item)
+            self.hits += 1
+            return self.memory_buffer[item]
+        self.misses += 1
         return None
 
     def __setitem__(self, key: str, value: CacheItem):
         if not isinstance(value, CacheItem):
             raise ValueError("MemoryCache item must be CacheItem type.")
         self.memory_buffer[key] = value
+        self.memory_buffer.move_to_end(key)
         self.counter += 1
-        if self.counter > self.max_pool:
-            self.purge()
+
+        slot = int(value.ttl // self._slot_size)
+        if slot not in self._slots:
+            self._slots[slot] = []
+            heapq.heappush(self._slot_heap, slot)
+        self._slots[slot].append(key)
+
+        self.purge()
+        while len(self.memory_buffer) > self.max_pool:
+            self.memory_buffer.popitem(last=False)
+            self.evictions += 1
 
     def __delitem__(self, key):
         if key in self.memory_buffer:
             del self.memory_buffer[key]
 
     def delete(self, key):
-        if key in self:
-            del self[key]
+        del self[key]
 
     def delete_all(self, keys: List[str]):
         for key in keys:
             del self[key]
 
     def purge(self):
-        for key, value in self.memory_buffer.copy().items():
-            if value.expired():
-                del self.memory_buffer[key]
+        # Drops the slots that have passed. Keys that were saved again with a later expiration are kept.
+        current_slot = int(time() // self._slot_size)
+        while self._slot_heap and self._slot_heap[0] < current_slot:
+            for key in self._slots.pop(heapq.heappop(self._slot_heap)):
+                self._remove_expired(key)
+
+    def clear(self):
+        self.memory_buffer.clear()
+        self._slots.clear()
+        self._slot_heap.clear()
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self.memory_buffer),
+            "max_size": self.max_pool,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations
+        }
 
     @staticmethod
     async def save(cache: 'MemoryCache', key, data, ttl):
@@ -106,7 +140,12 @@ class MemoryCache:
     # TODO used in MemoryCache only
     @staticmethod
     async def cache(cache: 'MemoryCache', key, ttl, load_callable, awaitable, *args):
-        if key not in cache:
+        try:
+            item = cache[key]
+        except ExpiredException:
+            item = None
+
+        if item is None:
             result = load_callable(*args)
             if awaitable:
                 result = await result
@@ -115,5 +154,6 @@ class MemoryCache:
                 return None
 
             await MemoryCache.save(cache, key, data=result, ttl=ttl)
+            return result
 
-        return cache[key].data
+        return item.data
@@ -1,10 +1,14 @@
 import os
 
 import logging
+from collections import deque
+from random import random
+from typing import Deque, Dict, List, Optional, Tuple
 
 from tracardi.service.logging.formater import CustomFormatter
 from tracardi.service.logging.tools import _get_logging_level
 from tracardi.service.utils.date import now_in_utc
+from tracardi.service.utils.environment import get_env_as_int
 from logging import Handler, LogRecord
 from time import time
 
@@ -12,20 +16,73 @@ _env = os.environ
 _logging_level = _get_logging_level(_env['LOGGING_LEVEL']) if 'LOGGING_LEVEL' in _env else logging.WARNING
 _save_logs_on = _env.get('SAVE_LOGS', 'yes').lower() == 'yes'
 
+
+def _get_sample_rates(value: str) -> Dict[str, float]:
+    # E.g. "debug:0,info:10" - percent of logs saved per level. Not listed levels are always saved.
+    rates = {}
+    for item in value.split(','):
+        if ':' in item:
+            level, rate = item.split(':', 1)
+            try:
+                rates[level.strip().upper()] = min(max(float(rate), 0), 100) / 100
+            except ValueError:
+                pass
+    return rates
+
+
+def _get_context_key() -> Tuple[Optional[str], Optional[bool]]:
+    # Imported here as context imports config which imports this module.
+    try:
+        from tracardi.context import get_context
+        context = get_context()
+        return context.tenant, context.production
+    except Exception:
+        return None, None
+
+
 class ElasticLogHandler(Handler):
+    """
+    Keeps logs to be saved in tracardi-log index. Logs are kept in a ring buffer of buffer_size items, so under
+    error storms the oldest logs are dropped. Logs of levels with sample rate are sampled. Log repeated while
+    it waits in the buffer (same context, logger, line, level and message) is counted, not added, and saved
+    with the number of repeats in the message.
+
+    Logs are saved by log flusher (see tracardi.service.logger_manager).
+    """
 
-    def __init__(self, level=0, collection=None):
+    def __init__(self, level=0, buffer_size: int = 10000, sample_rates: Optional[Dict[str, float]] = None):
         super().__init__(level)
-        if collection is None:
-            collection = []
-        self.collection = collection
+        self.buffer: Deque[Tuple[Tuple[Optional[str], Optional[bool]], dict]] = deque(maxlen=max(buffer_size, 1))
+        self.sample_rates = sample_rates or {}
+        self.flush_size = None
+        self.on_flush_size = None
+        self._repeats: Dict[tuple, list] = {}
         self.last_save = time()
+        self.dropped = 0
+        self.sampled_out = 0
+        self.deduplicated = 0
 
     def _get(self, record, value, default_value):
         return record.__dict__.get(value, default_value)
 
     def emit(self, record: LogRecord):
 
+        if not _save_logs_on:
+            return
+
+        rate = self.sample_rates.get(record.levelname, None)
+        if rate is not None and random() >= rate:
+            self.sampled_out += 1
+            return
+
+        context_key = _get_context_key()
+        repeat_key = (context_key, record.name, record.lineno, record.levelname, str(record.msg))
+        repeat = self._repeats.get(repeat_key, None)
+        if repeat is not None:
+            repeat[0] += 1
+            self.deduplicated += 1
+            return
+
         log = {  # Maps to tracardi-log index
             "date": now_in_utc(),
             "message": record.msg,
@@ -45,15 +102,72 @@ class ElasticLogHandler(Handler):
             "user_id": self._get(record, "user_id", None),
         }
 
-        if _save_logs_on:
-            self.collection.append(log)
+        if len(self.buffer) == self.buffer.maxlen:
+            _, dropped_log = self.buffer[0]
+            self._repeats.pop(dropped_log.pop('_repeat_key'), None)
+            self.dropped += 1
+
+        log['_repeat_key'] = repeat_key
+        self._repeats[repeat_key] = [0, log]
+        self.buffer.append((context_key, log))
+
+        if self.on_flush_size is not None and self.flush_size and len(self.buffer) == self.flush_size:
+            try:
+                self.on_flush_size()
+            except RuntimeError:
+                # Loop of log flusher is closed
+                self.on_flush_size = None
 
     def has_logs(self):
-        return _save_logs_on is True and isinstance(self.collection, list)
+        return _save_logs_on is True and len(self.buffer) > 0
+
+    def drain(self) -> List[Tuple[Tuple[Optional[str], Optional[bool]], dict]]:
+        """
+        Returns buffered logs with context key (tenant, production) they were logged in and empties the buffer.
+        """
+        self.acquire()
+        try:
+            logs = list(self.buffer)
+            repeats = self._repeats
+            self.buffer.clear()
+            self._repeats = {}
+            self.last_save = time()
+        finally:
+            self.release()
+
+        return [(context_key, self._saved_log(log, repeats)) for context_key, log in logs]
+
+    @staticmethod
+    def _saved_log(log: dict, repeats: dict) -> dict:
+        # Log as it is saved: without the dedup key and with the number of repeats.
+        repeated, _ = repeats.get(log['_repeat_key'], (0, None))
+        log = {key: value for key, value in log.items() if key != '_repeat_key'}
+        if repeated:
+            log['message'] = f"{log['message']} [Repeated {repeated} times]"
+        return log
+
+    @property
+    def collection(self) -> List[dict]:
+        """
+        Copies of buffered logs as they are saved. Does not empty the buffer.
+        """
+        self.acquire()
+        try:
+            return [self._saved_log(log, self._repeats) for _, log in self.buffer]
+        finally:
+            self.release()
 
     def reset(self):
-        self.collection = []
-        self.last_save = time()
+        self.drain()
+
+    def stats(self) -> dict:
+        return {
+            "buffered": len(self.buffer),
+            "buffer_size": self.buffer.maxlen,
+            "dropped": self.dropped,
+            "sampled_out": self.sampled_out,
+            "deduplicated": self.deduplicated
+        }
 
 
 class StackInfoLogger(logging.Logger):
@@ -105,4 +219,7 @@ def get_installation_logger(name, level=None):
     return logger
 
 
-log_handler = ElasticLogHandler()
+log_handler = ElasticLogHandler(
+    buffer_size=get_env_as_int('LOG_BUFFER_SIZE', 10000),
+    sample_rates=_get_sample_rates(_env.get('LOG_SAMPLING', ''))
+)
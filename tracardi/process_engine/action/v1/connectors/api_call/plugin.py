@@ -10,7 +10,7 @@ from tracardi.service.plugin.runner import ActionRunner
 from tracardi.service.tracardi_http_client import HttpClient
 from tracardi.service.wf.domain.node import Node
 from .model.configuration import RemoteCallConfiguration
-from tracardi.service.domain import resource as resource_db
+from tracardi.service.cache.resource import load_resource
 from tracardi.service.url_constructor import ApiCredentials
 
 
@@ -20,15 +20,19 @@ def validate(config: dict) -> RemoteCallConfiguration:
 
 class RemoteCallAction(ActionRunner):
 
+    pooled = True  # set_up validates the configuration
     credentials: ApiCredentials
     config: RemoteCallConfiguration
 
-    async def set_up(self, init):
-        config = RemoteCallConfiguration(**init)
-        resource = await resource_db.load(config.source.id)
+    async def _load_credentials(self) -> ApiCredentials:
+        # Pooled instance outlives resource changes, so credentials are read from the resource cache, that is
+        # cleared when resources change.
+        resource = await load_resource(self.config.source.id)
+        return resource.credentials.get_credentials(self, ApiCredentials)
 
-        self.config = config
-        self.credentials = resource.credentials.get_credentials(self, ApiCredentials)
+    async def set_up(self, init):
+        self.config = RemoteCallConfiguration(**init)
+        self.credentials = await self._load_credentials()
 
     @staticmethod
     def _validate_key_value(values, label):
@@ -46,10 +50,12 @@ class RemoteCallAction(ActionRunner):
             kwargs['default'] = None
         try:
 
+            self.credentials = await self._load_credentials()
+
             dot = self._get_dot_accessor(payload)
             traverser = DictTraverser(dot, **kwargs)
 
-            headers = self.credentials.headers
+            headers = dict(self.credentials.headers)
             headers.update(self.config.headers)
 
             cookies = traverser.reshape(reshape_template=self.config.cookies)
@@ -14,6 +14,7 @@ def validate(config: dict) -> Config:
 
 class TokenGetter(ActionRunner):
 
+    mutates_input = True  # Can write to payload@ via dot notation
     _credentials: RemoteApiResource
     config: Config
 
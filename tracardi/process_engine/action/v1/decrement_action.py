@@ -19,6 +19,7 @@ def validate(config: dict):
 
 class DecrementAction(ActionRunner):
 
+    mutates_input = True  # Can write to payload@ via dot notation
     config: DecrementConfig
 
     async def set_up(self, init):
@@ -14,6 +14,7 @@ def validate(config: dict) -> Configuration:
 
 class KeyCounterAction(ActionRunner):
 
+    mutates_input = True  # Can write to payload@ via dot notation
     config: Configuration
 
     async def set_up(self, init):
@@ -1,12 +1,12 @@
 import json
 
-import aiohttp
 from pydantic import BaseModel
 
 from tracardi.service.plugin.domain.register import Plugin, Spec, MetaData, Documentation, PortDoc
 from tracardi.service.plugin.domain.result import Result
 from tracardi.service.plugin.runner import ActionRunner
 from tracardi.service.plugin.service import plugin_context
+from tracardi.service.tracardi_http_client import HttpClient
 from tracardi.service.wf.domain.node import Node
 
 
@@ -52,7 +52,7 @@ class MicroserviceAction(ActionRunner):
 
         print(config['init'])
 
-        async with aiohttp.ClientSession(headers={
+        async with HttpClient(headers={
             'Authorization': f"Bearer {microservice_credentials.token}"
         }) as client:
             async with client.post(
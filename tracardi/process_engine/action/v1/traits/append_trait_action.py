@@ -31,6 +31,7 @@ def validate(config: dict):
 
 class AppendTraitAction(ActionRunner):
 
+    mutates_input = True  # Can write to payload@ via dot notation
     config: Configuration
 
     async def set_up(self, init):
@@ -13,6 +13,7 @@ def validate(config: dict) -> Config:
 
 class AssignConditionResultPlugin(ActionRunner):
 
+    mutates_input = True  # Can write to payload@ via dot notation
     config: Config
 
     async def set_up(self, init):
@@ -31,6 +31,7 @@ def validate(config: dict):
 
 class CopyTraitAction(ActionRunner):
 
+    mutates_input = True  # Can write to payload@ via dot notation
     mapping: dict
     config: Configuration
 
@@ -26,6 +26,7 @@ def validate(config: dict):
 
 class DeleteTraitAction(ActionRunner):
 
+    mutates_input = True  # Can write to payload@ via dot notation
     config: DeleteTraitConfiguration
 
     async def set_up(self, init):
@@ -22,6 +22,7 @@ def validate(config: dict) -> Configuration:
 
 class HashTraitsAction(ActionRunner):
 
+    mutates_input = True  # Can write to payload@ via dot notation
     config: Configuration
 
     async def set_up(self, init):
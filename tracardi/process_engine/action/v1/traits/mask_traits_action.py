@@ -19,6 +19,7 @@ def validate(config: dict) -> Configuration:
 
 class MaskTraitsAction(ActionRunner):
 
+    mutates_input = True  # Can write to payload@ via dot notation
     config: Configuration
 
     async def set_up(self, init):
@@ -13,6 +13,7 @@ from tracardi.domain.session import Session
 from tracardi.exceptions.log_handler import get_logger
 from tracardi.process_engine.tql.utils.dictonary import flatten
 from tracardi.process_engine.action.v1.connectors.api_call.model.configuration import Method
+from tracardi.service.tracardi_http_client import HttpClient
 from .destination_interface import DestinationInterface
 from ...domain.event import Event
 
@@ -88,7 +89,7 @@ class HttpConnector(DestinationInterface):
             timeout = aiohttp.ClientTimeout(total=config.timeout)
             url = str(credentials.url)
 
-            async with aiohttp.ClientSession(timeout=timeout) as session:
+            async with HttpClient(timeout=timeout) as session:
                 params = config.get_params({
                     "data": data,
                     "changes": changed_fields
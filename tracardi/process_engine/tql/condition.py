@@ -1,5 +1,9 @@
 import asyncio
+from functools import lru_cache
 
+from lark.exceptions import UnexpectedInput
+
+from tracardi.config import memory_cache
 from tracardi.service.singleton import Singleton
 from tracardi.service.notation.dot_accessor import DotAccessor
 
@@ -10,14 +14,28 @@ from tracardi.process_engine.tql.transformer.expr_transformer import ExprTransfo
 class Condition(metaclass=Singleton):
 
     def __init__(self):
-        self.parser = Parser(Parser.read('grammar/uql_expr.lark'), start='expr')
+        self.parser = Parser(Parser.read('grammar/uql_expr_lalr.lark'), start='expr', parser='lalr')
+        # A few ambiguous forms (e.g. functions with bare parameters) are only handled by earley.
+        self.fallback_parser = Parser(Parser.read('grammar/uql_expr.lark'), start='expr')
+        # Parsed trees are not mutated by the transformer, so they can be shared between evaluations.
+        self._parse = lru_cache(maxsize=memory_cache.condition_cache_size)(self._parse_condition)
+
+    def _parse_condition(self, condition):
+        try:
+            return self.parser.parse(condition)
+        except UnexpectedInput:
+            return self.fallback_parser.parse(condition)
 
     def parse(self, condition):
-        return self.parser.parse(condition)
+        return self._parse(condition)
+
+    def cache_info(self):
+        return self._parse.cache_info()
+
+    def clear_cache(self):
+        self._parse.cache_clear()
 
     async def evaluate(self, condition, dot: DotAccessor):
-        # todo cache tree
         tree = self.parse(condition)
         await asyncio.sleep(0)
         return ExprTransformer(dot=dot).transform(tree)
-
@@ -3,10 +3,12 @@ from typing import Optional
 from tracardi.config import memory_cache
 from tracardi.domain.event_type_metadata import EventTypeMetadata
 from tracardi.service.decorators.function_memory_cache import async_cache_for
+from tracardi.service.storage.mysql.schema.table import EventMappingTable
 from tracardi.service.storage.mysql.mapping.event_to_event_mapping import map_to_event_mapping
 from tracardi.service.storage.mysql.service.event_mapping_service import EventMappingService
 
-@async_cache_for(memory_cache.event_metadata_cache_ttl)
+@async_cache_for(memory_cache.event_metadata_cache_ttl, stale_ttl=memory_cache.stale_cache_ttl,
+                 invalidated_by=[EventMappingTable.__tablename__])
 async def load_event_mapping(event_type_id: str) -> Optional[EventTypeMetadata]:
     ems = EventMappingService()
 
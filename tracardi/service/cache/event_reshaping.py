@@ -1,12 +1,15 @@
+from tracardi.config import memory_cache
 from typing import List, Optional
 
 from tracardi.domain.event_reshaping_schema import EventReshapingSchema
 from tracardi.service.storage.mysql.mapping.event_reshaping_mapping import map_to_event_reshaping
 from tracardi.service.storage.mysql.service.event_reshaping_service import EventReshapingService
 from tracardi.service.decorators.function_memory_cache import async_cache_for
+from tracardi.service.storage.mysql.schema.table import EventReshapingTable
 
 
-@async_cache_for(5)
+@async_cache_for(memory_cache.event_reshaping_cache_ttl, stale_ttl=memory_cache.stale_cache_ttl,
+                 invalidated_by=[EventReshapingTable.__tablename__])
 async def load_and_convert_reshaping(event_type) -> Optional[List[EventReshapingSchema]]:
     ers = EventReshapingService()
     reshape_schemas = await ers.load_by_event_type(event_type)
@@ -5,8 +5,10 @@ from tracardi.domain.event_to_profile import EventToProfile
 from tracardi.service.storage.mysql.mapping.event_to_profile_mapping import map_to_event_to_profile
 from tracardi.service.storage.mysql.service.event_to_profile_service import EventToProfileMappingService
 from tracardi.service.decorators.function_memory_cache import async_cache_for
+from tracardi.service.storage.mysql.schema.table import EventToProfileMappingTable
 
-@async_cache_for(memory_cache.event_to_profile_coping_ttl)
+@async_cache_for(memory_cache.event_to_profile_coping_ttl, stale_ttl=memory_cache.stale_cache_ttl,
+                 invalidated_by=[EventToProfileMappingTable.__tablename__])
 async def load_event_to_profile(event_type_id: str) -> List[EventToProfile]:
     etpms = EventToProfileMappingService()
     records = await etpms.load_by_type(event_type_id, enabled_only=True)
@@ -1,7 +1,10 @@
+from tracardi.config import memory_cache
 from tracardi.service.decorators.function_memory_cache import async_cache_for
+from tracardi.service.storage.mysql.schema.table import ResourceTable
 from tracardi.domain.resource import Resource
 from tracardi.service.domain import resource as resource_db
 
-@async_cache_for(5)
+@async_cache_for(memory_cache.resource_cache_ttl, stale_ttl=memory_cache.stale_cache_ttl,
+                 invalidated_by=[ResourceTable.__tablename__])
 async def load_resource(resource_id: str) -> Resource:
     return await resource_db.load(resource_id)
\ No newline at end of file
@@ -0,0 +1,63 @@
+from collections import OrderedDict
+from time import perf_counter
+from typing import Optional
+
+from user_agents import parse
+from user_agents.parsers import UserAgent
+
+from tracardi.config import memory_cache
+
+
+class UserAgentCache:
+    """
+    Bounded LRU of parsed user agents. A site sees a small set of distinct user agent strings, so parsing
+    (regex heavy) is done once per string and the parsed object is shared by all requests of the process.
+    Parsed user agents must be treated as read only.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.parse_time = 0.0
+        self._user_agents: OrderedDict[str, UserAgent] = OrderedDict()
+
+    def parse(self, user_agent: Optional[str]) -> Optional[UserAgent]:
+        if not user_agent or not isinstance(user_agent, str):
+            return None
+
+        parsed = self._user_agents.get(user_agent, None)
+        if parsed is not None:
+            self.hits += 1
+            self._user_agents.move_to_end(user_agent)
+            return parsed
+
+        self.misses += 1
+        start = perf_counter()
+        parsed = parse(user_agent)
+        self.parse_time += perf_counter() - start
+
+        self._user_agents[user_agent] = parsed
+        while len(self._user_agents) > self.max_size:
+            self._user_agents.popitem(last=False)
+
+        return parsed
+
+    def clear(self):
+        self._user_agents.clear()
+
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._user_agents),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hit_rate(), 4),
+            "avg_parse_time_ms": round(self.parse_time / self.misses * 1000, 3) if self.misses else 0.0
+        }
+
+
+user_agent_cache = UserAgentCache(max_size=memory_cache.user_agent_cache_size)
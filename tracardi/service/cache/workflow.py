@@ -0,0 +1,104 @@
+from collections import OrderedDict
+from time import time
+from typing import Optional, Tuple, NamedTuple
+
+from tracardi.config import memory_cache
+from tracardi.context import get_context
+from tracardi.domain.flow import Flow
+from tracardi.service.storage.mysql.mapping.workflow_mapping import map_to_workflow_record
+from tracardi.service.storage.mysql.service.workflow_service import WorkflowService
+from tracardi.service.storage.redis_client import AsyncRedisClient
+
+
+class _CachedFlow(NamedTuple):
+    version: int
+    flow: Flow
+    expires: float
+
+
+class WorkflowCache:
+    """
+    Keeps ready to run flows in process memory. Flows are keyed by tenant, deployment mode and flow id.
+
+    Every entry remembers the workflow version it was loaded at (redis counter bumped by WorkflowService
+    on every insert, update and delete). The version is checked on each read, so a workflow published by
+    other process is reloaded on the next event. TTL and max size keep the memory bounded.
+    """
+
+    def __init__(self, ttl: int, max_size: int):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._flows: OrderedDict[Tuple[str, bool, str], _CachedFlow] = OrderedDict()
+
+    @staticmethod
+    def _key(flow_id: str) -> Tuple[str, bool, str]:
+        context = get_context()
+        return context.tenant, context.production, flow_id
+
+    @staticmethod
+    async def _version(flow_id: str) -> int:
+        version = await AsyncRedisClient().get(WorkflowService.version_key(flow_id))
+        return int(version) if version is not None else 0
+
+    def get(self, flow_id: str, version: int) -> Optional[Flow]:
+        key = self._key(flow_id)
+        item = self._flows.get(key, None)
+        if item is None or item.version != version or item.expires < time():
+            return None
+        self._flows.move_to_end(key)
+        return item.flow
+
+    def set(self, flow_id: str, version: int, flow: Flow):
+        key = self._key(flow_id)
+        self._flows[key] = _CachedFlow(version, flow, time() + self.ttl)
+        self._flows.move_to_end(key)
+        while len(self._flows) > self.max_size:
+            self._flows.popitem(last=False)
+
+    def clear(self):
+        self._flows.clear()
+        self.hits = 0
+        self.misses = 0
+
+    async def load(self, flow_id: str) -> Optional[Flow]:
+
+        """
+        Returns a copy of the flow that can be run. Copies share the graph but have separate response and
+        change monitor.
+        """
+
+        version = await self._version(flow_id)
+        flow = self.get(flow_id, version)
+
+        if flow is None:
+            self.misses += 1
+            flow_record = (await WorkflowService().load_by_id(flow_id)).map_to_object(map_to_workflow_record)
+            if not flow_record:
+                return None
+            flow = Flow.from_workflow_record(flow_record)
+            self.set(flow_id, version, flow)
+        else:
+            self.hits += 1
+
+        return flow.copy_for_run()
+
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._flows),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hit_rate(), 4)
+        }
+
+
+workflow_cache = WorkflowCache(ttl=memory_cache.workflow_cache_ttl, max_size=memory_cache.workflow_cache_size)
+
+
+async def load_flow(flow_id: str) -> Optional[Flow]:
+    return await workflow_cache.load(flow_id)
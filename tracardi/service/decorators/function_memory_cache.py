@@ -1,12 +1,91 @@
 import asyncio
-from typing import Dict, Tuple, Any, Callable
+from collections import defaultdict
+from time import time
+from typing import Dict, Tuple, Any, Callable, NamedTuple, Optional, List, Set
 
 import functools
 
+from tracardi.context import get_context
 from tracardi.event_server.utils.memory_cache import MemoryCache, CacheItem
+from tracardi.exceptions.exception import ExpiredException
+from tracardi.exceptions.log_handler import get_logger
+from tracardi.service.storage.redis.collections import Collection
+from tracardi.service.storage.redis_client import AsyncRedisClient
+
+logger = get_logger(__name__)
 
 cache: Dict[str, MemoryCache] = {}
 
+
+class _CachedValue(NamedTuple):
+    data: Any
+    refresh_at: float
+
+
+class _CacheInvalidation:
+    """
+    Clears function caches when the tables they are loaded from change. Changes are published over redis
+    pub/sub so caches on all nodes are cleared, not only on the node that saved the data.
+    """
+
+    def __init__(self):
+        self._tables: Dict[str, Set[str]] = defaultdict(set)
+        self._generations: Dict[str, int] = defaultdict(int)
+        self._task: Optional[asyncio.Task] = None
+        self._loop = None
+        self.subscribed = False
+
+    def register(self, func_key: str, tables: List[str]):
+        for table in tables:
+            self._tables[table].add(func_key)
+
+    def generation(self, func_key: str) -> int:
+        return self._generations[func_key]
+
+    def clear(self, table: str):
+        for func_key in self._tables.get(table, ()):
+            # Loads that started before the change must not store their result.
+            self._generations[func_key] += 1
+            if func_key in cache:
+                cache[func_key].clear()
+
+    def ensure_listening(self):
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done() or self._loop is not loop:
+            self._loop = loop
+            self.subscribed = False
+            self._task = loop.create_task(self._listen())
+
+    async def _listen(self):
+        pubsub = AsyncRedisClient().pubsub(ignore_subscribe_messages=True)
+        try:
+            await pubsub.subscribe(Collection.cache_invalidation)
+            self.subscribed = True
+            async for message in pubsub.listen():
+                if message is None or message['type'] != 'message':
+                    continue
+                table = message['data']
+                self.clear(table.decode() if isinstance(table, bytes) else table)
+        except Exception as e:
+            logger.warning(f"Cache invalidation listener stopped. Caches expire with TTL only. Reason: {str(e)}")
+        finally:
+            self.subscribed = False
+            await pubsub.reset()
+
+    async def invalidate(self, table: str):
+        self.clear(table)
+        try:
+            await AsyncRedisClient().publish(Collection.cache_invalidation, table)
+        except Exception as e:
+            logger.warning(f"Could not publish cache invalidation for {table}. Reason: {str(e)}")
+
+
+cache_invalidation = _CacheInvalidation()
+
+# Loads in progress, keyed by function and arguments.
+_loading: Dict[Tuple[str, str], asyncio.Task] = {}
+
+
 def _args_key(args, kwargs):
     key_parts = [args]
     key_parts.extend(f'{k}={v}' for k, v in kwargs.items())
@@ -17,6 +96,13 @@ def _func_key(func):
     key_parts = [func.__module__, func.__qualname__, ]
     return ':'.join(map(str, key_parts))
 
+
+def _get_cache(func_key, max_size, allow_null_values) -> MemoryCache:
+    if func_key not in cache:
+        cache[func_key] = MemoryCache(func_key, max_pool=max_size, allow_null_values=allow_null_values)
+    return cache[func_key]
+
+
 def _run_function(func, args, kwargs, max_size, allow_null_values, key_func:Callable=None) -> Tuple[Any, str, str]:
     # Construct a unique cache key from the function's module name,
     # function name, args, and kwargs to avoid collisions.
@@ -29,29 +115,93 @@ def _run_function(func, args, kwargs, max_size, allow_null_values, key_func:Call
         args_key = _args_key(args, kwargs)
 
     # Create cache
-    if func_key not in cache:
-        cache[func_key] = MemoryCache(func_key, max_pool=max_size, allow_null_values=allow_null_values)
+    _get_cache(func_key, max_size, allow_null_values)
 
     # Check cache
-    if args_key in cache[func_key]:
-        return cache[func_key][args_key].data, func_key, args_key
+    try:
+        item = cache[func_key][args_key]
+    except ExpiredException:
+        item = None
+
+    if item is not None:
+        return item.data, func_key, args_key
 
     result = func(*args, **kwargs)
 
     return result, func_key, args_key
 
-def async_cache_for(ttl, max_size=1000, allow_null_values=False, key_func:Callable=None):
+
+def _context_key() -> str:
+    try:
+        context = get_context()
+        return f"{context.tenant}:{context.production}"
+    except Exception:
+        return ""
+
+
+async def _load(func, args, kwargs, func_key, args_key, ttl, stale_ttl, max_size, allow_null_values):
+    generation = cache_invalidation.generation(func_key)
+    result = await func(*args, **kwargs)
+    if generation == cache_invalidation.generation(func_key):
+        _get_cache(func_key, max_size, allow_null_values)[args_key] = CacheItem(
+            data=_CachedValue(result, time() + ttl),
+            ttl=ttl + stale_ttl
+        )
+    return result
+
+
+def _refresh_failed(task: asyncio.Task):
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning(f"Could not refresh cache. Stale value is used. Reason: {str(task.exception())}")
+
+
+def _single_flight(func, args, kwargs, func_key, args_key, *params, background: bool = False) -> asyncio.Task:
+    key = (func_key, args_key)
+    task = _loading.get(key, None)
+    if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+        task = asyncio.create_task(_load(func, args, kwargs, func_key, args_key, *params))
+        _loading[key] = task
+        task.add_done_callback(lambda _: _loading.pop(key, None) if _loading.get(key) is task else None)
+        if background:
+            task.add_done_callback(_refresh_failed)
+    return task
+
+
+def async_cache_for(ttl, max_size=1000, allow_null_values=False, key_func:Callable=None, stale_ttl: float = 0,
+                    invalidated_by: Optional[List[str]] = None):
+
+    """
+    Caches the result of async function for `ttl` seconds. Concurrent calls with the same arguments share one
+    call of the function. After `ttl` the cached value is returned for another `stale_ttl` seconds while it is
+    refreshed in the background. Caches are cleared when any of `invalidated_by` tables changes.
+    """
+
     def decorator(func):
+        func_key = _func_key(func)
+        if invalidated_by:
+            cache_invalidation.register(func_key, invalidated_by)
+
         @functools.wraps(func)
         async def async_wrapper(*args, **kwargs):
+            if invalidated_by:
+                cache_invalidation.ensure_listening()
 
-            result, func_key, args_key = _run_function(func, args, kwargs, max_size, allow_null_values, key_func)
-            if asyncio.iscoroutine(result):
-                result = await result
+            args_key = key_func(*args, **kwargs) if key_func is not None else _args_key(args, kwargs)
+            args_key = f"{_context_key()}:{args_key}"
+            params = (ttl, stale_ttl, max_size, allow_null_values)
 
-            # Update cache
-            cache[func_key][args_key] = CacheItem(data=result, ttl=ttl)
-            return result
+            try:
+                item = _get_cache(func_key, max_size, allow_null_values)[args_key]
+            except ExpiredException:
+                item = None
+
+            if item is not None:
+                value: _CachedValue = item.data
+                if time() > value.refresh_at:
+                    _single_flight(func, args, kwargs, func_key, args_key, *params, background=True)
+                return value.data
+
+            return await asyncio.shield(_single_flight(func, args, kwargs, func_key, args_key, *params))
 
         return async_wrapper
 
@@ -78,3 +228,9 @@ def delete_cache(func, *args, **kwargs):
     func_key = _func_key(func)
     cache_item = cache[func_key]
     cache_item.delete(args_key)
+    # Async caches are keyed in context
+    cache_item.delete(f"{_context_key()}:{args_key}")
+
+
+def cache_stats() -> Dict[str, dict]:
+    return {func_key: memory_cache.stats() for func_key, memory_cache in sorted(cache.items())}
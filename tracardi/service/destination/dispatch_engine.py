@@ -0,0 +1,173 @@
+import asyncio
+from collections import defaultdict
+from typing import Optional, List, Any, Dict, NamedTuple
+
+from tracardi.config import tracardi
+from tracardi.context import get_context, ServerContext, Context
+from tracardi.domain import ExtraInfo
+from tracardi.domain.event import Event
+from tracardi.domain.profile import Profile
+from tracardi.domain.session import Session
+from tracardi.exceptions.exception_service import get_traceback
+from tracardi.exceptions.log_handler import get_logger
+from tracardi.process_engine.destination.destination_interface import DestinationInterface
+from tracardi.service.utils.getters import get_entity_id
+
+logger = get_logger(__name__)
+
+
+class DispatchJob(NamedTuple):
+    destination: DestinationInterface
+    data: Any
+    profile: Optional[Profile]
+    session: Optional[Session]
+    event: Optional[Event] = None  # Event dispatch
+    changed_fields: Optional[List[dict]] = None  # Profile dispatch
+
+    def is_event(self) -> bool:
+        return self.event is not None
+
+    def destination_id(self) -> str:
+        return self.destination.destination.id
+
+
+class DestinationDispatchEngine:
+    """
+    Dispatches data to destinations. Jobs are grouped by destination, destinations are dispatched concurrently
+    and every destination has its own concurrency limit.
+
+    In buffered mode jobs are queued and sent in micro batches (max batch_size jobs or batch_wait seconds)
+    by a background worker, outside the request. If the buffer is full the jobs are dispatched inline. Queued
+    jobs must be flushed on shutdown (see tracardi.service.shutdown).
+    """
+
+    def __init__(self, concurrency: int, buffered: bool, batch_size: int, batch_wait: float, buffer_size: int):
+        self.concurrency = max(concurrency, 1)
+        self.buffered = buffered
+        self.batch_size = batch_size
+        self.batch_wait = batch_wait
+        self.buffer_size = buffer_size
+        self._limits: Dict[str, asyncio.Semaphore] = {}
+        self._loop = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    def _limit(self, destination_id: str) -> asyncio.Semaphore:
+        # Semaphores are bound to the event loop
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._limits = {}
+            self._loop = loop
+        if destination_id not in self._limits:
+            self._limits[destination_id] = asyncio.Semaphore(self.concurrency)
+        return self._limits[destination_id]
+
+    @staticmethod
+    def _log_error(e: Exception, job: DispatchJob):
+        logger.error(
+            str(e),
+            extra=ExtraInfo.exact(
+                flow_id=None,
+                node_id=None,
+                event_id=get_entity_id(job.event),
+                profile_id=get_entity_id(job.profile),
+                origin='event-destination' if job.is_event() else 'profile-destination',
+                package=__name__,
+                traceback=get_traceback(e)
+            )
+        )
+
+    async def _dispatch_job(self, job: DispatchJob):
+        async with self._limit(job.destination_id()):
+            try:
+                if job.is_event():
+                    await job.destination.dispatch_event(job.data,
+                                                         profile=job.profile,
+                                                         session=job.session,
+                                                         event=job.event)
+                else:
+                    logger.info(f"Dispatching {job.destination}. Profile id: {get_entity_id(job.profile)}.")
+                    await job.destination.dispatch_profile(job.data,
+                                                           profile=job.profile,
+                                                           session=job.session,
+                                                           changed_fields=job.changed_fields)
+            except Exception as e:
+                self._log_error(e, job)
+
+    async def _dispatch_destination(self, jobs: List[DispatchJob]):
+        await asyncio.gather(*[self._dispatch_job(job) for job in jobs])
+
+    async def _dispatch(self, jobs: List[DispatchJob]):
+        groups = defaultdict(list)
+        for job in jobs:
+            groups[job.destination_id()].append(job)
+        await asyncio.gather(*[self._dispatch_destination(group) for group in groups.values()])
+
+    async def dispatch(self, jobs: List[DispatchJob]):
+        if not jobs:
+            return
+
+        if self.buffered:
+            self._start_worker()
+            context = get_context()
+            for position, job in enumerate(jobs):
+                try:
+                    self._queue.put_nowait((context, job))
+                except asyncio.QueueFull:
+                    logger.warning("Destination buffer is full. Dispatching inline.")
+                    await self._dispatch(jobs[position:])
+                    return
+        else:
+            await self._dispatch(jobs)
+
+    def _start_worker(self):
+        if self._worker is None or self._worker.done() or self._worker.get_loop() is not asyncio.get_running_loop():
+            self._queue = asyncio.Queue(maxsize=self.buffer_size)
+            self._worker = asyncio.create_task(self._run_worker())
+
+    async def _next_batch(self) -> list:
+        batch = [await self._queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.batch_wait
+        while len(batch) < self.batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run_worker(self):
+        while True:
+            batch = await self._next_batch()
+            try:
+                # Jobs must be dispatched in the context (tenant, mode) they were created in.
+                contexts: Dict[str, Context] = {}
+                jobs = defaultdict(list)
+                for context, job in batch:
+                    key = f"{context.tenant}:{context.production}"
+                    contexts[key] = context
+                    jobs[key].append(job)
+                for key, context_jobs in jobs.items():
+                    with ServerContext(contexts[key]):
+                        await self._dispatch(context_jobs)
+            except Exception as e:
+                logger.error(f"Could not dispatch destination batch. Error: {str(e)}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def flush(self):
+        if self._queue is not None and self._worker is not None and not self._worker.done():
+            await self._queue.join()
+
+
+dispatch_engine = DestinationDispatchEngine(
+    concurrency=tracardi.destination_concurrency,
+    buffered=tracardi.destination_dispatch_mode == 'buffered',
+    batch_size=tracardi.destination_batch_size,
+    batch_wait=tracardi.destination_batch_wait / 1000,
+    buffer_size=tracardi.destination_buffer_size
+)
@@ -8,6 +8,7 @@ from tracardi.exceptions.exception_service import get_traceback
 from tracardi.exceptions.log_handler import get_logger
 from tracardi.service.cache.destinations import load_profile_destinations, load_event_destinations
 from tracardi.domain.destination import Destination
+from tracardi.service.destination.dispatch_engine import dispatch_engine, DispatchJob
 from tracardi.service.destination.utils import get_dispatch_destination_and_data
 from tracardi.service.notation.dot_accessor import DotAccessor
 from tracardi.service.utils.getters import get_entity_id
@@ -20,6 +21,7 @@ async def event_destination_dispatch(profile: Optional[Profile],
                                      events: List[Event],
                                      debug):
     dot = DotAccessor(profile, session)
+    jobs = []
     for event in events:
         try:
             # Reads from cache
@@ -30,9 +32,10 @@ async def event_destination_dispatch(profile: Optional[Profile],
 
             dot.set_storage("event", event)
 
+            # Data must be reshaped before the next event is set in dot.
             async for destination_instance, reshaped_data in get_dispatch_destination_and_data(dot, destinations,
                                                                                                debug):
-              await destination_instance.dispatch_event(reshaped_data, profile=profile, session=session, event=event)
+                jobs.append(DispatchJob(destination_instance, reshaped_data, profile, session, event=event))
         except Exception as e:
             logger.error(
                 str(e),
@@ -41,12 +44,15 @@ async def event_destination_dispatch(profile: Optional[Profile],
                     node_id=None,
                     event_id=get_entity_id(event),
                     profile_id=get_entity_id(profile),
-                    origin='profile-destination',
+                    origin='event-destination',
                     package=__name__,
                     traceback=get_traceback(e)
                 )
             )
 
+    await dispatch_engine.dispatch(jobs)
+
+
 async def profile_destination_dispatch(profile: Optional[Profile],
                                        session: Optional[Session],
                                        changed_fields: List[dict],
@@ -55,21 +61,8 @@ async def profile_destination_dispatch(profile: Optional[Profile],
     dot = DotAccessor(profile, session)
     destinations: List[Destination] = await load_profile_destinations()
 
+    jobs = []
     async for destination_instance, reshaped_data in get_dispatch_destination_and_data(dot, destinations, debug):
-        try:
-            logger.info(f"Dispatching {destination_instance}. Profile id: {get_entity_id(profile)}.")
-            await destination_instance.dispatch_profile(reshaped_data, profile=profile, session=session, changed_fields=changed_fields)
-        except Exception as e:
-            logger.error(
-                str(e),
-                extra=ExtraInfo.exact(
-                    flow_id=None,
-                    node_id=None,
-                    event_id=None,
-                    profile_id=get_entity_id(profile),
-                    origin='profile-destination',
-                    package=__name__,
-                    traceback=get_traceback(e)
-                )
-            )
+        jobs.append(DispatchJob(destination_instance, reshaped_data, profile, session, changed_fields=changed_fields))
 
+    await dispatch_engine.dispatch(jobs)
@@ -1,6 +1,10 @@
+import asyncio
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
 from tracardi.config import tracardi
-from tracardi.context import get_context
-from tracardi.exceptions.log_handler import log_handler, get_installation_logger
+from tracardi.context import Context, ServerContext
+from tracardi.exceptions.log_handler import log_handler, get_installation_logger, ElasticLogHandler
 from tracardi.service.license import License
 from tracardi.domain.installation_status import installation_status
 from tracardi.service.storage.driver.elastic import log as log_db
@@ -13,20 +17,107 @@ if License.has_license():
 def logger_guard(logs):
     return bool(logs)
 
-async def save_logs():
 
-    if not tracardi.save_logs:
-        return None
+class LogFlusher:
+    """
+    Saves logs collected by log handler in background. Logs are saved with bulk writes when flush_size logs
+    are buffered or every flush_interval seconds, in the context (tenant, mode) they were logged in. Requests
+    do not wait for logs to be saved.
+    """
+
+    def __init__(self, handler: ElasticLogHandler, flush_size: int, flush_interval: float):
+        self.handler = handler
+        self.flush_size = max(flush_size, 1)
+        self.flush_interval = flush_interval
+        self._worker: Optional[asyncio.Task] = None
+        self._wake: Optional[asyncio.Event] = None
+        self.progress = {
+            "flushes": 0,
+            "saved": 0,
+            "failed": 0,
+            "dropped_no_index": 0
+        }
+
+    def start(self):
+        loop = asyncio.get_running_loop()
+        if self._worker is None or self._worker.done() or self._worker.get_loop() is not loop:
+            self._wake = asyncio.Event()
+            wake = self._wake
+            self.handler.flush_size = self.flush_size
+            self.handler.on_flush_size = lambda: loop.call_soon_threadsafe(wake.set)
+            self._worker = asyncio.create_task(self._run_worker())
 
-    if log_handler.has_logs():
-        logs = log_handler.collection
-        log_handler.reset()
-        if License.has_license():
-            # Runs only if there are logs (see logger_guard) and it is deferred.
-            log_saver_worker(logs)
-        else:
-            if await installation_status.has_logs_index(get_context()):
-                return await log_db.save(logs)
+    async def _run_worker(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Could not save logs. Error: {str(e)}")
+
+    async def _save(self, context: Context, logs: List[dict]):
+        with ServerContext(context):
+            if License.has_license():
+                log_saver_worker(logs)
+                self.progress['saved'] += len(logs)
+            elif await installation_status.has_logs_index(context):
+                for start in range(0, len(logs), self.flush_size):
+                    chunk = logs[start:start + self.flush_size]
+                    try:
+                        await log_db.save(chunk)
+                        self.progress['saved'] += len(chunk)
+                    except Exception as e:
+                        self.progress['failed'] += len(chunk)
+                        logger.error(f"Could not save logs. Error: {str(e)}")
             else:
+                self.progress['dropped_no_index'] += len(logs)
                 logger.warning(
                     "Logs index is not available. Probably system is not installed or being installed or the index went missing.")
+
+    async def flush(self):
+        logs = self.handler.drain()
+        if not logs:
+            return
+
+        self.progress['flushes'] += 1
+
+        # Logs logged outside any context are saved in the default context.
+        grouped: Dict[Tuple[Optional[str], Optional[bool]], List[dict]] = defaultdict(list)
+        for context_key, log in logs:
+            grouped[context_key].append(log)
+
+        for (tenant, production), context_logs in grouped.items():
+            try:
+                context = Context(production=production, tenant=tenant)
+            except ValueError:
+                self.progress['failed'] += len(context_logs)
+                continue
+            await self._save(context, context_logs)
+
+    def stats(self) -> dict:
+        return {
+            **self.handler.stats(),
+            **self.progress
+        }
+
+
+log_flusher = LogFlusher(
+    log_handler,
+    flush_size=tracardi.log_flush_size,
+    flush_interval=tracardi.log_flush_interval / 1000
+)
+
+
+async def save_logs():
+    """
+    Makes sure logs are saved by the background log flusher. Does not wait for logs to be saved.
+    """
+
+    if not tracardi.save_logs:
+        return None
+
+    log_flusher.start()
@@ -2,7 +2,7 @@ from collections import defaultdict
 
 from datetime import datetime
 from pydantic import BaseModel
-from typing import List, Optional, Any
+from typing import List, Optional, Any, Tuple
 from deepdiff import DeepDiff
 from deepdiff.model import DiffLevel
 from dotty_dict import dotty
@@ -134,33 +134,78 @@ def append(base, key, value, strategy: MergingStrategy):
     return base
 
 
-def merge(base: dict, dict_list: List[dict], strategy: MergingStrategy) -> dict:
+def _merge(base: dict, dict_list: List[dict], strategy: MergingStrategy, conflicts: Optional[dict]) -> dict:
     base = dict(base)
     for key in set().union(*dict_list):
-        for data in dict_list:
-            if key in data:
-                # Null
-                if data[key] is None:
-                    continue
-                # Simple types
-                elif isinstance(data[key], (str, int, float, bool, tuple, list, set, BaseModel, datetime)):
-                    append(base, key, data[key], strategy)
-                # Dicts
-                elif type(data[key]) in [dict]:
-                    if key not in base:
-                        base[key] = {}
-                    base[key] = merge(base[key], [data[key]], strategy)
-                # Objects
-                elif isinstance(data[key], object):
-                    raise ValueError("Object of type `{}: {}` can not be merged with value `{}: {}`".format(
-                        key, type(data[key]),
-                        key, base[key] if key in base else base))
-                else:
-                    raise ValueError("Unknown type `{}: {}`".format(key, type(data[key])))
+        # Null values are skipped
+        values = [data[key] for data in dict_list if key in data and data[key] is not None]
+
+        child_conflicts = None
+        if conflicts is not None:
+            if not isinstance(conflicts.get(key, None), dict):
+                conflicts[key] = {}
+            child_conflicts = conflicts[key]
+
+        # Dicts are merged together in one call
+        if values and all(type(value) is dict for value in values):
+            base[key] = _merge(base.get(key, {}), values, strategy, child_conflicts)
+            values = []
+
+        conflicted = False
+
+        if values and all(type(value) is str for value in values) and strategy.default_string_strategy == 'override' \
+                and type(base.get(key, '')) is str:
+            # Strings are overridden, the last one wins.
+            for value in values:
+                if key in base and base[key] != value:
+                    conflicted = True
+                base[key] = value
+            values = []
+        elif len(values) > 1 and key not in base and all(value == values[0] for value in values[1:]):
+            # Equal values are not merged
+            values = values[:1]
+
+        for value in values:
+            # Simple types
+            if isinstance(value, (str, int, float, bool, tuple, list, set, BaseModel, datetime)):
+                if conflicts is not None and base.get(key, None) is not None and base[key] != value:
+                    conflicted = True
+                append(base, key, value, strategy)
+            # Dicts
+            elif type(value) in [dict]:
+                if key not in base:
+                    base[key] = {}
+                base[key] = _merge(base[key], [value], strategy, child_conflicts)
+            # Objects
+            elif isinstance(value, object):
+                raise ValueError("Object of type `{}: {}` can not be merged with value `{}: {}`".format(
+                    key, type(value),
+                    key, base[key] if key in base else base))
+            else:
+                raise ValueError("Unknown type `{}: {}`".format(key, type(value)))
+
+        if conflicts is not None:
+            if conflicted:
+                conflicts[key] = base[key]
+            elif conflicts[key] == {}:
+                del conflicts[key]
 
     return base
 
 
+def merge(base: dict, dict_list: List[dict], strategy: MergingStrategy) -> dict:
+    return _merge(base, dict_list, strategy, None)
+
+
+def merge_with_conflicts(dict_list: List[dict], strategy: MergingStrategy) -> Tuple[dict, dict]:
+    """
+    Merges dicts in one pass. Returns merged dict and conflicts: fields that had different values in the
+    merged dicts, with their merged value.
+    """
+    conflicts = {}
+    return _merge({}, dict_list, strategy, conflicts), conflicts
+
+
 def list_merge(base: List, new_list: List, strategy: MergingStrategy) -> list:
     if base == new_list:
         return new_list
@@ -0,0 +1,197 @@
+import asyncio
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+
+from tracardi.config import tracardi
+from tracardi.context import get_context, ServerContext, Context
+from tracardi.domain.storage_record import RecordMetadata
+from tracardi.exceptions.log_handler import get_logger
+from tracardi.service.storage.driver.elastic import raw as raw_db
+from tracardi.service.storage.refresh_coordinator import refresh_coordinator
+from tracardi.service.tracking.storage.profile_storage import delete_profile
+
+logger = get_logger(__name__)
+
+
+def coalesce(mappings: List[Dict[str, str]]) -> Dict[str, str]:
+    """
+    Joins old profile id -> merged profile id mappings in the order of merges. If merged profile was later
+    merged into another profile, its old ids point to the last one.
+    """
+    profile_ids: Dict[str, str] = {}
+    merged: Dict[str, Set[str]] = defaultdict(set)
+
+    for mapping in mappings:
+        for old_id, new_id in mapping.items():
+            if old_id == new_id:
+                continue
+            # Merged profile is a live profile again
+            if new_id in profile_ids:
+                merged[profile_ids.pop(new_id)].discard(new_id)
+            if old_id in profile_ids:
+                merged[profile_ids[old_id]].discard(old_id)
+            # Profiles merged into old profile move with it
+            for moved_id in merged.pop(old_id, set()):
+                profile_ids[moved_id] = new_id
+                merged[new_id].add(moved_id)
+            profile_ids[old_id] = new_id
+            merged[new_id].add(old_id)
+
+    return profile_ids
+
+
+class ProfileReassignmentEngine:
+    """
+    Moves events and sessions of merged profiles to the merged profile and then deletes the merged profiles. Old
+    profile ids are reassigned with one terms update per index (batch_size ids per update) and indices are
+    refreshed once, after all updates. Refresh is coalesced with other refreshes requested at the same time.
+    Merged profiles are deleted only after their events and sessions are moved, so a lost or failed job leaves
+    duplicated profiles that are merged again, not events and sessions of deleted profiles.
+
+    In background mode merges are queued and all merges queued within batch_wait seconds are coalesced into
+    one job that runs outside the request. If the buffer is full the merge is reassigned inline. Failed jobs
+    are retried with backoff. Queued merges should be flushed on shutdown (see tracardi.service.shutdown).
+    """
+
+    def __init__(self, background: bool, batch_size: int, batch_wait: float, buffer_size: int,
+                 retries: int = 3, retry_wait: float = 1):
+        self.background = background
+        self.batch_size = max(batch_size, 1)
+        self.batch_wait = batch_wait
+        self.buffer_size = buffer_size
+        self.retries = max(retries, 0)
+        self.retry_wait = retry_wait
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self.progress = {
+            "jobs": 0,
+            "failed_jobs": 0,
+            "retried_jobs": 0,
+            "reassigned_profiles": 0,
+            "running": None
+        }
+
+    async def _reassign(self, profile_ids: Dict[str, str], indices: Dict[str, str]):
+        old_ids = list(profile_ids)
+        updates = ('event', 'session')
+        running = {"profiles": len(old_ids), "updates": 0,
+                   "total_updates": len(updates) * ((len(old_ids) - 1) // self.batch_size + 1)}
+        self.progress['running'] = running
+        try:
+            for index in updates:
+                for start in range(0, len(old_ids), self.batch_size):
+                    chunk = {old_id: profile_ids[old_id] for old_id in old_ids[start:start + self.batch_size]}
+                    await raw_db.update_many_profile_ids(index, chunk)
+                    running['updates'] += 1
+                    logger.debug(f"Reassigning merged profiles: {running['updates']}/{running['total_updates']} "
+                                 f"updates done.")
+            await asyncio.gather(refresh_coordinator.refresh('event'), refresh_coordinator.refresh('session'))
+
+            await asyncio.gather(*[delete_profile(old_id, indices[old_id]) for old_id in old_ids
+                                   if old_id in indices])
+            await refresh_coordinator.refresh('profile')
+            self.progress['reassigned_profiles'] += len(old_ids)
+        finally:
+            self.progress['running'] = None
+
+    async def _reassign_with_retries(self, profile_ids: Dict[str, str], indices: Dict[str, str]):
+        for attempt in range(self.retries + 1):
+            try:
+                await self._reassign(profile_ids, indices)
+                self.progress['jobs'] += 1
+                return
+            except Exception as e:
+                if attempt < self.retries:
+                    self.progress['retried_jobs'] += 1
+                    logger.warning(f"Could not reassign events and sessions of merged profiles. Retrying. "
+                                   f"Error: {str(e)}")
+                    await asyncio.sleep(self.retry_wait * 2 ** attempt)
+                else:
+                    self.progress['jobs'] += 1
+                    self.progress['failed_jobs'] += 1
+                    logger.error(f"Could not reassign events and sessions of merged profiles. Merged profiles are "
+                                 f"not deleted. Old to merged profile ids: {profile_ids}. Error: {str(e)}")
+
+    async def reassign(self, old_profiles: List[Tuple[str, RecordMetadata]], merged_profile_id: str):
+        """
+        Moves events and sessions of old profiles (id and record metadata) to the merged profile and deletes
+        old profiles.
+        """
+        profile_ids = {old_id: merged_profile_id for old_id, _ in old_profiles if old_id != merged_profile_id}
+        if not profile_ids:
+            return
+        indices = {old_id: metadata.index for old_id, metadata in old_profiles if old_id in profile_ids}
+
+        if self.background:
+            self._start_worker()
+            try:
+                self._queue.put_nowait((get_context(), profile_ids, indices))
+                return
+            except asyncio.QueueFull:
+                logger.warning("Profile reassignment buffer is full. Reassigning inline.")
+
+        try:
+            await self._reassign(profile_ids, indices)
+        except Exception:
+            self.progress['failed_jobs'] += 1
+            raise
+        finally:
+            self.progress['jobs'] += 1
+
+    def _start_worker(self):
+        if self._worker is None or self._worker.done() or self._worker.get_loop() is not asyncio.get_running_loop():
+            self._queue = asyncio.Queue(maxsize=self.buffer_size)
+            self._worker = asyncio.create_task(self._run_worker())
+
+    async def _next_batch(self) -> list:
+        batch = [await self._queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.batch_wait
+        while True:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run_worker(self):
+        while True:
+            batch = await self._next_batch()
+            try:
+                # Profiles must be reassigned in the context (tenant, mode) they were merged in.
+                contexts: Dict[str, Context] = {}
+                mappings = defaultdict(list)
+                indices: Dict[str, Dict[str, str]] = defaultdict(dict)
+                for context, profile_ids, profile_indices in batch:
+                    key = f"{context.tenant}:{context.production}"
+                    contexts[key] = context
+                    mappings[key].append(profile_ids)
+                    indices[key].update(profile_indices)
+                for key, context_mappings in mappings.items():
+                    with ServerContext(contexts[key]):
+                        await self._reassign_with_retries(coalesce(context_mappings), indices[key])
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def flush(self):
+        if self._queue is not None and self._worker is not None and not self._worker.done():
+            await self._queue.join()
+
+    def stats(self) -> dict:
+        return {
+            **self.progress,
+            "queued_merges": self._queue.qsize() if self._queue is not None else 0
+        }
+
+
+reassignment_engine = ProfileReassignmentEngine(
+    background=tracardi.merge_reassignment_mode == 'background',
+    batch_size=tracardi.merge_reassignment_batch_size,
+    batch_wait=tracardi.merge_reassignment_batch_wait / 1000,
+    buffer_size=tracardi.merge_reassignment_buffer_size,
+    retries=tracardi.merge_reassignment_retries
+)
@@ -1,30 +1,161 @@
 import re
-from typing import Union
+from functools import lru_cache
+from typing import Union, Optional, Tuple
 
 from dotty_dict import dotty
+from dotty_dict.dotty_dict import Dotty
 from pydantic import BaseModel
+from pydantic_core import to_jsonable_python
 
 dot_notation_regex = re.compile(
     r"(?:payload|profile|event|session|flow|memory)@([\[\]0-9a-zA-a_\-\.]+(?<![\.\[])|\.\.\.)")
 
+_sources = ('profile', 'event', 'payload', 'session', 'flow', 'memory')
+
 
 class NotDotNotation:
     pass
 
 
+@lru_cache(maxsize=4096)
+def compile_dot_notation(dot_notation: str) -> Optional[Tuple[str, str]]:
+    """
+    Splits dot notation into source and path, e.g. `profile@data.name` -> ('profile', 'data.name').
+    Returns None if the string does not start with a known source.
+    """
+    source, separator, path = dot_notation.partition('@')
+    if not separator or source not in _sources:
+        return None
+    return source, path
+
+
+@lru_cache(maxsize=4096)
+def _split_path(key: str) -> Tuple[str, ...]:
+    # Same as Dotty._split for separator `.` and escape char `\`
+    key = key.replace('\\\\.', '<#skp#>.').replace('\\.', '<#esc#>')
+    return tuple(k.replace('<#esc#>', '.').replace('<#skp#>', '\\') for k in key.split('.'))
+
+
+class _CompiledPathDotty(Dotty):
+    """
+    Dotty that splits every path only once.
+    """
+
+    def _split(self, key):
+        if not isinstance(key, str):
+            return [key]
+        # Dotty consumes the list
+        return list(_split_path(key))
+
+
+class _NotResolved(Exception):
+    pass
+
+
+def _resolve(data: BaseModel, keys: Tuple[str, ...]):
+    """
+    Reads a scalar directly from the model and returns it as it would be in model_dump(mode="json").
+    Raises _NotResolved for paths that need the dump (missing keys, slices, custom serialization, etc.)
+    """
+    last = len(keys) - 1
+    for position, key in enumerate(keys):
+        if isinstance(data, BaseModel):
+            model = type(data)
+            field = model.model_fields.get(key, None)
+            if field is None or field.alias or field.exclude \
+                    or model.__pydantic_decorators__.field_serializers \
+                    or model.__pydantic_decorators__.model_serializers:
+                raise _NotResolved()
+            data = getattr(data, key)
+        elif isinstance(data, dict) and key in data:
+            data = data[key]
+        elif isinstance(data, list) and key.isdigit() and int(key) < len(data):
+            data = data[int(key)]
+            # Dotty reports falsy list items as missing
+            if not data and position == last:
+                raise _NotResolved()
+        else:
+            raise _NotResolved()
+    if isinstance(data, (BaseModel, dict, list, tuple, set)):
+        # Plugins modify returned containers in place, so they must come from the dumped source.
+        raise _NotResolved()
+    return to_jsonable_python(data)
+
+
+def _dotty(data: dict) -> Dotty:
+    return _CompiledPathDotty(data, separator='.', esc_char='\\')
+
+
+class _LazyStorage:
+    """
+    Storage view that converts the source on first access.
+    """
+
+    def __init__(self, accessor: 'DotAccessor'):
+        self._accessor = accessor
+
+    def keys(self):
+        return [f"{source}@" for source in _sources]
+
+    def __contains__(self, item):
+        return item in self.keys()
+
+    def __getitem__(self, item):
+        if item not in self:
+            raise KeyError(item)
+        return getattr(self._accessor, item[:-1])
+
+    def __setitem__(self, item, value):
+        if item not in self:
+            raise KeyError(item)
+        setattr(self._accessor, item[:-1], value)
+
+
+def _source_property(source: str) -> property:
+
+    def getter(self: 'DotAccessor'):
+        if source not in self._converted:
+            self._converted[source] = self._convert(self._data.pop(source), source)
+        return self._converted[source]
+
+    def setter(self: 'DotAccessor', value):
+        self._data.pop(source, None)
+        self._converted[source] = value
+
+    return property(getter, setter)
+
+
 class DotAccessor:
+    """
+    Sources are converted to dotty dicts on first access. Scalar reads from pydantic models are resolved against
+    the model without dumping it. Sources that are not referenced are never dumped.
+    """
+
+    profile = _source_property('profile')
+    session = _source_property('session')
+    event = _source_property('event')
+    payload = _source_property('payload')
+    flow = _source_property('flow')
+    memory = _source_property('memory')
 
     @staticmethod
     def validate(dot_notation: str) -> bool:
         return dot_notation_regex.match(dot_notation) is not None
 
+    @staticmethod
+    def _check(data, label):
+        if data is not None and not isinstance(data, (dict, BaseModel)):
+            raise ValueError("Could not convert {} to dict. Expected: None, dict or BaseModel got {}.".format(
+                label, type(data)
+            ))
+
     def _convert(self, data, label):
         if data is None:
             return {}
         elif isinstance(data, dict):
-            return dotty(data)
+            return _dotty(data)
         elif isinstance(data, BaseModel):
-            return dotty(data.model_dump(mode="json"))
+            return _dotty(data.model_dump(mode="json"))
         else:
             raise ValueError("Could not convert {} to dict. Expected: None, dict or BaseModel got {}.".format(
                 label, type(data)
@@ -37,18 +168,9 @@ class DotAccessor:
         return object.to_dict()
 
     def get_all(self, dot_notation):
-        if dot_notation.startswith('flow@...'):
-            return self.convert_to_dict(self.flow)
-        elif dot_notation.startswith('profile@...'):
-            return self.convert_to_dict(self.profile)
-        elif dot_notation.startswith('session@...'):
-            return self.convert_to_dict(self.session)
-        elif dot_notation.startswith('payload@...'):
-            return self.convert_to_dict(self.payload)
-        elif dot_notation.startswith('event@...'):
-            return self.convert_to_dict(self.event)
-        elif dot_notation.startswith('memory@...'):
-            return self.convert_to_dict(self.memory)
+        compiled = compile_dot_notation(dot_notation)
+        if compiled is not None and compiled[1].startswith('...'):
+            return self.convert_to_dict(getattr(self, compiled[0]))
 
         return None
 
@@ -57,8 +179,15 @@ class DotAccessor:
             value = dot_notation[len(prefix):]
             try:
                 if isinstance(value, str):
-                    if value in self.storage[prefix]:
-                        return self.storage[prefix][value]
+                    data = self._data.get(prefix[:-1], None)
+                    if isinstance(data, BaseModel):
+                        try:
+                            return _resolve(data, _split_path(value))
+                        except _NotResolved:
+                            pass
+                    storage = self.storage[prefix]
+                    if value in storage:
+                        return storage[value]
                     else:
                         raise KeyError(f"No key {value} in {prefix}")
                 return value
@@ -74,21 +203,18 @@ class DotAccessor:
         return NotDotNotation()
 
     def __init__(self, profile=None, session=None, payload=None, event=None, flow=None, memory=None):
-        self.flow = self._convert(flow, 'flow')
-        self.event = self._convert(event, 'event')
-        self.payload = self._convert(payload, 'payload')
-        self.session = self._convert(session, 'session')
-        self.profile = self._convert(profile, 'profile')
-        self.memory = self._convert(memory, 'memory')
-
-        self.storage = {
-            'profile@': self.profile,
-            'event@': self.event,
-            'payload@': self.payload,
-            'session@': self.session,
-            'flow@': self.flow,
-            'memory@': self.memory,
+        self._data = {
+            'flow': flow,
+            'event': event,
+            'payload': payload,
+            'session': session,
+            'profile': profile,
+            'memory': memory
         }
+        for label, data in self._data.items():
+            self._check(data, label)
+        self._converted = {}
+        self.storage = _LazyStorage(self)
 
     def set_storage(self, name, data):
 
@@ -96,34 +222,8 @@ class DotAccessor:
         if storage not in self.storage.keys():
             raise ValueError("Unknown storage")
 
-        if name == 'profile':
-            self.profile = data
-        elif name == 'event':
-            self.event = data
-        elif name == 'session':
-            self.session = data
-        elif name == 'flow':
-            self.flow = data
-        elif name == 'payload':
-            self.payload = data
-        elif name == 'memory':
-            self.memory = data
-
         self.storage[storage] = self._convert(data, name)
 
-        if name == 'profile':
-            self.profile = self.storage[storage]
-        elif name == 'event':
-            self.event = self.storage[storage]
-        elif name == 'session':
-            self.session = self.storage[storage]
-        elif name == 'flow':
-            self.flow = self.storage[storage]
-        elif name == 'payload':
-            self.payload = self.storage[storage]
-        elif name == 'memory':
-            self.memory = self.storage[storage]
-
     @staticmethod
     def source(key):
         if key.startswith('profile@'):
@@ -202,17 +302,17 @@ class DotAccessor:
                 dot_notation = dot_notation.strip("`")
                 cast = True
 
-            all_data = self.get_all(dot_notation)
+            compiled = compile_dot_notation(dot_notation)
 
-            if all_data is not None:
-                return all_data
+            if compiled is not None:
+                source, path = compiled
+                if path.startswith('...'):
+                    return self.convert_to_dict(getattr(self, source))
 
-            for prefix in self.storage.keys():
-                value = self._get_value(dot_notation, prefix)
-                if not isinstance(value, NotDotNotation):
-                    if value is None:
-                        return None
-                    return self.cast(value) if cast else value
+                value = self._get_value(dot_notation, f"{source}@")
+                if value is None:
+                    return None
+                return self.cast(value) if cast else value
 
         return self.cast(dot_notation) if cast else dot_notation
 
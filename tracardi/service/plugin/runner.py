@@ -44,6 +44,17 @@ class ActionRunner:
     ux: list = None
     join = None
 
+    # Opt in for instance pooling. Pooled plugin is reused between runs of the same workflow version. Its set_up
+    # is called once, and close only when the instance is evicted from the pool. It must not keep the state of
+    # one run in the instance or must clear it in `reset`.
+    pooled: bool = False
+
+    # Payloads are passed between nodes by reference. Plugin that changes its input payload in place must opt in
+    # for a private deep copy of the payload, otherwise it will change the payload of other nodes.
+    mutates_input: bool = False
+    _is_set_up: bool = False
+    _pooled_at: Optional[float] = None
+
     @final
     def __init__(self):
         pass
@@ -51,6 +62,9 @@ class ActionRunner:
     async def set_up(self, init):
         pass
 
+    async def reset(self):
+        pass
+
     async def run(self, payload: dict, in_edge=None):
         pass
 
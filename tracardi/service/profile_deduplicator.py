@@ -4,6 +4,7 @@ from tracardi.domain.storage_record import StorageRecord, RecordMetadata
 from tracardi.service.profile_merger import ProfileMerger
 from tracardi.service.tracking.storage.profile_storage import save_profile
 from tracardi.service.storage.driver.elastic import profile as profile_db
+from tracardi.service.storage.refresh_coordinator import refresh_coordinator
 
 async def deduplicate_profile(profile_id: str, profile_ids:List[str] = None):
 
@@ -24,6 +25,7 @@ async def deduplicate_profile(profile_id: str, profile_ids:List[str] = None):
             first_profile.metadata.system.remove_merging_data()
             first_profile.mark_for_update()
             await save_profile(first_profile, refresh=True)
+            await refresh_coordinator.refresh('profile')
 
         # If 1 then there is no duplication
         return first_profile
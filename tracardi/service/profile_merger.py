@@ -1,17 +1,13 @@
-import asyncio
-from dotty_dict import Dotty
-
-from tracardi.service.tracking.storage.profile_storage import save_profile, delete_profile
+from tracardi.service.tracking.storage.profile_storage import save_profile
 
 from tracardi.domain.profile_data import ProfileData
-from .storage.elastic.interface.event import refresh_event_db
-from .storage.elastic.interface.session import refresh_session_db
+from .merging.reassignment_engine import reassignment_engine
+from .storage.refresh_coordinator import refresh_coordinator
 
 from ..context import get_context
 from ..domain import ExtraInfo
 from ..domain.storage_record import RecordMetadata
 from tracardi.service.storage.driver.elastic import profile as profile_db
-from tracardi.service.storage.driver.elastic import raw as raw_db
 from datetime import datetime
 from typing import Optional, List, Dict, Tuple
 from pydantic.v1.utils import deep_update
@@ -24,7 +20,7 @@ from ..exceptions.log_handler import get_logger
 
 from ..service.dot_notation_converter import DotNotationConverter
 
-from tracardi.service.merging.merger import merge as dict_merge, get_conflicted_values, MergingStrategy
+from tracardi.service.merging.merger import merge_with_conflicts, MergingStrategy
 
 
 logger = get_logger(__name__)
@@ -41,19 +37,10 @@ async def _copy_duplicated_profiles_ids_to_merged_profile_ids(merged_profile: Pr
     return merged_profile
 
 
-async def _move_profile_events_and_sessions(duplicate_profiles: List[Profile], merged_profile: Profile):
-    for old_profile in duplicate_profiles:
-        if old_profile.id != merged_profile.id:
-            await raw_db.update_profile_ids('event', old_profile.id, merged_profile.id)
-            await refresh_event_db()
-            await raw_db.update_profile_ids('session', old_profile.id, merged_profile.id)
-            await refresh_session_db()
-
-
-async def _delete_profiles(profile_ids: List[Tuple[str, RecordMetadata]]):
-    tasks = [asyncio.create_task(delete_profile(profile_id, metadata.index))
-             for profile_id, metadata in profile_ids]
-    return await asyncio.gather(*tasks)
+async def _move_profile_events_and_sessions_and_delete(profiles: List[Tuple[str, RecordMetadata]],
+                                                       merged_profile: Profile):
+    # Duplicated profiles are deleted after their events and sessions are moved.
+    await reassignment_engine.reassign(profiles, merged_profile.id)
 
 
 class ProfileMerger:
@@ -139,31 +126,24 @@ class ProfileMerger:
         return updated_mapping
 
     def _merge_traits_and_data(self, profiles, merging_strategy: MergingStrategy):
-        _traits = [profile.traits for profile in profiles]
-        _data = [profile.data.model_dump(mode='json') for profile in profiles]
-
-        old_value = {
-            'traits': _traits,
-            "data": _data
-        }
+        traits, traits_conflicts = merge_with_conflicts([profile.traits for profile in profiles], merging_strategy)
+        data, data_conflicts = merge_with_conflicts([profile.data.model_dump(mode='json') for profile in profiles],
+                                                    merging_strategy)
 
-        new_value = {
-            'traits': dict_merge({}, _traits, merging_strategy),
-            'data': dict_merge({}, _data, merging_strategy)
-        }
-
-        conflicts_aux = get_conflicted_values(old_value, new_value)
+        conflicts_aux = {}
+        if traits_conflicts:
+            conflicts_aux['traits'] = traits_conflicts
+        if data_conflicts:
+            conflicts_aux['data'] = data_conflicts
 
         # This is the fix for merging error on location
-        flat_new_values = Dotty(new_value)
-        if 'data.devices.last.geo.location' in flat_new_values:
-            del(flat_new_values['data.devices.last.geo.location'])
-            if 'data.devices.last.geo.latitude' in flat_new_values and 'data.devices.last.geo.longitude' in flat_new_values:
-                flat_new_values['data.devices.last.geo.location'] = [flat_new_values['data.devices.last.geo.latitude'], flat_new_values['data.devices.last.geo.longitude']]
-            new_value = flat_new_values.to_dict()
+        geo = data.get('devices', {}).get('last', {}).get('geo', {})
+        if isinstance(geo, dict) and 'location' in geo:
+            del geo['location']
+            if 'latitude' in geo and 'longitude' in geo:
+                geo['location'] = [geo['latitude'], geo['longitude']]
 
-        traits = new_value['traits']
-        data = ProfileData(**new_value['data'])
+        data = ProfileData(**data)
 
         return traits, data, conflicts_aux
 
@@ -345,17 +325,18 @@ class ProfileMerger:
             # Auto refresh db
             await save_profile(merged_profile, refresh=True)
 
-            # Schedule - move events from duplicated profiles
-            await _move_profile_events_and_sessions(duplicate_profiles, merged_profile)
-
-            # Schedule - mark duplicated profiles
             records_to_delete: List[Tuple[str, RecordMetadata]] = [(profile.id, profile.get_meta_data())
                                                                    for profile in duplicate_profiles]
 
             logger.debug(f"Profiles to delete {records_to_delete}.",
                          extra=ExtraInfo.build(origin="merging", object=self))
 
-            await _delete_profiles(records_to_delete)
+            # Schedule - move events from duplicated profiles and delete them
+            await _move_profile_events_and_sessions_and_delete(records_to_delete, merged_profile)
+
+            # Merges and deduplication find duplicates by search, so they must see the merged profile. Waits for
+            # the coalesced refresh.
+            await refresh_coordinator.refresh('profile')
 
             # Replace current profile with merged profile
             return merged_profile
@@ -0,0 +1,23 @@
+from tracardi.exceptions.log_handler import get_installation_logger
+from tracardi.service.destination.dispatch_engine import dispatch_engine
+from tracardi.service.merging.reassignment_engine import reassignment_engine
+
+logger = get_installation_logger(__name__)
+
+
+async def shutdown():
+    """
+    Finishes background work queued in this process. Must be awaited on application shutdown, before the
+    event loop is closed.
+    """
+
+    # Duplicated profiles are already deleted, their events and sessions must be moved.
+    try:
+        await reassignment_engine.flush()
+    except Exception as e:
+        logger.error(f"Could not finish reassigning merged profiles. Error: {str(e)}")
+
+    try:
+        await dispatch_engine.flush()
+    except Exception as e:
+        logger.error(f"Could not dispatch buffered destination data. Error: {str(e)}")
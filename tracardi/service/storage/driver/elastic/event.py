@@ -6,6 +6,7 @@ from tracardi.domain.named_entity import NamedEntity
 
 from tracardi.domain.storage_aggregate_result import StorageAggregateResult
 from tracardi.domain.storage_record import StorageRecords, StorageRecord
+from tracardi.domain.value_object.bulk_insert_result import BulkInsertResult
 from tracardi.exceptions.log_handler import get_logger
 from tracardi.service.storage.elastic_storage import ElasticFiledSort
 from tracardi.service.storage.factory import storage_manager, StorageForBulk
@@ -25,6 +26,10 @@ async def save(events: Union[List[Event], Set[Event]], exclude=None):
     return await storage_manager("event").upsert(events, exclude=exclude)
 
 
+async def save_in_chunks(events: List[Event], chunk_size: int) -> BulkInsertResult:
+    return await storage_manager("event").upsert_in_chunks(events, chunk_size, exclude={"operation": ...})
+
+
 async def delete_by_id(id: str) -> dict:
     sm = storage_manager("event")
     # Delete in all indices
@@ -3,6 +3,7 @@ from typing import Union, Tuple
 from tracardi.domain.profile import *
 from tracardi.config import elastic
 from tracardi.domain.storage_record import StorageRecord, StorageRecords
+from tracardi.domain.value_object.bulk_insert_result import BulkInsertResult
 from tracardi.exceptions.log_handler import get_logger
 from tracardi.service.storage.driver.elastic import raw as raw_db
 from tracardi.service.storage.elastic_storage import ElasticFiledSort
@@ -216,6 +217,12 @@ async def save(profile: Union[Profile, List[Profile], Set[Profile]], refresh_aft
     return result
 
 
+async def save_in_chunks(profiles: List[Profile], chunk_size: int) -> BulkInsertResult:
+    for profile in profiles:
+        profile.mark_for_update()
+    return await storage_manager('profile').upsert_in_chunks(profiles, chunk_size, exclude={"operation": ...})
+
+
 async def save_all(profiles: List[Profile]):
     return await storage_manager("profile").upsert(profiles, exclude={"operation": ...})
 
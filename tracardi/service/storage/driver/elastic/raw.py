@@ -1,4 +1,4 @@
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, Dict
 from elasticsearch import NotFoundError
 from tracardi.domain.storage_record import StorageRecords
 from tracardi.domain.value_object.bulk_insert_result import BulkInsertResult
@@ -89,6 +89,28 @@ async def update_profile_ids(index: str, old_profile_id: str, merged_profile_id)
     return await storage_manager(index=index).update_by_query(query=query)
 
 
+async def update_many_profile_ids(index: str, profile_ids: Dict[str, str]):
+    """
+    Sets profile.id to profile_ids[profile.id] for all records of old profile ids in one update.
+    """
+    query = {
+        "script": {
+            "source": "ctx._source.profile.id = params.ids[ctx._source.profile.id]",
+            "lang": "painless",
+            "params": {
+                "ids": profile_ids
+            }
+        },
+        "query": {
+            "terms": {
+                "profile.id": list(profile_ids)
+            }
+        }
+    }
+
+    return await storage_manager(index=index).update_by_query(query=query)
+
+
 async def count_by_query(index: str, query: str, time_span: int) -> StorageRecords:
     result = await storage_manager(index).storage.count_by_query_string(
         query,
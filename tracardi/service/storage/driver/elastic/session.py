@@ -18,6 +18,10 @@ async def save(session: Union[Session, List[Session], Set[Session]]) -> BulkInse
     return await storage_manager('session').upsert(session, exclude={"operation": ...})
 
 
+async def save_in_chunks(sessions: List[Session], chunk_size: int) -> BulkInsertResult:
+    return await storage_manager('session').upsert_in_chunks(sessions, chunk_size, exclude={"operation": ...})
+
+
 async def exist(id: str) -> bool:
     return await storage_manager("session").exists(id)
 
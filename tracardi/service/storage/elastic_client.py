@@ -125,7 +125,7 @@ class ElasticClient:
 
             repeats -= 1
 
-    async def insert(self, index, records, repeats: int = 3) -> BulkInsertResult:
+    async def insert(self, index, records, repeats: int = 3, chunk_size: int = 500) -> BulkInsertResult:
 
         if not isinstance(records, list):
             raise ValueError("Insert expects payload to be list.")
@@ -154,7 +154,7 @@ class ElasticClient:
         last_exception = None
         while repeats > 0:
             try:
-                success, errors = await helpers.async_bulk(self._client, bulk)
+                success, errors = await helpers.async_bulk(self._client, bulk, chunk_size=chunk_size)
                 return BulkInsertResult(
                     saved=success,
                     errors=errors,
@@ -151,6 +151,21 @@ class ElasticStorage:
             records = [record]
         return await self.storage.insert(index, records)
 
+    async def create_in_chunks(self, data: Union[list, set], chunk_size: int,
+                               replace_id: bool = True, exclude=None) -> BulkInsertResult:
+        """
+        Saves records with bulk requests of chunk_size documents. Records may have different target indices.
+        """
+        records_by_index = defaultdict(list)
+        for row in data:
+            index = self.get_storage_index(row)
+            records_by_index[index].append(self._get_storage_record(row, exclude=exclude, replace_id=replace_id))
+
+        result = BulkInsertResult()
+        for index, records in records_by_index.items():
+            result += await self.storage.insert(index, records, chunk_size=chunk_size)
+        return result
+
     async def delete(self, id: str, index: str):
         if index is None:
             raise ValueError("Index can not be None when deleting data.")
@@ -1,44 +1,100 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from contextlib import asynccontextmanager
+from time import perf_counter
+from typing import AsyncIterator
+
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, AsyncEngine
 from sqlalchemy.orm import sessionmaker
 
 from tracardi.config import mysql
 from tracardi.service.singleton import Singleton
 
 
+class PoolWaitStats:
+
+    """
+    Time spent waiting for a connection from the pool.
+    """
+
+    def __init__(self):
+        self.checkouts = 0
+        self.total_wait = 0.
+        self.max_wait = 0.
+
+    def add(self, wait: float):
+        self.checkouts += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+
+    def report(self) -> dict:
+        return {
+            "checkouts": self.checkouts,
+            "avg_wait_ms": round(self.total_wait / self.checkouts * 1000, 3) if self.checkouts else 0,
+            "max_wait_ms": round(self.max_wait * 1000, 3)
+        }
+
+
 class AsyncMySqlEngine(metaclass=Singleton):
 
     def __init__(self, echo: bool = None):
         self.default = None
         self.engines = {}
+        self.sessions = {}
         self.echo = mysql.mysql_echo if echo is None else echo
+        self.pool_wait = PoolWaitStats()
+
+    def get_session(self, async_engine):
+        if async_engine not in self.sessions:
+            self.sessions[async_engine] = sessionmaker(
+                bind=async_engine,
+                class_=AsyncSession,
+                expire_on_commit=False
+            )
+        return self.sessions[async_engine]
 
-    @staticmethod
-    def get_session(async_engine):
-        return sessionmaker(
-            bind=async_engine,
-            class_=AsyncSession,
-            expire_on_commit=False
-        )
+    @asynccontextmanager
+    async def session(self, async_engine: AsyncEngine) -> AsyncIterator[AsyncSession]:
+        """
+        Opens session with a transaction. Time spent waiting for the pooled connection is recorded.
+        """
+        async with self.get_session(async_engine)() as session:
+            async with session.begin():
+                start = perf_counter()
+                await session.connection()
+                self.pool_wait.add(perf_counter() - start)
+                yield session
+
+    def _create_engine(self, url: str) -> AsyncEngine:
+        return create_async_engine(
+            url,
+            pool_size=mysql.mysql_pool_size,
+            max_overflow=mysql.mysql_max_overflow,
+            pool_timeout=mysql.mysql_pool_timeout,
+            pool_recycle=mysql.mysql_pool_recycle,
+            query_cache_size=mysql.mysql_query_cache_size,
+            echo=self.echo)
 
     def get_engine(self):
         if self.default is None:
-            self.default = create_async_engine(
-                mysql.mysql_database_uri,
-                pool_size=3,
-                max_overflow=2,
-                pool_timeout=10,
-                pool_recycle=1800,
-                echo=self.echo)
+            self.default = self._create_engine(mysql.mysql_database_uri)
         return self.default
 
     def get_engine_for_database(self):
         if mysql.mysql_database not in self.engines:
             db_url = f"{mysql.mysql_database_uri}/{mysql.mysql_database}"
-            self.engines[mysql.mysql_database] = create_async_engine(
-                db_url,
-                pool_size=3,
-                max_overflow=2,
-                pool_timeout=10,
-                pool_recycle=1800,
-                echo=self.echo)
+            self.engines[mysql.mysql_database] = self._create_engine(db_url)
         return self.engines[mysql.mysql_database]
+
+    def stats(self) -> dict:
+        pool = None
+        statements = 0
+        engine = self.engines.get(mysql.mysql_database, None)
+        if engine is not None:
+            pool = engine.pool.status()
+            # Compiled statement cache of SQLAlchemy
+            compiled_cache = engine.sync_engine._compiled_cache
+            statements = len(compiled_cache) if compiled_cache is not None else 0
+        return {
+            "pool": pool,
+            "wait": self.pool_wait.report(),
+            "compiled_statements": statements
+        }
@@ -3,6 +3,7 @@ from typing import Optional, Type, Callable, Tuple, TypeVar
 from sqlalchemy.dialects.mysql import insert
 
 from tracardi.exceptions.log_handler import get_logger
+from tracardi.service.decorators.function_memory_cache import cache_invalidation
 from tracardi.service.license import License, LICENSE
 from tracardi.service.singleton import Singleton
 from tracardi.service.storage.mysql.engine import AsyncMySqlEngine
@@ -41,24 +42,21 @@ class TableService(metaclass=Singleton):
                                          one_record: bool = False
                                          ) -> SelectResult:
 
-        local_session = self.client.get_session(self.engine)
-        async with local_session() as session:
-            # Start a new transaction
-            async with session.begin():
-                # Use SQLAlchemy core to perform an asynchronous query
-
-                resource = MysqlQueryInDeploymentMode(session)
-                result = await resource.select(table,
-                                               columns,
-                                               where,
-                                               order_by,
-                                               limit,
-                                               offset,
-                                               distinct)
-                # Fetch all results
-                if one_record:
-                    return SelectResult(result.one_or_none())
-                return SelectResult(result.all())
+        async with self.client.session(self.engine) as session:
+            # Use SQLAlchemy core to perform an asynchronous query
+
+            resource = MysqlQueryInDeploymentMode(session)
+            result = await resource.select(table,
+                                           columns,
+                                           where,
+                                           order_by,
+                                           limit,
+                                           offset,
+                                           distinct)
+            # Fetch all results
+            if one_record:
+                return SelectResult(result.one_or_none())
+            return SelectResult(result.all())
 
     async def _load_by_id_in_deployment_mode(self,
                                              table: Type[Base],
@@ -67,28 +65,24 @@ class TableService(metaclass=Singleton):
 
         where = where_tenant_and_mode_context(table, table.id == primary_id)
 
-        local_session = self.client.get_session(self.engine)
-        async with local_session() as session:
-            # Start a new transaction
-            async with session.begin():
-                # Use SQLAlchemy core to perform an asynchronous query
-                return await self._select_in_deployment_mode(
-                    table=table,
-                    where=where,
-                    one_record=True
-                )
+        return await self._select_in_deployment_mode(
+            table=table,
+            where=where,
+            one_record=True
+        )
 
     async def _delete_by_id_in_deployment_mode(self,
                                                table: Type[Base],
                                                mapper: Callable[[Base], T],
                                                primary_id: str) -> Tuple[bool, Optional[T]]:
 
-        local_session = self.client.get_session(self.engine)
-        async with local_session() as session:
-            async with session.begin():
-                resource = MysqlQueryInDeploymentMode(session)
-                deleted, record = await resource.delete_by_id(table, primary_id)
-                return deleted, record.map_to_object(mapper)
+        async with self.client.session(self.engine) as session:
+            resource = MysqlQueryInDeploymentMode(session)
+            deleted, record = await resource.delete_by_id(table, primary_id)
+            record = record.map_to_object(mapper)
+
+        await cache_invalidation.invalidate(table.__tablename__)
+        return deleted, record
 
     async def _load_all_in_deployment_mode(self, table,
                                            search: Optional[str] = None,
@@ -110,14 +104,11 @@ class TableService(metaclass=Singleton):
                                                      offset=offset)
 
     async def exists(self, table_name: str) -> bool:
-        local_session = self.client.get_session(self.engine)
-
-        async with local_session() as session:
-            async with session.begin():
-                # Use a raw SQL query to check for table existence
-                query = text(f"SHOW TABLES LIKE '{table_name}';")
-                result = await session.execute(query)
-                return result.scalar() is not None
+        async with self.client.session(self.engine) as session:
+            # Use a raw SQL query to check for table existence
+            query = text("SHOW TABLES LIKE :table_name")
+            result = await session.execute(query, {"table_name": table_name})
+            return result.scalar() is not None
 
     async def _base_load_all(self,
                              table: Type[Base],
@@ -144,34 +135,22 @@ class TableService(metaclass=Singleton):
                           primary_id: str,
                           server_context: bool = True
                           ) -> SelectResult:
-        local_session = self.client.get_session(self.engine)
-
         where = where_with_context(table, server_context, table.id == primary_id)
 
-        async with local_session() as session:
-            # Start a new transaction
-            async with session.begin():
-                # Use SQLAlchemy core to perform an asynchronous query
-                return await self._select_query(
-                    table=table,
-                    where=where,
-                    one_record=True
-                )
+        return await self._select_query(
+            table=table,
+            where=where,
+            one_record=True
+        )
 
     async def _field_filter(self, table: Type[Base], field: Column, value, server_context: bool = True) -> SelectResult:
-        local_session = self.client.get_session(self.engine)
-
         where = where_with_context(table, server_context, field == value)
 
-        async with local_session() as session:
-            # Start a new transaction
-            async with session.begin():
-                # Use SQLAlchemy core to perform an asynchronous query
-                return await self._select_query(
-                    table=table,
-                    where=where,
-                    one_record=False
-                )
+        return await self._select_query(
+            table=table,
+            where=where,
+            one_record=False
+        )
 
     async def _select_query(self,
                             table: Type[Base],
@@ -184,100 +163,96 @@ class TableService(metaclass=Singleton):
                             one_record: bool = False
                             ) -> SelectResult:
 
-        local_session = self.client.get_session(self.engine)
-        async with local_session() as session:
-            # Start a new transaction
-            async with session.begin():
-                # Use SQLAlchemy core to perform an asynchronous query
-
-                resource = MysqlQuery(session)
-                result = await resource.select(table,
-                                               columns,
-                                               where,
-                                               order_by,
-                                               limit,
-                                               offset,
-                                               distinct)
-
-                # Fetch all results
-                if one_record:
-                    return SelectResult(result.one_or_none())
-                return SelectResult(result.all())
+        async with self.client.session(self.engine) as session:
+            # Use SQLAlchemy core to perform an asynchronous query
+
+            resource = MysqlQuery(session)
+            result = await resource.select(table,
+                                           columns,
+                                           where,
+                                           order_by,
+                                           limit,
+                                           offset,
+                                           distinct)
+
+            # Fetch all results
+            if one_record:
+                return SelectResult(result.one_or_none())
+            return SelectResult(result.all())
 
     async def _insert(self, table: Type[Base]) -> Optional[str]:
-        local_session = self.client.get_session(self.engine)
-        async with local_session() as session:
-            async with session.begin():
-                session.add(table)
-                await session.commit()
-                return table.id
+        async with self.client.session(self.engine) as session:
+            session.add(table)
+            await session.commit()
+            primary_id = table.id
+        await cache_invalidation.invalidate(table.__tablename__)
+        return primary_id
 
     async def _update_by_id(self, table: Type[Base], primary_id: str, new_data: dict, server_context: bool = True) -> \
             Optional[str]:
-        local_session = self.client.get_session(self.engine)
         where = where_with_context(table, server_context, table.id == primary_id)
 
-        async with local_session() as session:
-            async with session.begin():
-                stmt = (
-                    update(table)
-                    .where(where)
-                    .values(**new_data)
-                )
-                await session.execute(stmt)
-                await session.commit()
-                return primary_id
+        async with self.client.session(self.engine) as session:
+            stmt = (
+                update(table)
+                .where(where)
+                .values(**new_data)
+            )
+            await session.execute(stmt)
+            await session.commit()
+        await cache_invalidation.invalidate(table.__tablename__)
+        return primary_id
 
     async def _update_query(self, table: Type[Base], where, new_data: dict):
-        local_session = self.client.get_session(self.engine)
-        async with local_session() as session:
-            async with session.begin():
-                resource = MysqlQuery(session)
-                await resource.update(table, new_data, where)
-                await session.commit()
-                return None
+        async with self.client.session(self.engine) as session:
+            resource = MysqlQuery(session)
+            await resource.update(table, new_data, where)
+            await session.commit()
+        await cache_invalidation.invalidate(table.__tablename__)
+        return None
 
     async def _replace(self, table: Type[Base], instance: Base) -> Optional[str]:
-        local_session = self.client.get_session(self.engine)
-        async with local_session() as session:
-            async with session.begin():
-                # Convert the SQLAlchemy instance to a dictionary
-                data = {c.key: getattr(instance, c.key) for c in inspect(instance).mapper.column_attrs}
-                stmt = insert(table).values(**data)
-                primary_keys = [key.name for key in inspect(table).primary_key]
-                update_dict = {key: value for key, value in data.items() if key not in primary_keys}
-                upsert_stmt = stmt.on_duplicate_key_update(**update_dict)
-
-                await session.execute(upsert_stmt)
-                await session.commit()
+        async with self.client.session(self.engine) as session:
+            # Convert the SQLAlchemy instance to a dictionary
+            data = {c.key: getattr(instance, c.key) for c in inspect(instance).mapper.column_attrs}
+            stmt = insert(table).values(**data)
+            primary_keys = [key.name for key in inspect(table).primary_key]
+            update_dict = {key: value for key, value in data.items() if key not in primary_keys}
+            upsert_stmt = stmt.on_duplicate_key_update(**update_dict)
+
+            await session.execute(upsert_stmt)
+            await session.commit()
 
-                # Assuming the primary key field is named 'id'
-                return getattr(instance, 'id', None)
+        await cache_invalidation.invalidate(table.__tablename__)
+        # Assuming the primary key field is named 'id'
+        return getattr(instance, 'id', None)
 
     async def _insert_if_none(self, table: Type[Base], data, server_context: bool = True) -> Optional[str]:
 
-        local_session = self.client.get_session(self.engine)
         where = where_with_context(table, server_context, table.id == data.id)
 
-        async with local_session() as session:
-            async with session.begin():
-                resource = MysqlQuery(session)
-                result = await resource.select(
-                    table=table,
-                    where=where)
+        async with self.client.session(self.engine) as session:
+            resource = MysqlQuery(session)
+            result = await resource.select(
+                table=table,
+                where=where)
 
-                if result.empty():
-                    # Add the new object to the session
-                    resource.insert(data)
+            if result.empty():
+                # Add the new object to the session
+                resource.insert(data)
 
-                    # The actual commit happens here
-                    await session.commit()
+                # The actual commit happens here
+                await session.commit()
 
-                    # Return the id of the new record
-                    return data.id
+                # Return the id of the new record
+                primary_id = data.id
 
+            else:
                 return None
 
+        await cache_invalidation.invalidate(table.__tablename__)
+        return primary_id
+
     async def _delete_by_id(self,
                             table: Type[Base],
                             primary_id: str,
@@ -285,18 +260,17 @@ class TableService(metaclass=Singleton):
 
         where = where_with_context(table, server_context, table.id == primary_id)
 
-        local_session = self.client.get_session(self.engine)
-        async with local_session() as session:
-            async with session.begin():
-                resource = MysqlQuery(session)
-                await resource.delete(table, where)
+        async with self.client.session(self.engine) as session:
+            resource = MysqlQuery(session)
+            await resource.delete(table, where)
 
+        await cache_invalidation.invalidate(table.__tablename__)
         return True, None
 
     async def _delete_query(self, table: Type[Base], where):
 
-        local_session = self.client.get_session(self.engine)
-        async with local_session() as session:
-            async with session.begin():
-                resource = MysqlQuery(session)
-                await resource.delete(table, where)
+        async with self.client.session(self.engine) as session:
+            resource = MysqlQuery(session)
+            await resource.delete(table, where)
+
+        await cache_invalidation.invalidate(table.__tablename__)
@@ -9,6 +9,8 @@ from tracardi.service.storage.mysql.schema.table import WorkflowTable
 from tracardi.service.storage.mysql.utils.select_result import SelectResult
 from tracardi.service.storage.mysql.service.table_service import TableService
 from tracardi.service.storage.mysql.service.table_filtering import where_tenant_and_mode_context
+from tracardi.service.storage.redis.collections import Collection
+from tracardi.service.storage.redis_client import AsyncRedisClient
 
 logger = logging.getLogger(__name__)
 logger.setLevel(tracardi.logging_level)
@@ -17,6 +19,14 @@ logger.addHandler(log_handler)
 
 class WorkflowService(TableService):
 
+    @staticmethod
+    def version_key(workflow_id: str) -> str:
+        return f"{Collection.workflow_version}{workflow_id}"
+
+    async def _bump_version(self, workflow_id: str):
+        # Invalidates workflows cached by the workers (see tracardi.service.cache.workflow)
+        await AsyncRedisClient().incr(self.version_key(workflow_id))
+
     async def load_in_current_context(self, workflow_id):
         return await self._load_by_id(WorkflowTable, primary_id=workflow_id)
 
@@ -27,15 +37,21 @@ class WorkflowService(TableService):
         return await self._load_by_id_in_deployment_mode(WorkflowTable, primary_id=workflow_id)
 
     async def update_by_id(self, workflow_id: str, new_data: dict) -> Optional[str]:
-        return await self._update_by_id(WorkflowTable, primary_id=workflow_id, new_data=new_data)
+        result = await self._update_by_id(WorkflowTable, primary_id=workflow_id, new_data=new_data)
+        await self._bump_version(workflow_id)
+        return result
 
     async def delete_by_id(self, workflow_id: str) -> Tuple[bool, Optional[FlowRecord]]:
-        return await self._delete_by_id_in_deployment_mode(WorkflowTable,
-                                                           map_to_workflow_record,
-                                                           primary_id=workflow_id)
+        result = await self._delete_by_id_in_deployment_mode(WorkflowTable,
+                                                             map_to_workflow_record,
+                                                             primary_id=workflow_id)
+        await self._bump_version(workflow_id)
+        return result
 
     async def insert(self, workflow: FlowRecord):
-        return await self._replace(WorkflowTable, map_to_workflow_table(workflow))
+        result = await self._replace(WorkflowTable, map_to_workflow_table(workflow))
+        await self._bump_version(workflow.id)
+        return result
 
     async def load_all_by_type(self, wf_type: str, search: str = None, columns=None, limit: int = None,
                                offset: int = None) -> SelectResult:
@@ -519,6 +519,17 @@ class PersistenceService:
                 raise StorageException(str(e), message=message, details=details)
             raise StorageException(str(e))
 
+    async def upsert_in_chunks(self, data: Union[list, set], chunk_size: int,
+                               replace_id: bool = True, exclude=None) -> BulkInsertResult:
+        try:
+            return await self.storage.create_in_chunks(data, chunk_size, replace_id=replace_id, exclude=exclude)
+        except elasticsearch.exceptions.ElasticsearchException as e:
+            _logger.error(str(e))
+            if len(e.args) == 2:
+                message, details = e.args
+                raise StorageException(str(e), message=message, details=details)
+            raise StorageException(str(e))
+
     async def delete(self, id: str, index: str) -> dict:
         try:
             return await self.storage.delete(id, index=index)
@@ -1,6 +1,6 @@
-from typing import Optional, Any
+from typing import Optional, Any, List, Tuple
 
-from tracardi.service.storage.redis_client import RedisClient
+from tracardi.service.storage.redis_client import RedisClient, AsyncRedisClient
 import msgpack
 
 
@@ -44,3 +44,71 @@ class RedisCache:
 
     def get_ttl(self, key:str, collection:str):
         return self._redis.ttl(f"{collection}{key}")
+
+
+class AsyncRedisCache:
+
+    def __init__(self, ttl, batch_size: int = 1000):
+        self._redis = AsyncRedisClient()
+        self.ttl = ttl
+        self.batch_size = batch_size
+
+    async def set(self, key: str, value: Any, collection: str):
+        await self._redis.set(
+            f"{collection}{key}",
+            msgpack.packb(value),
+            ex=self.ttl
+        )
+
+    async def mset(self, mapping):
+        return await self._redis.mset(mapping)
+
+    async def get(self, key: str, collection: str) -> Optional[Any]:
+        value = await self._redis.get(f"{collection}{key}")
+        if value is None:
+            return None
+
+        return msgpack.unpackb(value)
+
+    async def delete(self, key: str, collection: str):
+        await self._redis.delete(f"{collection}{key}")
+
+    async def has(self, key, collection):
+        return await self._redis.exists(f"{collection}{key}")
+
+    async def refresh(self, key, collection):
+        await self._redis.expire(f"{collection}{key}", self.ttl)
+
+    async def expire(self, key, ttl):
+        await self._redis.expire(key, ttl)
+
+    async def persist(self, key):
+        await self._redis.persist(key)
+
+    async def get_ttl(self, key: str, collection: str):
+        return await self._redis.ttl(f"{collection}{key}")
+
+    async def get_many(self, keys: List[Tuple[str, str]]) -> List[Optional[Any]]:
+        """
+        Reads many (key, collection) values with one MGET per batch_size keys.
+        """
+        result = []
+        for start in range(0, len(keys), self.batch_size):
+            values = await self._redis.mget(
+                [f"{collection}{key}" for key, collection in keys[start:start + self.batch_size]])
+            result.extend(msgpack.unpackb(value) if value is not None else None for value in values)
+        return result
+
+    async def set_many(self, items: List[Tuple[str, Any, str]]):
+        """
+        Saves many (key, value, collection) items in one pipeline per batch_size items.
+        """
+        for start in range(0, len(items), self.batch_size):
+            await self._redis.set_many(
+                {f"{collection}{key}": msgpack.packb(value) for key, value, collection in
+                 items[start:start + self.batch_size]},
+                ex=self.ttl)
+
+    async def delete_many(self, keys: List[Tuple[str, str]]):
+        if keys:
+            await self._redis.delete_many([f"{collection}{key}" for key, collection in keys])
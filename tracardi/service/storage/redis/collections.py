@@ -17,6 +17,10 @@ class Collection:
     profile: str = "profile:"  # HASH
     session: str = "session:"  # HASH
     lock_tracker: str = "lock:tracker:"  # HASH
+    lock_release: str = "lock:release:"  # PUBSUB, Lock release notifications
+    workflow_version: str = "workflow:version:"  # Version of workflow, bumped when workflow is saved
+    cache_invalidation: str = "cache:invalidation"  # PUBSUB, Table names of changed configuration
+    import_checkpoint: str = "import:checkpoint:"  # Position of running imports
 
     session_lock: str = "session:lock:"  # HASH
     profile_fields: str = "profile:fields"  # SET, Cache profile fields, properties for auto completion
@@ -3,12 +3,14 @@ from time import sleep
 from typing import Optional, Awaitable, Union, List
 
 import redis
+import redis.asyncio as async_redis
 
 from tracardi.context import get_context
 from tracardi.exceptions.log_handler import get_logger
 from tracardi.service.singleton import Singleton
 from tracardi.config import redis_config
-from tracardi.service.storage.redis_connection_pool import get_redis_connection_pool
+from tracardi.service.storage.redis_connection_pool import get_redis_connection_pool, \
+    get_async_redis_connection_pool
 
 logger = get_logger(__name__)
 
@@ -103,6 +105,122 @@ class RedisClient(metaclass=Singleton):
         return self.client.persist(key)
 
 
+class AsyncRedisClient(metaclass=Singleton):
+
+    """
+    Non-blocking counterpart of RedisClient. Must be used inside the event loop (tracking hot path)
+    so the cache and lock round-trips do not block the worker. Keys are tenant prefixed the same way.
+    """
+
+    def __init__(self):
+        uri = redis_config.get_redis_with_password()
+        logger.debug(f"Connecting async redis via pool at {uri}")
+        self.client = async_redis.Redis(connection_pool=get_async_redis_connection_pool(redis_config))
+
+    @staticmethod
+    def get_tenant_prefix(name):
+        return f"{get_context().tenant}:{name}"
+
+    async def hexists(self, name: str, key: str) -> bool:
+        return await self.client.hexists(name, key)
+
+    async def hget(self, name: str, key: str):
+        return await self.client.hget(self.get_tenant_prefix(name), key)
+
+    async def hset(self,
+                   name: str,
+                   key: Optional[str] = None,
+                   value: Optional[str] = None,
+                   mapping: Optional[dict] = None,
+                   items: Optional[list] = None) -> int:
+        return await self.client.hset(self.get_tenant_prefix(name), key, value, mapping, items)
+
+    async def hgetall(self, name: str) -> dict:
+        return await self.client.hgetall(self.get_tenant_prefix(name))
+
+    async def hdel(self, name: str, *keys: List) -> int:
+        return await self.client.hdel(self.get_tenant_prefix(name), *keys)
+
+    async def sadd(self, name: str, *values) -> int:
+        return await self.client.sadd(self.get_tenant_prefix(name), *values)
+
+    async def smembers(self, name: str) -> set:
+        return await self.client.smembers(self.get_tenant_prefix(name))
+
+    async def ttl(self, name):
+        return await self.client.ttl(self.get_tenant_prefix(name))
+
+    async def exists(self, name):
+        return await self.client.exists(self.get_tenant_prefix(name))
+
+    async def get(self, name):
+        return await self.client.get(self.get_tenant_prefix(name))
+
+    async def set(
+            self,
+            name,
+            value,
+            ex=None,
+            px=None,
+            nx: bool = False,
+            xx: bool = False,
+            keepttl: bool = False,
+            get: bool = False,
+            exat=None,
+            pxat=None,
+    ):
+        return await self.client.set(self.get_tenant_prefix(name), value, ex, px, nx, xx, keepttl, get, exat, pxat)
+
+    async def delete(self, name):
+        return await self.client.delete(self.get_tenant_prefix(name))
+
+    async def incr(self, name, amount: int = 1):
+        return await self.client.incr(self.get_tenant_prefix(name), amount)
+
+    async def expire(
+            self,
+            name,
+            time,
+            nx: bool = False,
+            xx: bool = False,
+            gt: bool = False,
+            lt: bool = False,
+    ):
+        return await self.client.expire(self.get_tenant_prefix(name), time, nx, xx, gt, lt)
+
+    async def ping(self, **kwargs):
+        return await self.client.ping(**kwargs)
+
+    def pubsub(self, **kwargs):
+        return self.client.pubsub(**kwargs)
+
+    async def publish(self, channel: str, message):
+        return await self.client.publish(channel, message)
+
+    def register_script(self, script: str):
+        # Keys passed to the script must be tenant prefixed by the caller.
+        return self.client.register_script(script)
+
+    async def mset(self, mapping):
+        return await self.client.mset(mapping)
+
+    async def mget(self, names: List[str]) -> list:
+        return await self.client.mget([self.get_tenant_prefix(name) for name in names])
+
+    async def set_many(self, mapping: dict, ex=None):
+        # One round-trip for all keys. Pipeline is not a transaction.
+        async with self.client.pipeline(transaction=False) as pipe:
+            for name, value in mapping.items():
+                pipe.set(self.get_tenant_prefix(name), value, ex=ex)
+            return await pipe.execute()
+
+    async def delete_many(self, names: List[str]):
+        return await self.client.delete(*[self.get_tenant_prefix(name) for name in names])
+
+    async def persist(self, key):
+        return await self.client.persist(key)
+
+
 def wait_for_redis_connection():
     no_of_tries = 10
     while True:
@@ -1,5 +1,6 @@
 from tracardi.config import RedisConfig
 from redis import ConnectionPool
+from redis.asyncio import ConnectionPool as AsyncConnectionPool
 
 from tracardi.exceptions.log_handler import get_logger
 
@@ -18,3 +19,17 @@ def get_redis_connection_pool(redis_config: RedisConfig) -> ConnectionPool:
                               max_connections=20)
 
     return pool
+
+
+def get_async_redis_connection_pool(redis_config: RedisConfig) -> AsyncConnectionPool:
+    if redis_config.redis_password:
+        pool = AsyncConnectionPool(host=redis_config.host,
+                                   port=redis_config.port,
+                                   password=redis_config.redis_password,
+                                   max_connections=redis_config.redis_async_max_connections)
+    else:
+        pool = AsyncConnectionPool(host=redis_config.host,
+                                   port=redis_config.port,
+                                   max_connections=redis_config.redis_async_max_connections)
+
+    return pool
@@ -0,0 +1,83 @@
+import asyncio
+from typing import Dict, Tuple, Set
+
+from tracardi.config import elastic
+from tracardi.context import get_context, ServerContext, Context
+from tracardi.exceptions.log_handler import get_logger
+from tracardi.service.storage.factory import storage_manager
+
+logger = get_logger(__name__)
+
+
+class RefreshCoordinator:
+    """
+    Coalesces elastic index refreshes. All refreshes of an index requested within `window` seconds are done with
+    one refresh. Index is refreshed in the context (tenant, mode) it was requested in.
+
+    Refreshed index is needed only for searches. Callers that need to read their writes by id should read from
+    cache.
+    """
+
+    def __init__(self, window: float):
+        self.window = window
+        self._pending: Dict[Tuple[str, str], asyncio.Future] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self.progress = {
+            "requested": 0,
+            "refreshed": 0,
+            "failed": 0
+        }
+
+    def request(self, index: str) -> asyncio.Future:
+        """
+        Schedules refresh of index (storage index key, e.g. `profile`). Returns future that is done when the index
+        is refreshed. It does not have to be awaited.
+        """
+        context = get_context()
+        key = (f"{context.tenant}:{context.production}", index)
+        self.progress['requested'] += 1
+
+        loop = asyncio.get_running_loop()
+        future = self._pending.get(key, None)
+        if future is None or future.get_loop() is not loop:
+            future = loop.create_future()
+            self._pending[key] = future
+            task = asyncio.create_task(self._refresh(key, context, index, future))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+        return future
+
+    async def refresh(self, index: str):
+        await self.request(index)
+
+    async def _refresh(self, key: Tuple[str, str], context: Context, index: str, future: asyncio.Future):
+        try:
+            await asyncio.sleep(self.window)
+        finally:
+            # Writes requested from now on may not be in this refresh.
+            if self._pending.get(key, None) is future:
+                del self._pending[key]
+
+        with ServerContext(context):
+            try:
+                await storage_manager(index).refresh()
+                self.progress['refreshed'] += 1
+            except Exception as e:
+                self.progress['failed'] += 1
+                logger.error(f"Could not refresh index {index}. Error: {str(e)}")
+            finally:
+                future.set_result(None)
+
+    async def flush(self):
+        if self._tasks:
+            await asyncio.gather(*self._tasks)
+
+    def stats(self) -> dict:
+        return {
+            **self.progress,
+            "pending": len(self._pending)
+        }
+
+
+refresh_coordinator = RefreshCoordinator(window=elastic.refresh_window / 1000)
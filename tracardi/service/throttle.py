@@ -1,7 +1,7 @@
 from typing import Tuple
 
 from tracardi.service.storage.redis.collections import Collection
-from tracardi.service.storage.redis_client import RedisClient
+from tracardi.service.storage.redis_client import RedisClient, AsyncRedisClient
 
 
 class Limiter:
@@ -23,3 +23,24 @@ class Limiter:
             ttl = self._redis.ttl(key)
 
         return req <= self._limit, ttl
+
+
+class AsyncLimiter:
+
+    def __init__(self, limit: int, ttl: int):
+        self._ttl = ttl
+        self._limit = limit
+        self._redis = AsyncRedisClient()
+
+    async def limit(self, key: str) -> Tuple[bool, int]:
+
+        key = f"{Collection.throttle}:{key}"
+
+        req = await self._redis.incr(key)
+        if req == 1:
+            await self._redis.expire(key, self._ttl)
+            ttl = self._ttl
+        else:
+            ttl = await self._redis.ttl(key)
+
+        return req <= self._limit, ttl
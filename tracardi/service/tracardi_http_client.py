@@ -1,47 +1,193 @@
+import asyncio
+from collections import defaultdict
+from types import SimpleNamespace
+
 import aiohttp
-from typing import Union, Tuple, Callable, List
+from typing import Union, Tuple, Callable, List, Optional
 from contextlib import asynccontextmanager
 
+from multidict import CIMultiDict
+
+from tracardi.config import http_client_config
+
+# Session parameters that can be set per request. Clients with other session parameters (e.g. own connector)
+# get a private session.
+_REQUEST_DEFAULTS = {'headers', 'timeout', 'auth', 'cookies'}
+
+
+class HttpClientPool:
+    """
+    Process wide aiohttp session with a connection pool per host, keep-alive and DNS cache. Cookies are not
+    stored between requests, so requests of different destinations and plugins do not share them.
+    """
+
+    def __init__(self, limit: int, limit_per_host: int, keepalive_timeout: int, dns_cache_ttl: int):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop = None
+        self._stats = defaultdict(lambda: {
+            "requests": 0,
+            "new_connections": 0,
+            "reused_connections": 0,
+            "dns_cache_hits": 0,
+            "dns_cache_misses": 0
+        })
+
+    def _trace_config(self) -> aiohttp.TraceConfig:
+
+        async def on_request_start(session, context, params: aiohttp.TraceRequestStartParams):
+            context.host = params.url.host
+            self._stats[context.host]['requests'] += 1
+
+        async def on_connection_create_end(session, context, params):
+            self._stats[context.host]['new_connections'] += 1
+
+        async def on_connection_reuseconn(session, context, params):
+            self._stats[context.host]['reused_connections'] += 1
+
+        async def on_dns_cache_hit(session, context, params: aiohttp.TraceDnsCacheHitParams):
+            self._stats[params.host]['dns_cache_hits'] += 1
+
+        async def on_dns_cache_miss(session, context, params: aiohttp.TraceDnsCacheMissParams):
+            self._stats[params.host]['dns_cache_misses'] += 1
+
+        trace_config = aiohttp.TraceConfig(trace_config_ctx_factory=lambda trace_request_ctx: SimpleNamespace(host=None))
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        trace_config.on_dns_cache_hit.append(on_dns_cache_hit)
+        trace_config.on_dns_cache_miss.append(on_dns_cache_miss)
+        return trace_config
+
+    def get_session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        # Session is bound to the event loop it was created in.
+        if self._session is None or self._session.closed or self._loop is not loop:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=self.dns_cache_ttl
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                cookie_jar=aiohttp.DummyCookieJar(),
+                trace_configs=[self._trace_config()]
+            )
+            self._loop = loop
+        return self._session
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._loop = None
+
+    def stats(self) -> dict:
+        pool = {
+            "limit": self.limit,
+            "limit_per_host": self.limit_per_host,
+            "acquired": 0,
+            "idle": 0
+        }
+        if self._session is not None and not self._session.closed:
+            connector = self._session.connector
+            # There is no public api for connection counts
+            pool['acquired'] = len(getattr(connector, '_acquired', []))
+            pool['idle'] = sum(len(connections) for connections in getattr(connector, '_conns', {}).values())
+
+        return {
+            "pool": pool,
+            "hosts": {host: dict(stats) for host, stats in self._stats.items()}
+        }
+
+
+http_client_pool = HttpClientPool(
+    limit=http_client_config.http_pool_limit,
+    limit_per_host=http_client_config.http_pool_limit_per_host,
+    keepalive_timeout=http_client_config.http_keepalive_timeout,
+    dns_cache_ttl=http_client_config.http_dns_cache_ttl
+)
+
 
 class HttpClient:
 
+    """
+    Uses the pooled process wide session. Headers, timeout, auth and cookies passed to the client are set on every
+    request. Clients created with other aiohttp.ClientSession parameters (e.g. connector) use a private session.
+    """
+
     def __init__(self, retries: int = 1, accept_status: Union[int, Tuple[int], List[int]] = 200, *args, **kwargs):
-        self.client = aiohttp.ClientSession(*args, **kwargs)
+        if args or not set(kwargs).issubset(_REQUEST_DEFAULTS):
+            self._private_client = aiohttp.ClientSession(*args, **kwargs)
+            self._defaults = {}
+        else:
+            self._private_client = None
+            self._defaults = kwargs
         self.retries = retries if retries >= 1 else 1
         self.accept_status = tuple([accept_status]) if isinstance(accept_status, int) else accept_status
 
+    @property
+    def client(self) -> aiohttp.ClientSession:
+        if self._private_client is not None:
+            return self._private_client
+        return http_client_pool.get_session()
+
+    def _with_defaults(self, kwargs: dict) -> dict:
+        for key, value in self._defaults.items():
+            if value is None:
+                continue
+            if key == 'headers':
+                headers = CIMultiDict(value)
+                if kwargs.get('headers'):
+                    headers.update(kwargs['headers'])
+                kwargs['headers'] = headers
+            elif kwargs.get(key, None) is None:
+                kwargs[key] = value
+        return kwargs
+
     async def _run_with_retries(self, func: Callable, *args, **kwargs):
+        kwargs = self._with_defaults(kwargs)
         for retry in range(self.retries):
             response = await func(*args, **kwargs)
             if response.status in self.accept_status or retry == self.retries - 1:
                 return response
+            # Return the connection to the pool before retry
+            response.release()
 
     @asynccontextmanager
-    async def request(self, *args, **kwargs):
-        yield await self._run_with_retries(self.client.request, *args, **kwargs)
+    async def _response(self, func: Callable, *args, **kwargs):
+        response = await self._run_with_retries(func, *args, **kwargs)
+        try:
+            yield response
+        finally:
+            response.release()
 
-    @asynccontextmanager
-    async def get(self, *args, **kwargs):
-        yield await self._run_with_retries(self.client.get, *args, **kwargs)
+    def request(self, *args, **kwargs):
+        return self._response(self.client.request, *args, **kwargs)
 
-    @asynccontextmanager
-    async def put(self, *args, **kwargs):
-        yield await self._run_with_retries(self.client.put, *args, **kwargs)
+    def get(self, *args, **kwargs):
+        return self._response(self.client.get, *args, **kwargs)
 
-    @asynccontextmanager
-    async def post(self, *args, **kwargs):
-        yield await self._run_with_retries(self.client.post, *args, **kwargs)
+    def put(self, *args, **kwargs):
+        return self._response(self.client.put, *args, **kwargs)
 
-    @asynccontextmanager
-    async def delete(self, *args, **kwargs):
-        yield await self._run_with_retries(self.client.delete, *args, **kwargs)
+    def post(self, *args, **kwargs):
+        return self._response(self.client.post, *args, **kwargs)
 
-    @asynccontextmanager
-    async def patch(self, *args, **kwargs):
-        yield await self._run_with_retries(self.client.patch, *args, **kwargs)
+    def delete(self, *args, **kwargs):
+        return self._response(self.client.delete, *args, **kwargs)
+
+    def patch(self, *args, **kwargs):
+        return self._response(self.client.patch, *args, **kwargs)
 
     async def __aenter__(self) -> 'HttpClient':
         return self
 
     async def __aexit__(self, exc_t, exc_v, exc_tb) -> None:
-        await self.client.close()
+        # Pooled session stays open
+        if self._private_client is not None:
+            await self._private_client.close()
@@ -0,0 +1,131 @@
+from bisect import bisect_left
+from time import perf_counter
+from typing import Dict, List, Optional
+
+from tracardi.config import tracardi
+from tracardi.exceptions.log_handler import get_logger
+
+try:
+    from opentelemetry import trace as otel_trace
+except ImportError:
+    otel_trace = None
+
+logger = get_logger(__name__)
+
+# Upper bounds of histogram buckets in milliseconds
+BUCKETS = [0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, float('inf')]
+
+
+class Histogram:
+    __slots__ = ('counts', 'count', 'total', 'max')
+
+    def __init__(self):
+        self.counts = [0] * len(BUCKETS)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, duration: float):
+        duration *= 1000
+        self.counts[bisect_left(BUCKETS, duration)] += 1
+        self.count += 1
+        self.total += duration
+        if duration > self.max:
+            self.max = duration
+
+    def percentile(self, percent: float) -> float:
+        # Upper bound of the bucket, or max if it is lower
+        rank = percent * self.count
+        cumulative = 0
+        for bound, count in zip(BUCKETS, self.counts):
+            cumulative += count
+            if count and cumulative >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def stats(self) -> dict:
+        return {
+            "count": self.count,
+            "avg": round(self.total / self.count, 3) if self.count else 0.0,
+            "p50": self.percentile(0.5),
+            "p99": self.percentile(0.99),
+            "max": round(self.max, 3)
+        }
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class _Span:
+    __slots__ = ('tracer', 'name', 'attributes', 'start', 'otel_span')
+
+    def __init__(self, tracer: 'Tracer', name: str, attributes: dict):
+        self.tracer = tracer
+        self.name = name
+        self.attributes = attributes
+        self.start = None
+        self.otel_span = None
+
+    def __enter__(self):
+        if self.tracer.otel_tracer is not None:
+            self.otel_span = self.tracer.otel_tracer.start_as_current_span(self.name, attributes=self.attributes)
+            self.otel_span.__enter__()
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.tracer.record(self.name, perf_counter() - self.start)
+        if self.otel_span is not None:
+            self.otel_span.__exit__(exc_type, exc_val, exc_tb)
+        return False
+
+
+class Tracer:
+    """
+    Times stages of event processing. Span durations are collected in in-process histograms (one per span name)
+    and, if enabled, exported as OpenTelemetry spans. Disabled tracer returns a shared no-op span.
+
+    Span names must have low cardinality (no ids). Ids can be passed as span attributes; they are exported
+    to OpenTelemetry only.
+    """
+
+    def __init__(self, enabled: bool, otel: bool = False):
+        self.enabled = enabled
+        self.otel_tracer = None
+        if enabled and otel:
+            if otel_trace is None:
+                logger.warning("OpenTelemetry tracing is enabled but opentelemetry-api is not installed.")
+            else:
+                self.otel_tracer = otel_trace.get_tracer("tracardi")
+        self._histograms: Dict[str, Histogram] = {}
+
+    def span(self, name: str, **attributes):
+        if not self.enabled:
+            return _NOOP_SPAN
+        return _Span(self, name, attributes)
+
+    def record(self, name: str, duration: float):
+        histogram = self._histograms.get(name, None)
+        if histogram is None:
+            self._histograms[name] = histogram = Histogram()
+        histogram.observe(duration)
+
+    def clear(self):
+        self._histograms.clear()
+
+    def stats(self, names: Optional[List[str]] = None) -> Dict[str, dict]:
+        return {name: histogram.stats() for name, histogram in sorted(self._histograms.items())
+                if names is None or name in names}
+
+
+tracer = Tracer(enabled=tracardi.tracing in ('on', 'otel'), otel=tracardi.tracing == 'otel')
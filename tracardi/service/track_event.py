@@ -22,4 +22,24 @@ async def track_event(tracker_payload: TrackerPayload,
         )
     )
 
-    return await tr.track_event(tracker_payload, tracking_start)
\ No newline at end of file
+    return await tr.track_event(tracker_payload, tracking_start)
+
+async def track_bulk_events(tracker_payloads: List[TrackerPayload],
+                            ip: str,
+                            allowed_bridges: List[str],
+                            destinations: bool = False,
+                            workflow: bool = False,
+                            internal_source=None,
+                            static_profile_id: bool = False
+                            ):
+    tracking_start = time.time()
+    tr = Tracker(
+        TrackerConfig(
+            ip=ip,
+            allowed_bridges=allowed_bridges,
+            internal_source=internal_source,
+            static_profile_id=static_profile_id
+        )
+    )
+
+    return await tr.track_bulk(tracker_payloads, tracking_start, destinations=destinations, workflow=workflow)
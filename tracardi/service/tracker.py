@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Optional, List, Tuple
 
 from tracardi.domain.bridges.configurable_bridges import WebHookBridge, RestApiBridge, ConfigurableBridge
 from tracardi.service.cache.event_source import load_event_source
@@ -12,6 +12,7 @@ from tracardi.domain.session import Session
 from tracardi.domain.payload.tracker_payload import TrackerPayload
 from tracardi.service.storage.mysql.bootstrap.bridge import open_rest_source_bridge
 from tracardi.service.tracking.source_validation import validate_source
+from tracardi.service.tracking.bulk_tracker import bulk_tracker
 from tracardi.service.tracker_config import TrackerConfig
 from tracardi.config import tracardi
 from tracardi.domain.event_source import EventSource
@@ -104,7 +105,7 @@ class Tracker:
 
         return None
 
-    async def track_event(self, tracker_payload: TrackerPayload, tracking_start: float):
+    async def _prepare(self, tracker_payload: TrackerPayload) -> Tuple[EventSource, TrackerPayload]:
 
         if tracker_payload.is_bot() and tracardi.disallow_bot_traffic:
             raise PermissionError(f"Traffic from bot is not allowed.")
@@ -149,6 +150,12 @@ class Tracker:
         if tracker_payload.source.transitional is True:
             tracker_payload.set_ephemeral()
 
+        return source, tracker_payload
+
+    async def track_event(self, tracker_payload: TrackerPayload, tracking_start: float):
+
+        source, tracker_payload = await self._prepare(tracker_payload)
+
         if License.has_license():
             result = await com_tracker(
                 source, tracker_payload,
@@ -166,6 +173,17 @@ class Tracker:
 
         return result
 
+    async def track_bulk(self, tracker_payloads: List[TrackerPayload], tracking_start: float,
+                         destinations: bool = False, workflow: bool = False) -> dict:
+
+        prepared_payloads = []
+        for tracker_payload in tracker_payloads:
+            _, tracker_payload = await self._prepare(tracker_payload)
+            prepared_payloads.append(tracker_payload)
+
+        return await bulk_tracker(prepared_payloads, self.tracker_config, tracking_start,
+                                  destinations=destinations, workflow=workflow)
+
     async def check_source_id(self, source_id) -> Optional[EventSource]:
 
         if not tracardi.enable_event_source_check:
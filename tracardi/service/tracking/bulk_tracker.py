@@ -0,0 +1,218 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import List, Dict, Optional
+
+from tracardi.config import tracardi
+from tracardi.context import get_context
+from tracardi.domain.event import Event
+from tracardi.domain.payload.tracker_payload import TrackerPayload
+from tracardi.domain.profile import Profile
+from tracardi.domain.session import Session
+from tracardi.exceptions.log_handler import get_logger
+from tracardi.service.change_monitoring.field_change_monitor import FieldTimestampMonitor
+from tracardi.service.storage.driver.elastic import event as event_db
+from tracardi.service.storage.driver.elastic import field_update_log as field_update_log_db
+from tracardi.service.storage.driver.elastic import profile as profile_db
+from tracardi.service.storage.driver.elastic import session as session_db
+from tracardi.service.tracker_config import TrackerConfig
+from tracardi.service.tracking.cache.profile_cache import load_profile_caches, save_profile_cache
+from tracardi.service.tracking.cache.session_cache import load_session_caches, save_session_cache
+from tracardi.service.tracking.destination.dispatcher import sync_event_destination, sync_profile_destination
+from tracardi.service.tracking.profile_loading import load_profile_and_session
+from tracardi.service.tracking.session_loading import load_or_create_session
+from tracardi.service.tracking.track_data_computation import compute_data
+from tracardi.service.utils.getters import get_entity_id
+from tracardi.service.wf.triggers import exec_workflow
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class _Computed:
+    tracker_payload: TrackerPayload
+    profile: Optional[Profile]
+    session: Optional[Session]
+    events: List[Event]
+    field_timestamp_monitor: Optional[FieldTimestampMonitor]
+
+
+@dataclass
+class _ProfileGroup:
+    payloads: List[TrackerPayload] = field(default_factory=list)
+    computed: List[_Computed] = field(default_factory=list)
+
+
+def _joinable(payload: TrackerPayload, other: TrackerPayload) -> bool:
+    return (payload.source.id == other.source.id
+            and get_entity_id(payload.session) == get_entity_id(other.session)
+            and payload.profile_less == other.profile_less
+            and payload.context == other.context
+            and payload.request == other.request
+            and payload.options == other.options
+            and payload.properties == other.properties)
+
+
+def group_payloads(tracker_payloads: List[TrackerPayload]) -> List[_ProfileGroup]:
+    """
+    Groups tracker payloads by profile. Consecutive payloads of the profile that have the same source, session and
+    payload data are joined into one payload with all their events. Payloads without profile id (including
+    profile less payloads) are groups of their own.
+    """
+    groups: Dict[str, _ProfileGroup] = {}
+    for tracker_payload in tracker_payloads:
+        if not tracker_payload.events:
+            continue
+
+        profile_id = get_entity_id(tracker_payload.profile)
+        if profile_id:
+            key = f"profile:{profile_id}"
+        else:
+            # Profile less payloads do not share any profile and payloads without profile create new ones,
+            # so they can be computed concurrently.
+            key = f"payload:{tracker_payload.get_id()}"
+
+        group = groups.get(key, None)
+        if group is None:
+            groups[key] = group = _ProfileGroup()
+
+        if group.payloads and _joinable(group.payloads[-1], tracker_payload):
+            group.payloads[-1].events = group.payloads[-1].events + tracker_payload.events
+        else:
+            group.payloads.append(tracker_payload)
+
+    return list(groups.values())
+
+
+async def _compute_group(group: _ProfileGroup,
+                         tracker_config: TrackerConfig,
+                         cached_profiles: Dict[str, Optional[Profile]],
+                         cached_sessions: Dict[str, Optional[Session]]):
+    profile = None
+    for tracker_payload in group.payloads:
+        # Profile computed for previous payload of the group is not saved yet, so it is passed on.
+        cached_profile = profile if profile is not None else cached_profiles.get(
+            get_entity_id(tracker_payload.profile), None)
+        if profile is not None and tracker_payload.profile is not None:
+            tracker_payload.profile.id = profile.id
+
+        session, tracker_payload = await load_or_create_session(
+            tracker_payload,
+            cached_sessions.get(get_entity_id(tracker_payload.session), None))
+        profile, session = await load_profile_and_session(session, tracker_config, tracker_payload, cached_profile)
+
+        profile, session, events, tracker_payload, field_timestamp_monitor = await compute_data(
+            profile,
+            session,
+            tracker_payload,
+            tracker_config,
+            tracker_payload.source
+        )
+
+        group.computed.append(_Computed(tracker_payload, profile, session, events, field_timestamp_monitor))
+
+
+async def _dispatch(computed: _Computed, destinations: bool, workflow: bool):
+    tracker_payload = computed.tracker_payload
+    profile, session, events = computed.profile, computed.session, computed.events
+
+    if destinations:
+        await sync_event_destination(profile, session, events, tracker_payload.debug)
+        if computed.field_timestamp_monitor:
+            await sync_profile_destination(
+                profile,
+                session,
+                computed.field_timestamp_monitor.get_timestamps_log().get_history_log(add_id=False)
+            )
+
+    if workflow:
+        profile, session, events, ux, response, wf_field_changes, is_wf_triggered = await exec_workflow(
+            get_entity_id(profile),
+            session,
+            events,
+            tracker_payload)
+
+        if destinations and wf_field_changes.has_changes():
+            await sync_profile_destination(profile, session, wf_field_changes.get_history_log(add_id=False))
+
+
+async def bulk_tracker(tracker_payloads: List[TrackerPayload],
+                       tracker_config: TrackerConfig,
+                       tracking_start: float,
+                       destinations: bool = False,
+                       workflow: bool = False) -> dict:
+    """
+    Tracks large batches of events, e.g. imports and backfills. Profile, session and event data is computed once
+    per group of payloads of the same profile and all data is saved with elastic bulk requests of
+    BULK_INGEST_CHUNK_SIZE documents. Profiles are not locked, so the batch must not be tracked at the same
+    time as live traffic of its profiles. Destinations and workflows run only if requested.
+    """
+    try:
+        groups = group_payloads(tracker_payloads)
+        if not groups:
+            return {"profiles": 0, "sessions": 0, "events": 0, "errors": []}
+
+        context = get_context()
+
+        # Profiles and sessions of the whole batch from cache in two round-trips
+        profile_ids = [get_entity_id(payload.profile) for group in groups for payload in group.payloads
+                       if get_entity_id(payload.profile)]
+        session_ids = [get_entity_id(payload.session) for group in groups for payload in group.payloads
+                       if get_entity_id(payload.session)]
+        cached_profiles, cached_sessions = await asyncio.gather(
+            load_profile_caches(profile_ids, context),
+            load_session_caches(session_ids, context)
+        )
+
+        limit = asyncio.Semaphore(max(tracardi.bulk_ingest_concurrency, 1))
+
+        async def _compute(group: _ProfileGroup):
+            async with limit:
+                await _compute_group(group, tracker_config, cached_profiles, cached_sessions)
+
+        await asyncio.gather(*[_compute(group) for group in groups])
+
+        profiles: Dict[str, Profile] = {}
+        sessions: Dict[str, Session] = {}
+        events: List[Event] = []
+        field_changes: List[dict] = []
+        for group in groups:
+            for computed in group.computed:
+                if computed.profile and computed.profile.has_not_saved_changes():
+                    profiles[computed.profile.id] = computed.profile
+                if computed.session and computed.session.has_not_saved_changes():
+                    sessions[computed.session.id] = computed.session
+                events += computed.events
+                if computed.field_timestamp_monitor:
+                    field_changes += computed.field_timestamp_monitor.get_timestamps_log().get_history_log()
+
+        chunk_size = tracardi.bulk_ingest_chunk_size
+        results = await asyncio.gather(
+            profile_db.save_in_chunks(list(profiles.values()), chunk_size),
+            session_db.save_in_chunks(list(sessions.values()), chunk_size),
+            event_db.save_in_chunks(events, chunk_size)
+        )
+
+        # Cached profiles and sessions would be stale, so cache is updated once for the batch.
+        await asyncio.gather(
+            save_profile_cache(list(profiles.values()), context),
+            save_session_cache(list(sessions.values()), context)
+        )
+
+        if field_changes:
+            await field_update_log_db.upsert(field_changes)
+
+        if destinations or workflow:
+            for group in groups:
+                for computed in group.computed:
+                    await _dispatch(computed, destinations, workflow)
+
+        return {
+            "profiles": len(profiles),
+            "sessions": len(sessions),
+            "events": len(events),
+            "errors": [error for result in results for error in result.errors]
+        }
+
+    finally:
+        logger.debug(f"Bulk process time {time.time() - tracking_start}")
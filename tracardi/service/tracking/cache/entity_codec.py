@@ -0,0 +1,258 @@
+"""
+Binary format of cached profiles and sessions:
+
+    b'TC' + version byte + b'm' (msgpack) or b'z' (zstd compressed msgpack) + payload
+
+Payload is a msgpack tuple of (schema fingerprint, context, python mode model dump without defaults, metadata
+dump). Data in cache was validated before it was saved, so models are rebuilt with model_construct. If the model
+schema changed (fingerprint does not match) the data is validated. Values saved in other versions are not read.
+"""
+
+import typing
+import zlib
+from datetime import datetime, date
+from enum import Enum
+from typing import Optional, Callable, Dict, Tuple, Type
+
+import msgpack
+from pydantic import BaseModel
+from pydantic_core import to_jsonable_python, PydanticSerializationError
+
+from tracardi.exceptions.log_handler import get_logger
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+logger = get_logger(__name__)
+_object_setattr = object.__setattr__
+
+FORMAT_VERSION = 2
+_HEADER = b'TC' + bytes([FORMAT_VERSION])
+_MSGPACK = b'm'
+_ZSTD = b'z'
+
+_EXT_DATETIME = 1
+_EXT_DATE = 2
+
+
+class _NotTrusted(Exception):
+    pass
+
+
+def _default(obj):
+    if isinstance(obj, datetime):
+        return msgpack.ExtType(_EXT_DATETIME, obj.isoformat().encode())
+    if isinstance(obj, date):
+        return msgpack.ExtType(_EXT_DATE, obj.isoformat().encode())
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    # Other values (e.g. UUID, Decimal, time in traits) are cached as in json mode dump, the way they are saved
+    # in elastic.
+    try:
+        return to_jsonable_python(obj)
+    except PydanticSerializationError:
+        raise TypeError(f"Can not cache object of type {type(obj)}")
+
+
+def _ext_hook(code, data):
+    if code == _EXT_DATETIME:
+        return datetime.fromisoformat(data.decode())
+    if code == _EXT_DATE:
+        return date.fromisoformat(data.decode())
+    return msgpack.ExtType(code, data)
+
+
+def _converter(annotation) -> Optional[Callable]:
+    """
+    Returns function that converts msgpack data to the annotated type or None if no conversion is needed.
+    """
+    origin = typing.get_origin(annotation)
+    args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+
+    if origin is typing.Union:
+        converters = [_converter(arg) for arg in args]
+        converters = [converter for converter in converters if converter is not None]
+        if not converters:
+            return None
+        if len(converters) > 1:
+            raise _NotTrusted()
+        converter = converters[0]
+        return lambda value: None if value is None else converter(value)
+
+    if origin in (list, set, frozenset):
+        item = _converter(args[0]) if args else None
+        if item is None:
+            return None if origin is list else origin
+        return lambda value: origin(item(v) for v in value)
+
+    if origin is tuple or annotation is tuple:
+        if any(_converter(arg) for arg in args if arg is not Ellipsis):
+            raise _NotTrusted()
+        return tuple
+
+    if origin is dict:
+        item = _converter(args[1]) if len(args) == 2 else None
+        if item is None:
+            return None
+        return lambda value: {k: item(v) for k, v in value.items()}
+
+    if isinstance(annotation, type):
+        if issubclass(annotation, BaseModel):
+            return get_builder(annotation)
+        if issubclass(annotation, Enum) or (issubclass(annotation, dict) and annotation is not dict):
+            return annotation
+        if issubclass(annotation, (set, frozenset)):
+            return annotation
+
+    return None
+
+
+def _default_factory(field) -> Callable:
+    """
+    Returns function that creates the default value of the field. Model defaults are rebuilt from their packed
+    dump, which is faster than deep copying them.
+    """
+    if field.default_factory is not None:
+        return lambda: field.get_default(call_default_factory=True)
+
+    default = field.default
+    if default is None or isinstance(default, (str, int, float, bool, bytes, Enum)):
+        return lambda: default
+    if isinstance(default, (list, dict, set)) and not default:
+        return type(default)
+    if isinstance(default, BaseModel):
+        model = type(default)
+        packed = msgpack.packb(default.model_dump(exclude_defaults=True), default=_default)
+        fields_set = frozenset(default.model_fields_set)
+        return lambda: get_builder(model)(msgpack.unpackb(packed, ext_hook=_ext_hook), set(fields_set))
+    return lambda: field.get_default()
+
+
+_builders: Dict[Type[BaseModel], Callable] = {}
+
+
+def get_builder(model: Type[BaseModel]) -> Callable[..., BaseModel]:
+    """
+    Returns function that builds the model from trusted data dumped with exclude_defaults, without validation.
+    """
+    if model in _builders:
+        return _builders[model]
+
+    # Recursive models resolve the builder lazily
+    _builders[model] = lambda *args: _builders[model](*args)
+
+    try:
+        if model.__pydantic_root_model__:
+            raise _NotTrusted()
+
+        converters = {name: _converter(field.annotation) for name, field in model.model_fields.items()}
+        converters = {name: converter for name, converter in converters.items() if converter is not None}
+        fields = [(name, None if field.is_required() else _default_factory(field))
+                  for name, field in model.model_fields.items()]
+        field_count = len(fields)
+
+        def build(data: dict, fields_set: Optional[set] = None) -> BaseModel:
+            if fields_set is None:
+                # Same fields as set after validation of data dumped with exclude_defaults.
+                fields_set = set(data)
+            for name, converter in converters.items():
+                if name in data:
+                    data[name] = converter(data[name])
+
+            values = {}
+            for name, default in fields:
+                if name in data:
+                    values[name] = data.pop(name)
+                elif default is not None:
+                    values[name] = default()
+
+            # Missing required fields or extra data
+            if data or len(values) != field_count:
+                return model.model_construct(_fields_set=fields_set, **values, **data)
+
+            entity = model.__new__(model)
+            _object_setattr(entity, '__dict__', values)
+            _object_setattr(entity, '__pydantic_fields_set__', fields_set)
+            _object_setattr(entity, '__pydantic_extra__', None)
+            _object_setattr(entity, '__pydantic_private__', None)
+            if model.__pydantic_post_init__:
+                entity.model_post_init(None)
+            return entity
+
+        _builders[model] = build
+    except _NotTrusted:
+        _builders[model] = lambda data, fields_set=None: model.model_validate(data)
+
+    return _builders[model]
+
+
+_fingerprints: Dict[Type[BaseModel], int] = {}
+
+
+def _schema(model: Type[BaseModel], seen: set) -> str:
+    if model in seen:
+        return model.__name__
+    seen.add(model)
+    parts = [model.__name__]
+    for name, field in model.model_fields.items():
+        parts.append(f"{name}:{field.annotation}")
+        for arg in [field.annotation, *typing.get_args(field.annotation)]:
+            for nested in [arg, *typing.get_args(arg)]:
+                if isinstance(nested, type) and issubclass(nested, BaseModel):
+                    parts.append(_schema(nested, seen))
+    return ";".join(parts)
+
+
+def fingerprint(model: Type[BaseModel]) -> int:
+    if model not in _fingerprints:
+        _fingerprints[model] = zlib.crc32(_schema(model, set()).encode())
+    return _fingerprints[model]
+
+
+def encode(entity: BaseModel, context: dict, metadata: BaseModel, compress_above: int = 0) -> bytes:
+    payload = msgpack.packb(
+        (
+            fingerprint(type(entity)),
+            context,
+            entity.model_dump(exclude_defaults=True, exclude={"operation": ...}),
+            metadata.model_dump()
+        ),
+        default=_default
+    )
+
+    if zstandard is not None and 0 < compress_above < len(payload):
+        return _HEADER + _ZSTD + zstandard.ZstdCompressor().compress(payload)
+
+    return _HEADER + _MSGPACK + payload
+
+
+def is_encoded(value) -> bool:
+    return isinstance(value, bytes) and value[:2] == _HEADER[:2]
+
+
+def decode(model: Type[BaseModel], value: bytes) -> Optional[Tuple[BaseModel, Optional[dict]]]:
+    """
+    Returns the model and its metadata or None if the value can not be read.
+    """
+    if value[:3] != _HEADER:
+        return None
+
+    payload = value[4:]
+    if value[3:4] == _ZSTD:
+        if zstandard is None:
+            logger.warning("Cached value is compressed but zstandard is not installed.")
+            return None
+        payload = zstandard.ZstdDecompressor().decompress(payload)
+
+    schema, context, data, metadata = msgpack.unpackb(payload, ext_hook=_ext_hook)
+
+    if schema == fingerprint(model):
+        entity = get_builder(model)(data)
+    else:
+        entity = model(**data)
+
+    return entity, metadata
@@ -1,44 +1,46 @@
-from typing import Optional, List, Union, Set
+from typing import Optional, List, Union, Set, Dict, Iterable
 
 from tracardi.config import tracardi
 from tracardi.context import get_context, Context
 from tracardi.domain import ExtraInfo
 from tracardi.domain.storage_record import RecordMetadata
 from tracardi.exceptions.log_handler import get_logger
-from tracardi.service.storage.redis.cache import RedisCache
+from tracardi.service.storage.redis.cache import AsyncRedisCache
 from tracardi.service.storage.redis.collections import Collection
-from tracardi.service.storage.redis_client import RedisClient
+from tracardi.service.tracking.cache import entity_codec
 from tracardi.service.tracking.cache.prefix import get_cache_prefix
 from tracardi.domain.profile import Profile
 
 logger = get_logger(__name__)
-redis_cache = RedisCache(ttl=tracardi.keep_profile_in_cache_for)
-_redis = RedisClient()
+redis_cache = AsyncRedisCache(ttl=tracardi.keep_profile_in_cache_for)
 
 
 def get_profile_key_namespace(profile_id, context):
     return f"{Collection.profile}{context.context_abrv()}:{get_cache_prefix(profile_id[0:2])}:"
 
 
-def delete_profile_cache(profile_id: str, context: Context):
+async def delete_profile_cache(profile_id: str, context: Context):
     key_namespace = get_profile_key_namespace(profile_id, context)
-    redis_cache.delete(
+    await redis_cache.delete(
         profile_id,
         key_namespace
     )
 
 
-def load_profile_cache(profile_id: str, context: Context) -> Optional[Profile]:
-    key_namespace = get_profile_key_namespace(profile_id, context)
-
-    if not redis_cache.has(profile_id, key_namespace):
+def profile_from_cache(_data) -> Optional[Profile]:
+    if _data is None:
         return None
 
-    _data = redis_cache.get(
-        profile_id,
-        key_namespace
-    )
+    if entity_codec.is_encoded(_data):
+        decoded = entity_codec.decode(Profile, _data)
+        if decoded is None:
+            return None
+        profile, profile_metadata = decoded
+        if profile_metadata:
+            profile.set_meta_data(RecordMetadata.model_construct(**profile_metadata))
+        return profile
 
+    # Format before entity_codec
     try:
         context, profile, profile_changes, profile_metadata = _data
     except Exception:
@@ -51,33 +53,60 @@ def load_profile_cache(profile_id: str, context: Context) -> Optional[Profile]:
     return profile
 
 
-def _save_single_profile(profile: Profile, context: Context):
-    key = get_profile_key_namespace(profile.id, context)
-    index = profile.get_meta_data()
+def _cache_value(profile: Profile, context: Context, index: RecordMetadata) -> bytes:
+    return entity_codec.encode(
+        profile,
+        {
+            "production": context.production,
+            "tenant": context.tenant
+        },
+        index,
+        compress_above=tracardi.cache_compress_above
+    )
+
+
+async def load_profile_cache(profile_id: str, context: Context) -> Optional[Profile]:
+    key_namespace = get_profile_key_namespace(profile_id, context)
+
+    _data = await redis_cache.get(
+        profile_id,
+        key_namespace
+    )
+
+    return profile_from_cache(_data)
+
+
+async def load_profile_caches(profile_ids: List[str], context: Context) -> Dict[str, Optional[Profile]]:
+    """
+    Loads many profiles from cache with MGET. Profiles that are not in cache are None.
+    """
+    profile_ids = list(dict.fromkeys(profile_ids))
+    values = await redis_cache.get_many(
+        [(profile_id, get_profile_key_namespace(profile_id, context)) for profile_id in profile_ids])
+    return {profile_id: profile_from_cache(_data) for profile_id, _data in zip(profile_ids, values)}
+
 
-    if index is None:
-        logger.warning("Empty profile metadata. Index is not set. Profile removed from cache.",
+async def _save_profiles(profiles: Iterable[Profile], context: Context):
+    items = []
+    missing_metadata = []
+    for profile in profiles:
+        key = get_profile_key_namespace(profile.id, context)
+        index = profile.get_meta_data()
+        if index is None:
+            missing_metadata.append((profile.id, key))
+        else:
+            items.append((profile.id, _cache_value(profile, context, index), key))
+
+    if missing_metadata:
+        logger.warning(f"Empty profile metadata. Index is not set. {len(missing_metadata)} profile(s) removed "
+                       f"from cache.",
                        extra=ExtraInfo.exact(origin="cache", package=__name__))
-        redis_cache.delete(profile.id, key)
-    else:
-        value = (
-            {
-                "production": context.production,
-                "tenant": context.tenant
-            },
-            profile.model_dump(mode="json", exclude_defaults=True, exclude={"operation": ...}),
-            None,
-            index.model_dump(mode="json")
-        )
-
-        redis_cache.set(
-            profile.id,
-            value,
-            key
-        )
-
-
-def save_profile_cache(profile: Union[Optional[Profile], List[Profile], Set[Profile]], context: Optional[Context] = None):
+        await redis_cache.delete_many(missing_metadata)
+
+    await redis_cache.set_many(items)
+
+
+async def save_profile_cache(profile: Union[Optional[Profile], List[Profile], Set[Profile]], context: Optional[Context] = None):
 
     if profile:
 
@@ -85,9 +114,8 @@ def save_profile_cache(profile: Union[Optional[Profile], List[Profile], Set[Prof
             context = get_context()
 
         if isinstance(profile, Profile):
-            _save_single_profile(profile, context)
+            await _save_profiles([profile], context)
         elif isinstance(profile, (list, set)):
-            for _profile in profile:
-                _save_single_profile(_profile, context)
+            await _save_profiles(profile, context)
         else:
             raise ValueError(f"Incorrect profile value. Expected Profile or list of Profiles. Got {type(profile)}")
@@ -0,0 +1,30 @@
+from typing import Optional, Tuple
+
+from tracardi.context import Context
+from tracardi.domain.profile import Profile
+from tracardi.domain.session import Session
+from tracardi.service.tracking.cache import profile_cache, session_cache
+
+
+async def load_profile_and_session_cache(profile_id: Optional[str],
+                                         session_id: Optional[str],
+                                         context: Context) -> Tuple[Optional[Profile], Optional[Session]]:
+    """
+    Loads cached profile and session of the tracker payload in one redis round-trip.
+    """
+
+    keys = []
+    if profile_id:
+        keys.append((profile_id, profile_cache.get_profile_key_namespace(profile_id, context)))
+    if session_id:
+        keys.append((session_id, session_cache.get_session_key_namespace(session_id, context)))
+
+    if not keys:
+        return None, None
+
+    values = await profile_cache.redis_cache.get_many(keys)
+
+    profile = profile_cache.profile_from_cache(values.pop(0)) if profile_id else None
+    session = session_cache.session_from_cache(values.pop(0)) if session_id else None
+
+    return profile, session
@@ -1,4 +1,4 @@
-from typing import Optional, List, Union
+from typing import Optional, List, Union, Dict, Iterable
 
 from tracardi.config import tracardi
 from tracardi.context import Context
@@ -6,29 +6,33 @@ from tracardi.domain import ExtraInfo
 from tracardi.domain.session import Session
 from tracardi.domain.storage_record import RecordMetadata
 from tracardi.exceptions.log_handler import get_logger
-from tracardi.service.storage.redis.cache import RedisCache
+from tracardi.service.storage.redis.cache import AsyncRedisCache
 from tracardi.service.storage.redis.collections import Collection
-from tracardi.service.storage.redis_client import RedisClient
+from tracardi.service.tracking.cache import entity_codec
 from tracardi.service.tracking.cache.prefix import get_cache_prefix
 
-redis_cache = RedisCache(ttl=tracardi.keep_session_in_cache_for)
-_redis = RedisClient()
+redis_cache = AsyncRedisCache(ttl=tracardi.keep_session_in_cache_for)
 logger = get_logger(__name__)
 
 def get_session_key_namespace(session_id: str, context: Context) -> str:
     return f"{Collection.session}{context.context_abrv()}:{get_cache_prefix(session_id[0:2])}:"
 
 
-def load_session_cache(session_id: str, context: Context):
-
-    key_namespace = get_session_key_namespace(session_id, context)
-
-    if not redis_cache.has(session_id, key_namespace):
+def session_from_cache(_data) -> Optional[Session]:
+    if _data is None:
         return None
 
-    context, session, changes, session_metadata = redis_cache.get(
-        session_id,
-        key_namespace)
+    if entity_codec.is_encoded(_data):
+        decoded = entity_codec.decode(Session, _data)
+        if decoded is None:
+            return None
+        session, session_metadata = decoded
+        if session_metadata:
+            session.set_meta_data(RecordMetadata.model_construct(**session_metadata))
+        return session
+
+    # Format before entity_codec
+    context, session, changes, session_metadata = _data
 
     session = Session(**session)
     if session_metadata:
@@ -36,37 +40,64 @@ def load_session_cache(session_id: str, context: Context):
 
     return session
 
-def _save_single_session(session, context):
-    index = session.get_meta_data()
 
-    if index is None:
-        logger.warning("Empty session metadata. Index is not set. Cached session removed.",
+async def load_session_cache(session_id: str, context: Context):
+
+    key_namespace = get_session_key_namespace(session_id, context)
+
+    return session_from_cache(await redis_cache.get(
+        session_id,
+        key_namespace))
+
+
+async def load_session_caches(session_ids: List[str], context: Context) -> Dict[str, Optional[Session]]:
+    """
+    Loads many sessions from cache with MGET. Sessions that are not in cache are None.
+    """
+    session_ids = list(dict.fromkeys(session_ids))
+    values = await redis_cache.get_many(
+        [(session_id, get_session_key_namespace(session_id, context)) for session_id in session_ids])
+    return {session_id: session_from_cache(_data) for session_id, _data in zip(session_ids, values)}
+
+
+async def _save_sessions(sessions: Iterable[Session], context: Context):
+    items = []
+    missing_metadata = []
+    for session in sessions:
+        key = get_session_key_namespace(session.id, context)
+        index = session.get_meta_data()
+        if index is None:
+            missing_metadata.append((session.id, key))
+        else:
+            items.append((
+                session.id,
+                entity_codec.encode(
+                    session,
+                    {
+                        "production": context.production,
+                        "tenant": context.tenant
+                    },
+                    index,
+                    compress_above=tracardi.cache_compress_above
+                ),
+                key
+            ))
+
+    if missing_metadata:
+        logger.warning(f"Empty session metadata. Index is not set. {len(missing_metadata)} cached session(s) "
+                       f"removed.",
                        extra=ExtraInfo.exact(origin="cache", package=__name__))
-        redis_cache.delete(session.id, get_session_key_namespace(session.id, context))
-    else:
-        redis_cache.set(
-            session.id,
-            (
-                {
-                    "production": context.production,
-                    "tenant": context.tenant
-                },
-                session.model_dump(mode="json", exclude_defaults=True, exclude={"operation": ...}),
-                None,
-                index.model_dump(mode="json")
-            ),
-            get_session_key_namespace(session.id, context)
-        )
-
-def save_session_cache(session: Union[Optional[Session], List[Session]], context: Context):
+        await redis_cache.delete_many(missing_metadata)
+
+    await redis_cache.set_many(items)
+
+
+async def save_session_cache(session: Union[Optional[Session], List[Session]], context: Context):
     if session:
 
         if isinstance(session, Session):
-            _save_single_session(session, context)
+            await _save_sessions([session], context)
         elif isinstance(session, list):
-            for _session in session:
-                _save_single_session(_session, context)
+            await _save_sessions(session, context)
         else:
             raise ValueError(f"Incorrect session value. Expected Session or list of Sessions. Got {type(session)}")
-
-
@@ -1,5 +1,5 @@
 import asyncio
-from dotty_dict import dotty, Dotty
+from dotty_dict import dotty
 
 from typing import List, Tuple, Optional, Set
 
@@ -17,7 +17,7 @@ from tracardi.domain.payload.event_payload import EventPayload
 from tracardi.domain.payload.tracker_payload import TrackerPayload
 from tracardi.domain.profile import Profile, FlatProfile
 from tracardi.domain.session import Session
-from tracardi.domain.event import Event
+from tracardi.domain.event import Event, FlatEvent
 from tracardi.service.events import get_default_mappings_for
 from tracardi.service.tracking.utils.function_call import default_event_call_function
 from tracardi.service.utils.getters import get_entity_id
@@ -39,7 +39,35 @@ def _remove_empty_dicts(dictionary):
         del dictionary[key]
 
 
-def _auto_index_default_event_type(flat_event: Dotty, flat_profile: Optional[FlatProfile]) -> Dotty:
+def _without_empty_dicts(dictionary: dict) -> dict:
+    """
+    Returns dictionary without nested empty dictionaries. Dictionary is copied only if it has empty dictionaries,
+    as it may be shared with event payload.
+    """
+    result = None
+    for key, value in dictionary.items():
+        if isinstance(value, dict):
+            cleaned = _without_empty_dicts(value)
+            if cleaned is value and cleaned:
+                continue
+            if result is None:
+                result = dict(dictionary)
+            if cleaned:
+                result[key] = cleaned
+            else:
+                del result[key]
+    return dictionary if result is None else result
+
+
+def _remove_empty_event_dicts(event: Event):
+    for field, value in event.__dict__.items():
+        if isinstance(value, dict) and value:
+            cleaned = _without_empty_dicts(value)
+            if cleaned is not value:
+                event.__dict__[field] = cleaned
+
+
+def _auto_index_default_event_type(flat_event: FlatEvent, flat_profile: Optional[FlatProfile]) -> FlatEvent:
     event_mapping_schema = get_default_mappings_for(flat_event['type'], 'copy')
 
     if event_mapping_schema is not None:
@@ -70,11 +98,11 @@ def _auto_index_default_event_type(flat_event: Dotty, flat_profile: Optional[Fla
     return flat_event
 
 
-async def event_to_profile_mapping(flat_event: Dotty,
+async def event_to_profile_mapping(flat_event: FlatEvent,
                                             flat_profile: Optional[FlatProfile],
                                             session:Session,
                                             source: EventSource) -> Tuple[
-    Dotty, Optional[FlatProfile], Optional[FieldTimestampMonitor], Set[str]]:
+    FlatEvent, Optional[FlatProfile], Optional[FieldTimestampMonitor], Set[str]]:
 
     auto_merge_ids = set()
 
@@ -94,13 +122,20 @@ async def event_to_profile_mapping(flat_event: Dotty,
     # Custom event mapping
     if License.has_license():
 
+        # Custom event mappers work on dotty
+        dotty_event = dotty(flat_event.to_dict())
+
         # Map event properties to traits
-        flat_event = map_event_props_to_traits(flat_event,
-                                               custom_event_mapping)
+        dotty_event = map_event_props_to_traits(dotty_event,
+                                                custom_event_mapping)
 
         # Add event tags and add journey tag
-        flat_event = map_events_tags_and_journey(flat_event,
-                                                 custom_event_mapping)
+        dotty_event = map_events_tags_and_journey(dotty_event,
+                                                  custom_event_mapping)
+
+        event_dict = dotty_event.to_dict()
+        _remove_empty_dicts(event_dict)
+        flat_event = FlatEvent(Event(**event_dict))
 
     # Map event data to profile
     profile_changes = None
@@ -195,7 +230,7 @@ async def compute_events(events: List[EventPayload],
     field_changes_monitors = []
     for event_payload in events:
 
-        # For performance reasons we return flat_event and after mappings convert to event.
+        # Mappings are applied to the event, flat profile is shared by all events and converted to profile once.
         event = await make_event_from_event_payload(
             event_payload,
             profile,
@@ -205,16 +240,16 @@ async def compute_events(events: List[EventPayload],
             profile_less
         )
 
-        flat_event = dotty(event.model_dump(exclude_unset=True))
-
-        if flat_event.get('metadata.valid', True) is True:
+        if event.metadata.valid is True:
             # Run mappings for valid event. Maps properties to traits, and adds traits
             flat_event, flat_profile, field_timestamp_monitor, _auto_merge_ids = await event_to_profile_mapping(
-                flat_event,
+                FlatEvent(event),
                 flat_profile,
                 session,
                 source)
 
+            event = flat_event.event
+
             field_changes_monitors.append(field_timestamp_monitor)
 
             # Combine all auto merge ids
@@ -222,10 +257,7 @@ async def compute_events(events: List[EventPayload],
             if _auto_merge_ids:
                 auto_merge_ids = auto_merge_ids.union(_auto_merge_ids)
 
-        # Convert to event
-        event_dict = flat_event.to_dict()
-        _remove_empty_dicts(event_dict)
-        event = Event(**event_dict)
+        _remove_empty_event_dicts(event)
 
         # Data that is not needed for any mapping or compliance
 
@@ -266,9 +298,9 @@ async def compute_events(events: List[EventPayload],
         field_timestamp_monitor = None
 
 
-    # Recreate Profile from flat_profile, that was changed
+    # Recreate Profile from flat_profile, only if it was changed
 
-    if profile:
+    if profile and flat_profile.changed:
         try:
             profile = Profile(**flat_profile.to_dict())
             profile.set_meta_data(profile_metadata)
@@ -2,16 +2,19 @@ import time
 import msgpack
 import asyncio
 
-from typing import Union, Tuple, Optional
+from collections import defaultdict
+from typing import Union, Tuple, Optional, NamedTuple, List, Dict, Set
 
 from tracardi.domain.profile import Profile
 from tracardi.exceptions.log_handler import get_logger
 from tracardi.service.storage.redis.collections import Collection
-from tracardi.service.storage.redis_client import RedisClient
+from tracardi.service.storage.redis_client import RedisClient, AsyncRedisClient
+from tracardi.service.tracing import tracer
 from tracardi.service.tracking.storage.profile_storage import load_profile
 
 logger = get_logger(__name__)
 _redis = RedisClient()
+_async_redis = AsyncRedisClient()
 
 LOCKED = 0
 BROKE = 1
@@ -130,11 +133,262 @@ class Lock:
         return self.state == EXPIRED
 
 
+class LockMetadata(NamedTuple):
+    time: float
+    name: str
+    state: int
+    token: Optional[str]
+    ttl: int  # Milliseconds to expire, negative if unknown
+
+
+# KEYS[1] - lock, KEYS[2] - fencing counter
+# ARGV[1] - time, ARGV[2] - mutex name, ARGV[3] - lock ttl in ms, ARGV[4] - fencing counter ttl in ms
+_ACQUIRE_SCRIPT = """
+local holder = redis.call('hmget', KEYS[1], 'time', 'name', 'state', 'token')
+if holder[4] then
+    return {0, holder[1], holder[2], holder[3], holder[4], redis.call('pttl', KEYS[1])}
+end
+local token = redis.call('incr', KEYS[2])
+redis.call('pexpire', KEYS[2], ARGV[4])
+redis.call('hset', KEYS[1], 'time', ARGV[1], 'name', ARGV[2], 'state', '0', 'token', token)
+redis.call('pexpire', KEYS[1], ARGV[3])
+return {1, ARGV[1], ARGV[2], '0', tostring(token), tonumber(ARGV[3])}
+"""
+
+# KEYS[1] - lock, KEYS[2] - fencing counter
+# ARGV[1] - token of the holder to break, ARGV[2] - time, ARGV[3] - mutex name, ARGV[4] - lock ttl in ms,
+# ARGV[5] - fencing counter ttl in ms
+_BREAK_IN_SCRIPT = """
+if redis.call('hget', KEYS[1], 'token') ~= ARGV[1] then
+    return false
+end
+local token = redis.call('incr', KEYS[2])
+redis.call('pexpire', KEYS[2], ARGV[5])
+redis.call('hset', KEYS[1], 'time', ARGV[2], 'name', ARGV[3], 'state', '1', 'token', token)
+redis.call('pexpire', KEYS[1], ARGV[4])
+return tostring(token)
+"""
+
+# KEYS[1] - lock
+# ARGV[1] - token of the holder, ARGV[2] - release notification channel
+_RELEASE_SCRIPT = """
+if redis.call('hget', KEYS[1], 'token') ~= ARGV[1] then
+    return 0
+end
+redis.call('del', KEYS[1])
+redis.call('publish', ARGV[2], ARGV[1])
+return 1
+"""
+
+_acquire_script = _async_redis.register_script(_ACQUIRE_SCRIPT)
+_break_in_script = _async_redis.register_script(_BREAK_IN_SCRIPT)
+_release_script = _async_redis.register_script(_RELEASE_SCRIPT)
+
+
+def _decode(value) -> Optional[str]:
+    if isinstance(value, bytes):
+        return value.decode()
+    return value
+
+
+class AsyncLock:
+
+    """
+    Lock with the same semantics as Lock but backed by the non-blocking redis client. Acquisition, break in and
+    release are atomic (lua scripts). Each acquisition gets a monotonically increasing fencing token, only the
+    holder of the current token can release the lock. Release is announced on pub/sub so waiters do not poll.
+    """
+
+    fencing_token_ttl = 24 * 60 * 60 * 1000
+
+    def __init__(self, redis: AsyncRedisClient, key, default_lock_ttl: float):
+        self._redis = redis
+        self._key = key
+        self._lock_ttl = default_lock_ttl
+        self._token = None
+
+    @property
+    def ttl(self):
+        return self._lock_ttl
+
+    @property
+    def key(self):
+        return self._key
+
+    @property
+    def token(self) -> Optional[str]:
+        return self._token
+
+    @property
+    def channel(self) -> str:
+        return self._redis.get_tenant_prefix(f"{Collection.lock_release}{self._key}")
+
+    def _keys(self) -> List[str]:
+        key = self._redis.get_tenant_prefix(self._key)
+        return [key, f"{key}:fencing"]
+
+    @staticmethod
+    def _metadata(result) -> LockMetadata:
+        _, lock_time, name, state, token, ttl = result
+        return LockMetadata(float(lock_time), _decode(name), int(state), _decode(token), int(ttl))
+
+    async def acquire(self, mutex_name: str) -> Tuple[bool, LockMetadata]:
+
+        """
+        Returns True and metadata of the acquired lock or False and metadata of the current lock holder.
+        """
+
+        result = await _acquire_script(keys=self._keys(),
+                                       args=[time.time(), mutex_name, int(self._lock_ttl * 1000),
+                                             self.fencing_token_ttl])
+        metadata = self._metadata(result)
+        acquired = int(result[0]) == 1
+        if acquired:
+            logger.debug(f"Locking {self.key}")
+            self._token = metadata.token
+        return acquired, metadata
+
+    async def break_in(self, mutex_name: str, holder: LockMetadata) -> bool:
+
+        """
+        Takes over the lock from the holder and marks it BROKE. Fails if the lock changed hands in the meantime.
+        """
+
+        token = await _break_in_script(keys=self._keys(),
+                                       args=[holder.token, time.time(), mutex_name, int(self._lock_ttl * 1000),
+                                             self.fencing_token_ttl])
+        if token is None:
+            return False
+        self._token = _decode(token)
+        return True
+
+    async def delete(self):
+        await self._redis.delete(self._key)
+
+    async def unlock(self):
+        logger.debug(f"UnLocking {self.key}")
+        if self._token is not None:
+            await _release_script(keys=self._keys()[:1], args=[self._token, self.channel])
+            self._token = None
+
+    async def is_locked(self) -> bool:
+        if self._key is None:
+            return False
+        return await self._redis.exists(self._key) != 0
+
+    async def get_lock_metadata(self) -> Optional[LockMetadata]:
+        payload = await self._redis.hgetall(self._key)
+        if not payload:
+            return None
+        payload = {_decode(key): _decode(value) for key, value in payload.items()}
+        return LockMetadata(float(payload['time']), payload['name'], int(payload['state']), payload['token'], -1)
+
+    async def get_state(self) -> int:
+        try:
+            metadata = await self.get_lock_metadata()
+            if not metadata:
+                return RELEASED
+            return metadata.state
+        except Exception as e:
+            logger.error(str(e))
+            await self.delete()
+            return RELEASED
+
+    async def get_locked_inside(self) -> Optional[str]:
+        try:
+            metadata = await self.get_lock_metadata()
+            if metadata:
+                return metadata.name
+        except Exception as e:
+            await self.delete()
+            logger.error(str(e))
+        return None
+
+    async def is_broke(self) -> bool:
+        return await self.get_state() == BROKE
+
+    async def is_expired(self) -> bool:
+        return await self.get_state() == EXPIRED
+
+
+class _LockReleaseListener:
+
+    """
+    One pub/sub subscription per process and tenant that wakes up coroutines waiting for a released lock.
+    Release channels are tenant prefixed, so the subscription pattern is as well.
+    """
+
+    def __init__(self, redis: AsyncRedisClient):
+        self._redis = redis
+        self._waiters: Dict[str, Set[asyncio.Event]] = defaultdict(set)
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._subscribed: Set[str] = set()
+        self._loop = None
+
+    def _pattern(self) -> str:
+        return self._redis.get_tenant_prefix(f"{Collection.lock_release}*")
+
+    def _ensure_running(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._tasks = {}
+            self._subscribed = set()
+
+        pattern = self._pattern()
+        task = self._tasks.get(pattern, None)
+        if task is None or task.done():
+            self._tasks[pattern] = loop.create_task(self._listen(pattern))
+
+    @property
+    def subscribed(self) -> bool:
+        return self._pattern() in self._subscribed
+
+    async def _listen(self, pattern: str):
+        pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+        try:
+            await pubsub.psubscribe(pattern)
+            self._subscribed.add(pattern)
+            async for message in pubsub.listen():
+                if message is None or message['type'] != 'pmessage':
+                    continue
+                for event in self._waiters.get(_decode(message['channel']), ()):
+                    event.set()
+        except Exception as e:
+            logger.warning(f"Lock release listener stopped. Falling back to polling. Reason: {str(e)}")
+        finally:
+            self._subscribed.discard(pattern)
+            await pubsub.reset()
+
+    def watch(self, channel: str) -> asyncio.Event:
+        self._ensure_running()
+        event = asyncio.Event()
+        self._waiters[channel].add(event)
+        return event
+
+    def unwatch(self, channel: str, event: asyncio.Event):
+        waiters = self._waiters.get(channel)
+        if waiters is not None:
+            waiters.discard(event)
+            if not waiters:
+                del self._waiters[channel]
+
+    @staticmethod
+    async def wait(event: asyncio.Event, timeout: float):
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+
+_lock_release_listener = _LockReleaseListener(_async_redis)
+
+
 class _GlobalMutexLock:
 
-    def __init__(self, lock: Lock, name: str, break_after_time: Union[int, float] = None):
+    def __init__(self, lock: Union[Lock, AsyncLock], name: str, break_after_time: Union[int, float] = None):
         self._name = name
-        self._lock: Lock = lock
+        self._lock = lock
         self._wait = 0.05
         self._time = time.time()
         self._break_after_time = break_after_time
@@ -223,100 +477,97 @@ class GlobalMutexLock(_GlobalMutexLock):
     def __exit__(self, exc_type, exc_val, exc_tb):
         self._exit(exc_type)
 
-
 class AsyncGlobalMutexLock(_GlobalMutexLock):
 
-    async def _keep_locked_for(self) -> 'Lock':
+    def __init__(self, lock: AsyncLock, name: str, break_after_time: Union[int, float] = None,
+                 raise_error_when_locked: bool = False):
+        super().__init__(lock, name, break_after_time)
+        self._lock: AsyncLock = lock
+        self._raise_error_when_locked = raise_error_when_locked
+        # Safety net for missed notifications, e.g. lock expired by ttl, not released.
+        self._max_wait = 0.5
+
+    async def _raise_if_locked(self):
+        if self._raise_error_when_locked and await self._lock.is_locked():
+            raise BlockingIOError(
+                f"Resource {self._lock.key} is locked. Currently locked by (Running process): "
+                f"{await self._lock.get_locked_inside()}, Knocking consumer (Waiting process): {self._name}")
 
-        while True:
-            _now = time.time()
-            if self._lock.is_locked():  # Key exists, when expires it will be unlocked
+    def _get_wait_time(self, holder: LockMetadata, time_to_break: float) -> float:
+        if not _lock_release_listener.subscribed:
+            return self._wait
+        wait = min(time_to_break, self._max_wait)
+        if holder.ttl >= 0:
+            wait = min(wait, holder.ttl / 1000)
+        return max(wait, 0.001)
 
-                lock_time = self._get_lock_time()
+    async def _keep_locked_for(self) -> 'AsyncLock':
+
+        channel = self._lock.channel
+        while True:
+            # Watch before acquiring, so the release can not slip in between.
+            released = _lock_release_listener.watch(channel)
+            try:
+                acquired, holder = await self._lock.acquire(self._name)
+                if acquired:
+                    return self._lock
 
                 # Check if there is a time to break the lock
-                _broke, _time_to_break = self._check_if_it_is_time(lock_time, grace_period=self._break_after_time)
+                _broke, _time_to_break = self._check_if_it_is_time(holder.time, grace_period=self._break_after_time)
                 if _broke:  # Time is up
                     # We are fed up waiting
                     logger.info(
-                        f"Lock {self._lock.key} breaks. Currently locked by (Running process): {self._lock.get_locked_inside()}, Knocking consumer (Waiting process): {self._name}")
-                    self._lock.break_in()  # Still locked but break in marked BROKE
-                    return self._lock
+                        f"Lock {self._lock.key} breaks. Currently locked by (Running process): {holder.name}, Knocking consumer (Waiting process): {self._name}")
+                    if await self._lock.break_in(self._name, holder):  # Still locked but marked BROKE
+                        return self._lock
+                    continue
 
                 logger.info(
-                    f"Suppressing execution of {self._lock.key}. Process {self._lock.get_locked_inside()} is using resource."
+                    f"Suppressing execution of {self._lock.key}. Process {holder.name} is using resource."
                     f"Expires in {self._lock.ttl}s. Waiting no longer then {_time_to_break}s then skipping execution."
                 )
 
-                await asyncio.sleep(self._wait)
+                await _lock_release_listener.wait(released, self._get_wait_time(holder, _time_to_break))
+            finally:
+                _lock_release_listener.unwatch(channel, released)
 
-                continue
-            break
+    async def _exit(self, exc_type):
+        if exc_type is not None:
+            logger.info(f"Unlocking due to error.")
+            await self._lock.unlock()
 
-        self._lock.lock(self._name)
+        elif self._lock.key:
+            await self._lock.unlock()
 
     async def __aenter__(self):
         if self._lock.key is None:
             return self._lock
-        await self._keep_locked_for()
+        await self._raise_if_locked()
+        with tracer.span(f"lock.wait.{self._name}", lock=self._lock.key):
+            await self._keep_locked_for()
         return self._lock
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        self._exit(exc_type)
+        await self._exit(exc_type)
 
 
-class AsyncProfileMutex(_GlobalMutexLock):
+class AsyncProfileMutex(AsyncGlobalMutexLock):
 
     def __init__(self, profile_id: str, name: str, break_after_time: Union[int, float] = None,
                  raise_error_when_locked: bool = False):
         self.profile_id = profile_id
         profile_key = Lock.get_key(Collection.lock_tracker, "profile", profile_id)
-        profile_lock = Lock(_redis, profile_key, default_lock_ttl=3)
-        if profile_lock.is_locked() and raise_error_when_locked:
-            raise BlockingIOError(
-                f"Profile {profile_lock.key} is locked. Currently locked by (Running process): "
-                f"{profile_lock.get_locked_inside()}, Knocking consumer (Waiting process): {name}")
-
-        super().__init__(profile_lock, name, break_after_time)
-
-    async def _keep_locked_for(self) -> 'Lock':
-
-        while True:
-            _now = time.time()
-            if self._lock.is_locked():  # Key exists, when expires it will be unlocked
-
-                lock_time = self._get_lock_time()
-
-                # Check if there is a time to break the lock
-                _broke, _time_to_break = self._check_if_it_is_time(lock_time, grace_period=self._break_after_time)
-                if _broke:  # Time is up
-                    # We are fed up waiting
-                    logger.info(
-                        f"Lock {self._lock.key} breaks. Currently locked by (Running process): {self._lock.get_locked_inside()}, Knocking consumer (Waiting process): {self._name}")
-                    self._lock.break_in()  # Still locked but break in marked BROKE
-                    return self._lock
-
-                logger.info(
-                    f"Suppressing execution of {self._lock.key}. Process {self._lock.get_locked_inside()} is using resource."
-                    f"Expires in {self._lock.ttl}s. Waiting no longer then {_time_to_break}s then skipping execution."
-                )
-
-                await asyncio.sleep(self._wait)
-
-                continue
-            break
-
-        self._lock.lock(self._name)
+        profile_lock = AsyncLock(_async_redis, profile_key, default_lock_ttl=3)
+        super().__init__(profile_lock, name, break_after_time, raise_error_when_locked)
 
     async def __aenter__(self) -> Optional[Profile]:
         if self._lock.key is None:
             return await load_profile(self.profile_id)
-        await self._keep_locked_for()
+        await self._raise_if_locked()
+        with tracer.span(f"lock.wait.{self._name}", lock=self._lock.key):
+            await self._keep_locked_for()
         return await load_profile(self.profile_id)
 
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
-        self._exit(exc_type)
-
 
 def mutex(lock: Lock, name: str, break_after_time: Union[int, float] = None, raise_error_when_locked: bool = False):
     if lock.is_locked() and raise_error_when_locked:
@@ -325,14 +576,11 @@ def mutex(lock: Lock, name: str, break_after_time: Union[int, float] = None, rai
     return GlobalMutexLock(lock, name, break_after_time)
 
 
-def async_mutex(lock: Lock,
+def async_mutex(lock: AsyncLock,
                 name: str,
                 break_after_time: Union[int, float] = None,
                 raise_error_when_locked: bool = False):
-    if lock.is_locked() and raise_error_when_locked:
-        raise BlockingIOError(
-            f"Resource {lock.key} is locked. Currently locked by (Running process): {lock.get_locked_inside()}, Knocking consumer (Waiting process): {name}")
-    return AsyncGlobalMutexLock(lock, name, break_after_time)
+    return AsyncGlobalMutexLock(lock, name, break_after_time, raise_error_when_locked)
 
 
 def profile_mutex(profile_id: str,
@@ -1,9 +1,12 @@
 from typing import Tuple, Optional
 
+from tracardi.context import get_context
 from tracardi.domain.profile import Profile
 from tracardi.domain.session import Session
 from tracardi.service.tracking.profile_loading import load_profile_and_session
 from tracardi.service.tracking.session_loading import load_or_create_session
+from tracardi.service.tracking.cache.profile_session_cache import load_profile_and_session_cache
+from tracardi.service.utils.getters import get_entity_id
 
 from tracardi.domain.payload.tracker_payload import TrackerPayload
 
@@ -14,7 +17,14 @@ async def tracker_loading(tracker_payload: TrackerPayload,
                           tracker_config: TrackerConfig) -> Tuple[Profile, Optional[Session]]:
     # We need profile and session before async
 
-    session, tracker_payload = await load_or_create_session(tracker_payload)
+    # Both from cache in one round-trip
+    cached_profile, cached_session = await load_profile_and_session_cache(
+        get_entity_id(tracker_payload.profile),
+        get_entity_id(tracker_payload.session),
+        get_context()
+    )
+
+    session, tracker_payload = await load_or_create_session(tracker_payload, cached_session)
 
     # -----------------------------------
     # Profile Loading
@@ -24,7 +34,8 @@ async def tracker_loading(tracker_payload: TrackerPayload,
     profile, session = await load_profile_and_session(
         session,
         tracker_config,
-        tracker_payload
+        tracker_payload,
+        cached_profile
     )
 
     return profile, session
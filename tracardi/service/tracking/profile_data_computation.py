@@ -1,9 +1,7 @@
 from typing import Tuple, List
 
-from dotty_dict import Dotty
-
 from tracardi.domain import ExtraInfo
-from tracardi.domain.event import Event
+from tracardi.domain.event import FlatEvent
 from tracardi.domain.event_compute import EventCompute
 from tracardi.domain.event_source import EventSource
 from tracardi.domain.event_to_profile import EventToProfile
@@ -79,7 +77,7 @@ async def _check_mapping_condition_if_met(if_statement, dot: DotAccessor):
 
 async def map_event_to_profile(
         custom_mapping_schemas: List[EventToProfile],
-        flat_event: Dotty,
+        flat_event: FlatEvent,
         flat_profile: FlatProfile,
         session: Session,
         source: EventSource) -> Tuple[FlatProfile, FieldTimestampMonitor]:
@@ -115,7 +113,7 @@ async def map_event_to_profile(
                 if_statement = custom_mapping_schema.config['condition']
                 try:
                     # Todo converting to Profile and event may be not performant, maybe extend dot accessor to take dotty
-                    dot = DotAccessor(event=Event(**flat_event.to_dict()), profile=Profile(**flat_profile.to_dict()), session=session)
+                    dot = DotAccessor(event=flat_event.event, profile=Profile(**flat_profile.to_dict()), session=session)
                     result = await _check_mapping_condition_if_met(if_statement, dot)
                     if result is False:
                         continue
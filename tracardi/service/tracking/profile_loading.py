@@ -12,7 +12,8 @@ logger = get_logger(__name__)
 
 async def _load_profile_and_deduplicate(
         tracker_payload,
-        is_static=False) -> Optional[Profile]:
+        is_static=False,
+        cached_profile: Optional[Profile] = None) -> Optional[Profile]:
     """
     Loads current profile. If profile was merged then it loads merged profile.
     """
@@ -21,7 +22,10 @@ async def _load_profile_and_deduplicate(
 
     profile_id = tracker_payload.profile.id
 
-    profile = await load_profile(profile_id)
+    if cached_profile is not None and cached_profile.id == profile_id and cached_profile.has_meta_data():
+        profile = cached_profile
+    else:
+        profile = await load_profile(profile_id)
 
     if profile is not None:
         return profile
@@ -42,10 +46,13 @@ async def _load_profile_and_deduplicate(
 async def load_profile_and_session(
         session: Session,
         tracker_config: TrackerConfig,
-        tracker_payload: TrackerPayload
+        tracker_payload: TrackerPayload,
+        cached_profile: Optional[Profile] = None
 ) -> Tuple[Optional[Profile], Optional[Session]]:
     # Load profile
-    profile_loader = _load_profile_and_deduplicate
+
+    async def profile_loader(tracker_payload, is_static=False):
+        return await _load_profile_and_deduplicate(tracker_payload, is_static, cached_profile)
 
     # Force static profile id
 
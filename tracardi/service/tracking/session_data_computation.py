@@ -1,7 +1,6 @@
 from typing import Tuple, Optional
 
 from pydantic import ValidationError
-from user_agents import parse
 from user_agents.parsers import UserAgent
 
 from tracardi.service.tracking.utils.languages import get_spoken_languages
@@ -12,6 +11,7 @@ from tracardi.domain.session import Session
 from tracardi.domain.payload.tracker_payload import TrackerPayload
 from tracardi.domain.geo import Geo
 from tracardi.exceptions.log_handler import get_logger
+from tracardi.service.cache.user_agent import user_agent_cache
 from tracardi.service.tracker_config import TrackerConfig
 
 logger = get_logger(__name__)
@@ -33,10 +33,7 @@ def _get_user_agent(session: Session, tracker_payload: TrackerPayload) -> Option
         return _user_agent
 
     _user_agent_string = _get_user_agent_string(session, tracker_payload)
-    if _user_agent_string:
-        return parse(_user_agent_string)
-
-    return None
+    return user_agent_cache.parse(_user_agent_string)
 
 def _compute_data_from_user_agent(session: Session, tracker_payload: TrackerPayload) -> Session:
     user_agent = _get_user_agent(session, tracker_payload)
@@ -9,7 +9,8 @@ from tracardi.domain.session import Session
 from tracardi.service.utils.getters import get_entity_id
 
 
-async def load_or_create_session(tracker_payload: TrackerPayload) -> Tuple[Optional[Session], TrackerPayload]:
+async def load_or_create_session(tracker_payload: TrackerPayload,
+                                 cached_session: Optional[Session] = None) -> Tuple[Optional[Session], TrackerPayload]:
 
     session_id = get_entity_id(tracker_payload.session)
 
@@ -35,6 +36,9 @@ async def load_or_create_session(tracker_payload: TrackerPayload) -> Tuple[Optio
 
     else:
 
+        if cached_session is not None and cached_session.id == session_id:
+            return cached_session, tracker_payload
+
         # Loads session from ES
         session = await load_session(session_id)
 
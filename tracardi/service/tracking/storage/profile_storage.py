@@ -4,6 +4,7 @@ from tracardi.service.tracking.cache.profile_cache import load_profile_cache, sa
 from tracardi.context import Context, get_context
 from tracardi.domain.profile import Profile
 from tracardi.service.storage.driver.elastic import profile as profile_db
+from tracardi.service.storage.refresh_coordinator import refresh_coordinator
 
 async def delete_profile(id: str,
                          index: str,
@@ -14,9 +15,9 @@ async def delete_profile(id: str,
         context = get_context()
 
     result = await profile_db.delete_by_id(id, index)
-    await profile_db.refresh()
+    refresh_coordinator.request('profile')
     if cache:
-        delete_profile_cache(profile_id=id, context=context)
+        await delete_profile_cache(profile_id=id, context=context)
 
     return result
 
@@ -29,10 +30,13 @@ async def save_profile(profiles: Union[Profile, List[Profile], Set[Profile]],
     if context is None:
         context = get_context()
 
-    await profile_db.save(profiles, refresh_after_save=refresh)
+    await profile_db.save(profiles)
 
     if cache:
-        save_profile_cache(profiles, context)
+        await save_profile_cache(profiles, context)
+
+    if refresh:
+        refresh_coordinator.request('profile')
 
 
 async def load_profile(profile_id: str, context: Optional[Context] = None, fallback_to_db: bool =True) -> Optional[Profile]:
@@ -40,7 +44,7 @@ async def load_profile(profile_id: str, context: Optional[Context] = None, fallb
     if context is None:
         context = get_context()
 
-    cached_profile = load_profile_cache(profile_id, context)
+    cached_profile = await load_profile_cache(profile_id, context)
 
     if cached_profile is not None and cached_profile.has_meta_data():
         return cached_profile
@@ -55,7 +59,7 @@ async def load_profile(profile_id: str, context: Optional[Context] = None, fallb
     if profile_record is not None:
         profile = Profile.create(profile_record)
 
-    save_profile_cache(profile, context)
+    await save_profile_cache(profile, context)
 
     return profile
 
@@ -68,7 +72,10 @@ async def store_profile(profiles: Union[Profile, List[Profile], Set[Profile]],
     if context is None:
         context = get_context()
 
-    await profile_db.save(profiles, refresh_after_save=refresh)
+    await profile_db.save(profiles)
 
     if cache:
-        save_profile_cache(profiles, context)
\ No newline at end of file
+        await save_profile_cache(profiles, context)
+
+    if refresh:
+        refresh_coordinator.request('profile')
\ No newline at end of file
@@ -1,7 +1,7 @@
 from typing import Optional, Union, List, Set
 
-from tracardi.service.storage.elastic.interface.session import load_session_from_db, save_session_to_db, \
-    refresh_session_db
+from tracardi.service.storage.elastic.interface.session import load_session_from_db, save_session_to_db
+from tracardi.service.storage.refresh_coordinator import refresh_coordinator
 from tracardi.service.tracking.cache.session_cache import load_session_cache, save_session_cache
 from tracardi.context import Context, get_context
 from tracardi.domain.session import Session
@@ -13,13 +13,13 @@ async def load_session(session_id: str,
     if context is None:
         context = get_context()
 
-    cached_session = load_session_cache(session_id, context)
+    cached_session = await load_session_cache(session_id, context)
     if cached_session is not None:
         return cached_session
 
     session = await load_session_from_db(session_id)
     if session:
-        save_session_cache(session, context)
+        await save_session_cache(session, context)
 
     return session
 
@@ -33,11 +33,12 @@ async def save_session(sessions: Union[Session, List[Session], Set[Session]],
         context = get_context()
 
     await save_session_to_db(sessions)
-    if refresh:
-        await refresh_session_db()
 
     if cache:
-        save_session_cache(sessions, context)
+        await save_session_cache(sessions, context)
+
+    if refresh:
+        refresh_coordinator.request('session')
 
 
 async def store_session(sessions: Union[Session, List[Session], Set[Session]],
@@ -53,8 +54,9 @@ async def store_session(sessions: Union[Session, List[Session], Set[Session]],
         context = get_context()
 
     await save_session_to_db(sessions)
-    if refresh:
-        await refresh_session_db()
 
     if cache:
-        save_session_cache(sessions, context)
+        await save_session_cache(sessions, context)
+
+    if refresh:
+        refresh_coordinator.request('session')
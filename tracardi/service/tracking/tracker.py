@@ -1,7 +1,10 @@
 import time
 
+from tracardi.service.cache.workflow import workflow_cache
+from tracardi.service.cache.user_agent import user_agent_cache
+from tracardi.service.decorators.function_memory_cache import cache_stats
 from tracardi.service.storage.elastic.interface.event import save_events_in_db
-from tracardi.service.storage.redis_client import RedisClient
+from tracardi.service.storage.redis_client import AsyncRedisClient
 from tracardi.service.tracking.destination.dispatcher import sync_event_destination, sync_profile_destination
 from tracardi.service.tracking.process.loading import tracker_loading
 from tracardi.service.tracking.storage.profile_storage import save_profile
@@ -15,11 +18,16 @@ from tracardi.service.utils.getters import get_entity_id
 from tracardi.service.wf.triggers import exec_workflow
 from tracardi.service.storage.driver.elastic import field_update_log as field_update_log_db
 from tracardi.service.storage.redis.collections import Collection
-from tracardi.service.tracking.locking import Lock, async_mutex
+from tracardi.service.tracking.locking import Lock, AsyncLock, async_mutex
+from tracardi.service.wf.service.plugin_pool import set_up_timer
+from tracardi.service.tracardi_http_client import http_client_pool
+from tracardi.service.tracing import tracer
+from tracardi.service.merging.reassignment_engine import reassignment_engine
+from tracardi.service.storage.mysql.engine import AsyncMySqlEngine
 
 
 logger = get_logger(__name__)
-_redis = RedisClient()
+_redis = AsyncRedisClient()
 
 
 async def os_tracker(source: EventSource,
@@ -34,42 +42,47 @@ async def os_tracker(source: EventSource,
             return None
 
         # Load profile and session
-        profile, session = await tracker_loading(tracker_payload, tracker_config)
+        with tracer.span("tracker.loading"):
+            profile, session = await tracker_loading(tracker_payload, tracker_config)
 
         # We need profile ID to lock.
 
         profile_key = Lock.get_key(Collection.lock_tracker, "profile", get_entity_id(profile))
-        profile_lock = Lock(_redis, profile_key, default_lock_ttl=3)
+        profile_lock = AsyncLock(_redis, profile_key, default_lock_ttl=3)
 
         # If not profile ID then no locking
 
         async with async_mutex(profile_lock, name='lock_and_compute_data_profile'):
 
             # Lock profile and session for changes and compute data
-            profile, session, events, tracker_payload, field_timestamp_monitor = await compute_data(
-                profile,
-                session,
-                tracker_payload,
-                tracker_config,
-                source
-            )
+            with tracer.span("tracker.compute_data"):
+                profile, session, events, tracker_payload, field_timestamp_monitor = await compute_data(
+                    profile,
+                    session,
+                    tracker_payload,
+                    tracker_config,
+                    source
+                )
 
             # MUST BE INSIDE MUTEX until it stores data to cache
 
             # Save profile
             if profile and profile.has_not_saved_changes():
                 # Sync save
-                await save_profile(profile)
+                with tracer.span("tracker.save_profile"):
+                    await save_profile(profile)
 
             # Save session
             if session and session.has_not_saved_changes():
                 # Sync save
-                await save_session(session)
+                with tracer.span("tracker.save_session"):
+                    await save_session(session)
 
             # Save events
             if events:
                 # Sync save
-                await save_events_in_db(events)
+                with tracer.span("tracker.save_events"):
+                    await save_events_in_db(events)
 
         # Save field change log
         if field_timestamp_monitor:
@@ -86,19 +99,21 @@ async def os_tracker(source: EventSource,
                 del tracker_payload.context['utm']
 
             # Dispatch events SYNCHRONOUSLY
-            await sync_event_destination(
-                profile,
-                session,
-                events,
-                tracker_payload.debug)
+            with tracer.span("tracker.event_destination"):
+                await sync_event_destination(
+                    profile,
+                    session,
+                    events,
+                    tracker_payload.debug)
 
             # Dispatch outbound profile SYNCHRONOUSLY
             changed_fields_monitor = field_timestamp_monitor.get_timestamps_log()
-            await sync_profile_destination(
-                profile,
-                session,
-                changed_fields_monitor.get_history_log(add_id=False)
-            )
+            with tracer.span("tracker.profile_destination"):
+                await sync_profile_destination(
+                    profile,
+                    session,
+                    changed_fields_monitor.get_history_log(add_id=False)
+                )
 
             # ----------------------------------------------
             # FROM THIS POINT EVENTS AND SESSION SHOULD NOT
@@ -106,11 +121,12 @@ async def os_tracker(source: EventSource,
             # ----------------------------------------------
 
             # MUTEX: Session and profile are saved if workflow triggered
-            profile, session, events, ux, response, wf_field_changes, is_wf_triggered = await exec_workflow(
-                get_entity_id(profile),
-                session,
-                events,
-                tracker_payload)
+            with tracer.span("tracker.workflow"):
+                profile, session, events, ux, response, wf_field_changes, is_wf_triggered = await exec_workflow(
+                    get_entity_id(profile),
+                    session,
+                    events,
+                    tracker_payload)
 
             if wf_field_changes.has_changes():
                 # Dispatch outbound profile SYNCHRONOUSLY again because the profile changed
@@ -120,7 +136,7 @@ async def os_tracker(source: EventSource,
                     wf_field_changes.get_history_log(add_id=False)
                 )
 
-            return {
+            result = {
                 "task": tracker_payload.get_id(),
                 "ux": ux,
                 "response": response,
@@ -134,6 +150,20 @@ async def os_tracker(source: EventSource,
                 "errors": [],
                 "warnings": []
             }
+
+            if tracker_payload.is_debugging_on():
+                result["metrics"] = {
+                    "workflow_cache": workflow_cache.stats(),
+                    "function_cache": cache_stats(),
+                    "user_agent_cache": user_agent_cache.stats(),
+                    "plugin_set_up": set_up_timer.report()[:10],
+                    "http_pool": http_client_pool.stats(),
+                    "mysql_pool": AsyncMySqlEngine().stats(),
+                    "tracing": tracer.stats(),
+                    "merge_reassignment": reassignment_engine.stats()
+                }
+
+            return result
         finally:
             # print(0, profile.has_not_saved_changes(), profile.need_auto_merging())
             if profile and profile.metadata.system.has_merging_data():
@@ -141,4 +171,6 @@ async def os_tracker(source: EventSource,
             #     print(1, profile.ids)
             #     print(2, profile.get_auto_merge_ids())
     finally:
-        logger.debug(f"Process time {time.time() - tracking_start}")
+        logger.debug(f"Process time {time.time() - tracking_start}, "
+                     f"workflow cache hit rate {workflow_cache.hit_rate():.2%}, "
+                     f"user agent cache hit rate {user_agent_cache.hit_rate():.2%}")
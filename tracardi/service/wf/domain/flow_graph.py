@@ -22,6 +22,15 @@ class FlowGraph(NamedEntity):
         # It is merged with other top WorkflowAsyncManager to get global status of changed fields.
         self._change_monitor = FieldChangeTimestampManager()
 
+    def copy_for_run(self) -> 'FlowGraph':
+        """
+        Returns a shallow copy that shares the (read only) graph but has its own response and change monitor.
+        """
+        flow = self.model_copy(update={'response': FlowResponse(self.response or {})})
+        flow._updated_in_workflow = {}
+        flow._change_monitor = FieldChangeTimestampManager()
+        return flow
+
     def set_change(self, type, profile_id, event_id, session_id, source_id, key, value, old_value):
         self._change_monitor.append(type, profile_id, event_id, session_id, source_id, key, value, old_value)
 
@@ -2,6 +2,7 @@ import asyncio
 import inspect
 import json
 from collections import defaultdict
+from copy import copy
 
 from time import time
 from typing import List, Union, Tuple, Optional, Dict, AsyncIterable
@@ -33,6 +34,7 @@ from .edge import Edge
 from .node import Node
 from .tasks_results import ActionsResults
 from ...notation.dict_traverser import DictTraverser
+from ...tracing import tracer
 from ...notation.dot_accessor import DotAccessor
 from ...utils.getters import get_entity_id
 from ...value_threshold_manager import ValueThresholdManager
@@ -267,12 +269,18 @@ class GraphInvoker(BaseModel):
 
                     else:
 
-                        upstream_result_copy = upstream_result.model_copy(deep=True)
+                        # Results are shared by all downstream nodes. Copy only if the node changes its input.
+                        # In debug mode the copy keeps the input params in debug info untouched.
+
+                        if self.debug or node.object.mutates_input:
+                            upstream_value = upstream_result.model_copy(deep=True).value
+                        else:
+                            upstream_value = upstream_result.value
 
                         # Do not trigger for None values
 
-                        params = {end_port: upstream_result_copy.value}
-                        if upstream_result_copy.value is not None:
+                        params = {end_port: upstream_value}
+                        if upstream_value is not None:
 
                             # Run spec with every downstream message (param)
                             # Runs as many times as downstream edges
@@ -336,7 +344,8 @@ class GraphInvoker(BaseModel):
                 result = await task
 
                 if node.append_input_payload:
-                    result = Result.append_input(result, input_params)
+                    # Input params are shared with other nodes, append_input updates them.
+                    result = Result.append_input(result, copy(input_params))
 
                 _current_profile_reference = node.object.profile
                 _current_session_reference = node.object.session
@@ -451,9 +460,9 @@ class GraphInvoker(BaseModel):
 
     @staticmethod
     def _add_results(task_results: ActionsResults, node: Node, result: Result) -> ActionsResults:
+        # Result is not copied per edge, it is copied in run_node only if the downstream node mutates its input.
         for _, edge, _ in node.graph.out_edges:
-            result_copy = result.model_copy(deep=True)
-            task_results.add(edge.id, result_copy)
+            task_results.add(edge.id, result)
         return task_results
 
     async def init(self, debug_info: DebugInfo, log_list: List[Log], flow, flow_history, event, session, profile,
@@ -472,7 +481,7 @@ class GraphInvoker(BaseModel):
                                        "microservice is not configured. See 'Remote microservice configuration' "
                                        "in node settings.")
 
-                node.object = await life_cycle.plugin.create_instance(node)
+                node.object = await life_cycle.plugin.create_instance(node, flow)
 
                 node.object = life_cycle.plugin.set_context(
                     node,
@@ -526,7 +535,7 @@ class GraphInvoker(BaseModel):
         tasks = []
         for node in self.graph:
             if isinstance(node.object, ActionRunner):
-                task = asyncio.create_task(node.object.close())
+                task = asyncio.create_task(life_cycle.plugin.release_instance(node))
                 tasks.append(task)
         await asyncio.gather(*tasks)
 
@@ -586,93 +595,94 @@ class GraphInvoker(BaseModel):
                 if node.block_flow is True:
                     continue
 
-                async for result, \
-                          task_start_time, \
-                          _profile_reference_to_update, _session_reference_to_update, \
-                          node_console_status, input_edges in \
-                        self.run_node(node, payload, ready_upstream_results=actions_results):
-
-                    # If the profile or session changed during node execution change its reference in graph invoker
-
-                    if _profile_reference_to_update:
-                        profile = _profile_reference_to_update
-
-                    if _session_reference_to_update:
-                        session = _session_reference_to_update
-
-                    executed_node = input_edges.has_active_edges() | executed_node
-
-                    # Add information if ony of the input edge is active
-
-                    debug_info.add_debug_edge_info(input_edges)
-
-                    # Process result
-
-                    if result is None:
-                        # Result is None
-                        pass
-                    elif isinstance(result, Result):
-                        if result.value is not None:
-                            actions_results = self._add_results(actions_results, node, result)
-                    elif isinstance(result, tuple):
-                        for sub_result in result:  # type: Result
-                            if sub_result is None:
-                                # This is None result
-                                pass
-                            elif isinstance(sub_result, Result):
-                                if sub_result.value is not None:
-                                    # Result is proper object
-                                    actions_results = self._add_results(actions_results, node, sub_result)
-                            else:
-                                _edge = input_edges.get_first_edge()
-                                raise DagError(
-                                    "Action did not return Result or tuple of Results. Expected Result got {}".format(
-                                        type(result)),
-                                    port=_edge.port,
-                                    input=_edge.params,
-                                    edge=_edge.id
-                                )
-                    else:
-                        # result can be DagExecError this means that this node raised exception
-                        if isinstance(result, DagExecError):
-                            raise result
-
-                        _edge = input_edges.get_first_edge()
-
-                        raise DagError(
-                            "Action did not return Result or tuple of Results. Expected Result got {}".format(
-                                type(result)),
-                            port=_edge.port,
-                            input=_edge.params,
-                            edge=_edge.id
-                        )
-
-                    if self.is_in_debug_mode(event):
-                        for input_edge_id, input_edge in input_edges.edges.items():  # type: str, InputEdge
-                            node_debug_info.append_call_info(
-                                flow_start_time,
-                                task_start_time,
-                                node,
-                                input_edge=Entity(id=input_edge_id) if input_edge_id is not None else None,
-                                input_params=self._get_input_params(input_edge.port, input_edge.params),
-                                output_edge=None,
-                                output_params=[result] if isinstance(result, Result) else result,
-                                active=input_edge.active,
-                                errors=node_console_status.errors,
-                                warnings=node_console_status.warnings
+                with tracer.span(f"workflow.node.{node.className}", node_id=node.id, event_id=event.id):
+                    async for result, \
+                              task_start_time, \
+                              _profile_reference_to_update, _session_reference_to_update, \
+                              node_console_status, input_edges in \
+                            self.run_node(node, payload, ready_upstream_results=actions_results):
+
+                        # If the profile or session changed during node execution change its reference in graph invoker
+
+                        if _profile_reference_to_update:
+                            profile = _profile_reference_to_update
+
+                        if _session_reference_to_update:
+                            session = _session_reference_to_update
+
+                        executed_node = input_edges.has_active_edges() | executed_node
+
+                        # Add information if ony of the input edge is active
+
+                        debug_info.add_debug_edge_info(input_edges)
+
+                        # Process result
+
+                        if result is None:
+                            # Result is None
+                            pass
+                        elif isinstance(result, Result):
+                            if result.value is not None:
+                                actions_results = self._add_results(actions_results, node, result)
+                        elif isinstance(result, tuple):
+                            for sub_result in result:  # type: Result
+                                if sub_result is None:
+                                    # This is None result
+                                    pass
+                                elif isinstance(sub_result, Result):
+                                    if sub_result.value is not None:
+                                        # Result is proper object
+                                        actions_results = self._add_results(actions_results, node, sub_result)
+                                else:
+                                    _edge = input_edges.get_first_edge()
+                                    raise DagError(
+                                        "Action did not return Result or tuple of Results. Expected Result got {}".format(
+                                            type(result)),
+                                        port=_edge.port,
+                                        input=_edge.params,
+                                        edge=_edge.id
+                                    )
+                        else:
+                            # result can be DagExecError this means that this node raised exception
+                            if isinstance(result, DagExecError):
+                                raise result
+
+                            _edge = input_edges.get_first_edge()
+
+                            raise DagError(
+                                "Action did not return Result or tuple of Results. Expected Result got {}".format(
+                                    type(result)),
+                                port=_edge.port,
+                                input=_edge.params,
+                                edge=_edge.id
                             )
 
-                    if executed_node:
-                        for input_edge_id, _ in input_edges.edges.items():  # type: str, InputEdge
-                            log_list.append(
-                                Log(
-                                    node_id=node_debug_info.id,
-                                    module=node.object.console.module,
-                                    class_name=node.object.console.class_name,
-                                    type='debug',
-                                    message=f"Node `{node_debug_info.name}` edge {input_edge_id} executed without errors."
+                        if self.is_in_debug_mode(event):
+                            for input_edge_id, input_edge in input_edges.edges.items():  # type: str, InputEdge
+                                node_debug_info.append_call_info(
+                                    flow_start_time,
+                                    task_start_time,
+                                    node,
+                                    input_edge=Entity(id=input_edge_id) if input_edge_id is not None else None,
+                                    input_params=self._get_input_params(input_edge.port, input_edge.params),
+                                    output_edge=None,
+                                    output_params=[result] if isinstance(result, Result) else result,
+                                    active=input_edge.active,
+                                    errors=node_console_status.errors,
+                                    warnings=node_console_status.warnings
+                                )
+
+                        if executed_node:
+                            for input_edge_id, _ in input_edges.edges.items():  # type: str, InputEdge
+                                log_list.append(
+                                    Log(
+                                        node_id=node_debug_info.id,
+                                        module=node.object.console.module,
+                                        class_name=node.object.console.class_name,
+                                        type='debug',
+                                        message=f"Node `{node_debug_info.name}` edge {input_edge_id} executed without errors."
+                                    )
                                 )
-                            )
 
             except (DagError, DagExecError) as e:
 
@@ -1,4 +1,5 @@
 import importlib
+from time import time
 from typing import Optional
 
 from tracardi.domain.event import Event
@@ -11,16 +12,22 @@ from tracardi.service.plugin.domain.result import Result
 from tracardi.service.plugin.runner import ActionRunner
 from tracardi.service.utils.getters import get_entity_id
 from tracardi.service.wf.domain.node import Node
+from tracardi.service.wf.service.plugin_pool import plugin_pool, set_up_timer
 
 
-async def create_instance(node: Node) -> ActionRunner:
+async def create_instance(node: Node, flow: Optional[Flow] = None) -> ActionRunner:
     """
-    Creates plugin instance
+    Creates plugin instance or reuses the pooled one.
     """
 
     module = importlib.import_module(node.module)
     plugin_class = getattr(module, node.className)
 
+    if getattr(plugin_class, 'pooled', False) is True:
+        action = await plugin_pool.acquire(flow, node)
+        if action is not None:
+            return action
+
     action = plugin_class()
 
     if not isinstance(action, ActionRunner):
@@ -29,6 +36,17 @@ async def create_instance(node: Node) -> ActionRunner:
     return action
 
 
+async def release_instance(node: Node):
+    """
+    Closes plugin instance or returns it to the pool.
+    """
+
+    if node.object.pooled is True:
+        await plugin_pool.release(node, node.object)
+    else:
+        await node.object.close()
+
+
 def set_context(node: Node,
                 event: Optional[Event],
                 session: Optional[Session],
@@ -73,7 +91,14 @@ async def execute(node: Node, params: dict) -> Optional[Result]:
     else:
         init = {"__debug__": node.debug}
 
-    await node.object.set_up(init)
+    flow_id = getattr(node.object.flow, 'id', None)
+    if node.object.pooled is True and node.object._is_set_up is True:
+        set_up_timer.skip(flow_id, node)
+    else:
+        start = time()
+        await node.object.set_up(init)
+        set_up_timer.record(flow_id, node, time() - start)
+        node.object._is_set_up = True
 
     # params has payload and in_edge
     return await node.object.run(**params)
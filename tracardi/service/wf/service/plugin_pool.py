@@ -0,0 +1,188 @@
+import asyncio
+from collections import OrderedDict, defaultdict
+from time import time
+from typing import Dict, List, Optional, Tuple
+
+from tracardi.config import memory_cache
+from tracardi.context import get_context
+from tracardi.exceptions.log_handler import get_logger
+from tracardi.service.plugin.runner import ActionRunner
+from tracardi.service.wf.domain.node import Node
+
+logger = get_logger(__name__)
+
+
+class SetUpTimer:
+    """
+    Collects set_up timings per workflow node.
+    """
+
+    def __init__(self):
+        self._timings: Dict[Tuple[str, str], dict] = defaultdict(
+            lambda: {"calls": 0, "skipped": 0, "total": 0.0, "max": 0.0})
+
+    def record(self, flow_id: str, node: Node, duration: float):
+        timing = self._timings[(flow_id, node.id)]
+        timing['name'] = node.name
+        timing['class'] = f"{node.module}.{node.className}"
+        timing['calls'] += 1
+        timing['total'] += duration
+        timing['max'] = max(timing['max'], duration)
+
+    def skip(self, flow_id: str, node: Node):
+        self._timings[(flow_id, node.id)]['skipped'] += 1
+
+    def report(self) -> List[dict]:
+        report = [{
+            "flow_id": flow_id,
+            "node_id": node_id,
+            **timing,
+            "avg": timing['total'] / timing['calls'] if timing['calls'] else 0.0
+        } for (flow_id, node_id), timing in self._timings.items()]
+        return sorted(report, key=lambda item: item['total'], reverse=True)
+
+    def clear(self):
+        self._timings.clear()
+
+
+class PluginPool:
+    """
+    Keeps warm instances of plugins that opt in with `ActionRunner.pooled = True`. Instances are pooled per
+    flow version and node, so set_up runs once per instance and close is called only when the instance is
+    evicted: when it is older than ttl, when there are more than max_idle idle instances of the node, or when
+    more than max_nodes nodes are pooled.
+
+    An instance is used by one workflow run at the time. It is taken from the pool in GraphInvoker.init and
+    returned in GraphInvoker.close.
+    """
+
+    def __init__(self, ttl: int, max_idle: int, max_nodes: int):
+        self.ttl = ttl
+        self.max_idle = max_idle
+        self.max_nodes = max_nodes
+        self._idle: OrderedDict[tuple, List[Tuple[float, ActionRunner]]] = OrderedDict()
+        self._sweeper: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def _key(flow, node: Node) -> tuple:
+        context = get_context()
+        return (context.tenant,
+                context.production,
+                getattr(flow, 'id', None),
+                getattr(flow, 'timestamp', None),
+                getattr(flow, 'deploy_timestamp', None),
+                node.id)
+
+    async def acquire(self, flow, node: Node) -> Optional[ActionRunner]:
+        key = self._key(flow, node)
+        instances = self._idle.get(key, None)
+        now = time()
+        expired = []
+        instance = None
+        while instances:
+            created, candidate = instances.pop()
+            if now - created > self.ttl:
+                expired.append(candidate)
+                continue
+            instance = candidate
+            break
+
+        await self._close(expired)
+
+        if instance is not None:
+            await instance.reset()
+
+        return instance
+
+    async def release(self, node: Node, instance: ActionRunner):
+        key = self._key(instance.flow, node)
+        created = instance._pooled_at or time()
+
+        # Do not keep references to the objects of the last run
+        instance.event = None
+        instance.session = None
+        instance.profile = None
+        instance.flow = None
+        instance.flow_history = None
+        instance.metrics = None
+        instance.memory = None
+        instance.ux = None
+        instance.tracker_payload = None
+        instance.execution_graph = None
+
+        if time() - created > self.ttl:
+            await self._close([instance])
+            return
+
+        self._start_sweeper()
+
+        instance._pooled_at = created
+        instances = self._idle.setdefault(key, [])
+        self._idle.move_to_end(key)
+        instances.append((created, instance))
+
+        evicted = []
+        while len(instances) > self.max_idle:
+            evicted.append(instances.pop(0)[1])
+        while len(self._idle) > self.max_nodes:
+            _, instances = self._idle.popitem(last=False)
+            evicted += [instance for _, instance in instances]
+
+        await self._close(evicted)
+
+    def _start_sweeper(self):
+        if self._sweeper is None or self._sweeper.done() or self._sweeper.get_loop() is not asyncio.get_running_loop():
+            self._sweeper = asyncio.create_task(self._run_sweeper())
+
+    async def _run_sweeper(self):
+        # Keys of redeployed flows are not acquired again, so their instances expire only here.
+        while True:
+            await asyncio.sleep(max(self.ttl / 2, 1))
+            try:
+                await self.sweep()
+            except Exception as e:
+                logger.warning(f"Could not close expired pooled plugins. Error: {str(e)}")
+
+    async def sweep(self):
+        """
+        Closes instances older than ttl in all pooled nodes.
+        """
+        now = time()
+        expired = []
+        for key in list(self._idle):
+            instances = self._idle[key]
+            alive = [item for item in instances if now - item[0] <= self.ttl]
+            if len(alive) == len(instances):
+                continue
+            expired += [instance for created, instance in instances if now - created > self.ttl]
+            if alive:
+                self._idle[key] = alive
+            else:
+                del self._idle[key]
+
+        await self._close(expired)
+
+    @staticmethod
+    async def _close(instances: List[ActionRunner]):
+        if not instances:
+            return
+        results = await asyncio.gather(*[instance.close() for instance in instances], return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning(f"Could not close pooled plugin. Error: {str(result)}")
+
+    async def clear(self):
+        if self._sweeper is not None and not self._sweeper.done():
+            self._sweeper.cancel()
+        instances = [instance for items in self._idle.values() for _, instance in items]
+        self._idle.clear()
+        await self._close(instances)
+
+    def __len__(self):
+        return sum(len(instances) for instances in self._idle.values())
+
+
+plugin_pool = PluginPool(ttl=memory_cache.plugin_pool_ttl,
+                         max_idle=memory_cache.plugin_pool_max_idle,
+                         max_nodes=memory_cache.plugin_pool_max_nodes)
+set_up_timer = SetUpTimer()
@@ -8,7 +8,7 @@ from tracardi.domain.event_metadata import EventMetadata
 from tracardi.domain.payload.tracker_payload import TrackerPayload
 from tracardi.domain.session import Session
 from tracardi.domain.time import EventTime
-from tracardi.service.logger_manager import save_logs
+from tracardi.service.logger_manager import log_flusher
 from tracardi.service.wf.triggers import exec_workflow
 
 
@@ -37,5 +37,5 @@ with (ServerContext(Context(production=False))):
         try:
             await exec_workflow(profile_id, session, events, tp)
         finally:
-            await save_logs()
+            await log_flusher.flush()
     asyncio.run(main())
\ No newline at end of file
@@ -8,32 +8,34 @@ from tracardi.service.change_monitoring.field_change_monitor import FieldChangeT
 from tracardi.service.field_mappings_cache import add_new_field_mappings
 from tracardi.service.storage.elastic.interface.session import save_session_to_db
 from tracardi.service.storage.redis.collections import Collection
-from tracardi.service.storage.redis_client import RedisClient
+from tracardi.service.storage.redis_client import AsyncRedisClient
 from tracardi.service.tracking.cache.profile_cache import save_profile_cache
 from tracardi.service.tracking.cache.session_cache import save_session_cache
 from tracardi.service.tracking.destination.dispatcher import sync_profile_destination
-from tracardi.service.tracking.locking import Lock, async_mutex
+from tracardi.service.tracking.locking import Lock, AsyncLock, async_mutex
 from tracardi.service.tracking.storage.profile_storage import load_profile
 from tracardi.domain.event import Event
 from tracardi.domain.profile import Profile
 from tracardi.domain.session import Session
 from tracardi.service.tracking.workflow_manager_async import WorkflowManagerAsync, TrackerResult
 from tracardi.service.storage.driver.elastic import profile as profile_db
+from tracardi.service.storage.refresh_coordinator import refresh_coordinator
 from tracardi.service.storage.driver.elastic import field_update_log as field_update_log_db
 
 logger = get_logger(__name__)
-_redis = RedisClient()
+_redis = AsyncRedisClient()
 
 
 async def _save_profile(profile: Profile):
-    save_profile_cache(profile)
+    await save_profile_cache(profile)
     # Save to database - do not defer
-    await profile_db.save(profile, refresh_after_save=True)
+    await profile_db.save(profile)
+    refresh_coordinator.request('profile')
 
 
 async def _save_session(sessions: Union[Session, List[Session], Set[Session]]):
     context = get_context()
-    save_session_cache(sessions, context)
+    await save_session_cache(sessions, context)
     # Save to database - do not defer
     await save_session_to_db(sessions)
 
@@ -163,7 +165,7 @@ async def exec_workflow(profile_id: Optional[str], session: Session, events: Lis
             )
 
         profile_key = Lock.get_key(Collection.lock_tracker, "profile", profile_id)
-        profile_lock = Lock(_redis, profile_key, default_lock_ttl=5)
+        profile_lock = AsyncLock(_redis, profile_key, default_lock_ttl=5)
 
         async with async_mutex(profile_lock, name='workflow-worker'):
             profile, session, events, ux, response, field_change_manager, is_wf_triggered = await _exec_workflow(
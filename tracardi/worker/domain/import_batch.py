@@ -0,0 +1,8 @@
+from typing import NamedTuple, List
+
+
+class ImportBatch(NamedTuple):
+    records: List[dict]
+    progress: float
+    batch: int
+    checkpoint: dict  # Position of the import after this batch. Passed to importer to resume the import.
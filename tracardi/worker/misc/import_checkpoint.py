@@ -0,0 +1,38 @@
+import json
+import logging
+from hashlib import md5
+from typing import Optional
+
+from tracardi.service.storage.redis.collections import Collection
+from tracardi.service.storage.redis_client import AsyncRedisClient
+
+logger = logging.getLogger(__name__)
+
+
+def checkpoint_key(import_config) -> str:
+    return md5(import_config.model_dump_json().encode()).hexdigest()
+
+
+async def checkpoint_load(key: str) -> Optional[dict]:
+    try:
+        checkpoint = await AsyncRedisClient().get(f"{Collection.import_checkpoint}{key}")
+        if checkpoint is None:
+            return None
+        logger.info(msg=f"Resuming import from checkpoint {checkpoint}.")
+        return json.loads(checkpoint)
+    except Exception as e:
+        logger.error(msg=f"Could not load import checkpoint \"{key}\" due to an error: {str(e)}")
+
+
+async def checkpoint_save(key: str, checkpoint: dict):
+    try:
+        await AsyncRedisClient().set(f"{Collection.import_checkpoint}{key}", json.dumps(checkpoint, default=str))
+    except Exception as e:
+        logger.error(msg=f"Could not save import checkpoint \"{key}\" due to an error: {str(e)}")
+
+
+async def checkpoint_delete(key: str):
+    try:
+        await AsyncRedisClient().delete(f"{Collection.import_checkpoint}{key}")
+    except Exception as e:
+        logger.error(msg=f"Could not delete import checkpoint \"{key}\" due to an error: {str(e)}")
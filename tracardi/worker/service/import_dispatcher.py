@@ -1,18 +1,129 @@
-import requests
+import asyncio
+from collections import deque
+from typing import Optional, AsyncIterator, Tuple, List, Deque
+
+from tracardi.service.cache.event_source import load_event_source
+from tracardi.service.tracardi_http_client import HttpClient
+from tracardi.worker.misc.import_checkpoint import checkpoint_load, checkpoint_save, checkpoint_delete
 
 
 class ImportDispatcher:
 
-    def __init__(self, credentials, importer, webhook_url: str):
+    """
+    Sends imported records to the tracker. Records imported to a REST API event source are sent as events of
+    profile less tracker payloads to `/track`, `events_per_request` events per request. Records imported to
+    a webhook event source are sent one per request to `/collect/{event_type}/{source_id}`, as webhook
+    events. Other event sources are rejected before the import starts.
+
+    At most `concurrency` requests are in flight, also across batches. Next batch is read from the importer
+    while the previous ones are sent. Import position is checkpointed when a batch and all batches before
+    it are sent, so a failed import resumes from the last fully sent batch.
+    """
+
+    def __init__(self, credentials, importer, event_source_id: str, event_type: str,
+                 checkpoint_key: Optional[str] = None, events_per_request: int = 100, concurrency: int = 4):
         self.importer = importer
-        self.webhook_url = webhook_url
         self.credentials = credentials
+        self.event_source_id = event_source_id
+        self.event_type = event_type
+        self.checkpoint_key = checkpoint_key
+        self.events_per_request = max(events_per_request, 1)
+        self.concurrency = max(concurrency, 1)
+
+    async def _requests(self, tracardi_api_url: str) -> Tuple[str, bool]:
+        source = await load_event_source(self.event_source_id)
+        if source is None:
+            raise ValueError(f"Could not import data. Event source `{self.event_source_id}` does not exist.")
+
+        api_url = tracardi_api_url.rstrip('/')
+        if 'rest' in source.type:
+            return f"{api_url}/track", True
+        if 'webhook' in source.type:
+            return f"{api_url}/collect/{self.event_type}/{self.event_source_id}", False
+
+        raise ValueError(f"Could not import data. Event source `{self.event_source_id}` must be a REST API "
+                         f"or webhook event source, got {source.type}.")
+
+    def _payloads(self, records: List[dict], batched: bool) -> List[dict]:
+        if not batched:
+            return records
+        return [
+            {
+                "source": {"id": self.event_source_id},
+                "profile_less": True,
+                "events": [{"type": self.event_type, "properties": record}
+                           for record in records[start:start + self.events_per_request]]
+            }
+            for start in range(0, len(records), self.events_per_request)
+        ]
+
+    @staticmethod
+    async def _send(client: HttpClient, url: str, payload: dict):
+        async with client.post(url, json=payload, ssl=False) as response:
+            if response.status != 200:
+                raise ValueError(f"Could not send imported data. Tracker responded with status "
+                                 f"{response.status}: {await response.text()}")
+
+    async def run(self, tracardi_api_url: str) -> AsyncIterator[Tuple[float, int]]:
+        url, batched = await self._requests(tracardi_api_url)
+        checkpoint = await checkpoint_load(self.checkpoint_key) if self.checkpoint_key else None
+        batches = self.importer.batches(self.credentials, checkpoint)
+        limit = asyncio.Semaphore(self.concurrency)
+
+        # Batches in import order with their requests. Batch is acknowledged when all its requests are done.
+        pending: Deque[Tuple[object, List[asyncio.Task]]] = deque()
+
+        def _pending_requests() -> List[asyncio.Task]:
+            return [request for _, batch_requests in pending for request in batch_requests]
+
+        async def _acknowledge():
+            batch, requests = pending[0]
+            await asyncio.gather(*requests)
+            pending.popleft()
+
+            if self.checkpoint_key:
+                await checkpoint_save(self.checkpoint_key, batch.checkpoint)
+
+            return batch.progress, batch.batch
+
+        # Importers use blocking clients, so batches are read in a thread.
+        next_batch = asyncio.create_task(asyncio.to_thread(next, batches, None))
+        try:
+            async with HttpClient(retries=3) as client:
+                while True:
+                    batch = await next_batch
+                    if batch is None:
+                        break
+                    next_batch = asyncio.create_task(asyncio.to_thread(next, batches, None))
+
+                    requests = []
+                    pending.append((batch, requests))
+                    for payload in self._payloads(batch.records, batched):
+                        # Waits for a free slot. Meanwhile, batches sent in full are acknowledged.
+                        while limit.locked():
+                            await asyncio.wait([request for request in _pending_requests() if not request.done()],
+                                               return_when=asyncio.FIRST_COMPLETED)
+                            while len(pending) > 1 and all(request.done() for request in pending[0][1]):
+                                yield await _acknowledge()
+
+                        await limit.acquire()
+                        request = asyncio.create_task(self._send(client, url, payload))
+                        request.add_done_callback(lambda _: limit.release())
+                        requests.append(request)
+
+                    while pending and all(request.done() for request in pending[0][1]):
+                        yield await _acknowledge()
 
-    def run(self, tracardi_api_url):
-        if tracardi_api_url[-1] == '/':
-            tracardi_api_url = tracardi_api_url[:-1]
-        for data, progress, batch in self.importer.data(self.credentials):
-            url = f"{tracardi_api_url}{self.webhook_url}"
-            response = requests.post(url, json=data, verify=False)
-            yield progress, batch
+                while pending:
+                    yield await _acknowledge()
+        finally:
+            requests = _pending_requests()
+            for request in requests:
+                request.cancel()
+            if requests:
+                await asyncio.wait(requests)
+            if not next_batch.done():
+                await asyncio.wait([next_batch])
 
+        if self.checkpoint_key:
+            await checkpoint_delete(self.checkpoint_key)
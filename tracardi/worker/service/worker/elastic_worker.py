@@ -1,7 +1,8 @@
-from typing import Optional, Union, List
+from typing import Optional, Union, List, Iterator
 from elasticsearch import Elasticsearch
 from pydantic import BaseModel
 from ssl import create_default_context
+from tracardi.worker.domain.import_batch import ImportBatch
 from tracardi.worker.domain.named_entity import NamedEntity
 
 
@@ -29,6 +30,7 @@ class ElasticCredentials(BaseModel):
 class ElasticImporter(BaseModel):
     index: NamedEntity
     batch: int
+    scroll: str = "5m"
 
     @staticmethod
     def _get_elastic_config(credentials: ElasticCredentials):
@@ -63,30 +65,51 @@ class ElasticImporter(BaseModel):
 
         return kwargs
 
-    def data(self, credentials: ElasticCredentials):
+    def batches(self, credentials: ElasticCredentials, checkpoint: Optional[dict] = None) -> Iterator[ImportBatch]:
 
         client = Elasticsearch(**self._get_elastic_config(credentials))
+        scroll_id = None
 
-        result = client.count(body={
-            "query": {
-                "match_all": {}
-            }
-        }, index=self.index.id)
-
-        number_of_records = result['count']
-        if number_of_records > 0:
-            for batch_number, start in enumerate(range(0, number_of_records, self.batch)):
-                query = {
-                    "query": {
-                        "match_all": {}
-                    },
-                    "from": start,
-                    "size": self.batch
+        try:
+            result = client.count(body={
+                "query": {
+                    "match_all": {}
                 }
-                result = client.search(body=query, index=self.index.id)
-                for record, data in enumerate(result['hits']['hits']):
-                    data = data['_source']
-                    progress = ((start + record + 1) / number_of_records) * 100
-                    yield data, progress, batch_number + 1
-
-        client.close()
+            }, index=self.index.id)
+
+            number_of_records = result['count']
+            if number_of_records > 0:
+                records = checkpoint['records'] if checkpoint else 0
+                batch_number = checkpoint['batch'] if checkpoint else 0
+                # Resumed import skips the records that were sent.
+                skip = records
+
+                # Scroll instead of from/size, deep pages of from/size get slower with every page.
+                result = client.search(body={"query": {"match_all": {}}, "sort": ["_doc"]},
+                                       index=self.index.id, size=self.batch, scroll=self.scroll)
+                while True:
+                    scroll_id = result.get('_scroll_id', None)
+                    hits = result['hits']['hits']
+                    if not hits:
+                        break
+
+                    if skip:
+                        skipped = min(skip, len(hits))
+                        hits = hits[skipped:]
+                        skip -= skipped
+
+                    if hits:
+                        records += len(hits)
+                        batch_number += 1
+                        yield ImportBatch(
+                            records=[hit['_source'] for hit in hits],
+                            progress=min(records / number_of_records * 100, 100),
+                            batch=batch_number,
+                            checkpoint={"position": records, "records": records, "batch": batch_number}
+                        )
+
+                    result = client.scroll(scroll_id=scroll_id, scroll=self.scroll)
+        finally:
+            if scroll_id is not None:
+                client.clear_scroll(scroll_id=scroll_id)
+            client.close()
@@ -1,9 +1,10 @@
-import json
 from datetime import datetime
+from typing import Optional, Iterator
 
 import mysql.connector
 from pydantic import BaseModel
 
+from tracardi.worker.domain.import_batch import ImportBatch
 from tracardi.worker.domain.named_entity import NamedEntity
 
 
@@ -27,12 +28,17 @@ class MySQLQueryImporter(BaseModel):
         else:
             return f"<<non-serializable: {type(value).__qualname__}>>"
 
+    def _to_json(self, row: dict) -> dict:
+        return {key: value if isinstance(value, (str, int, float, bool, list, dict, type(None)))
+                else self._default_none_serializable_data(value)
+                for key, value in row.items()}
+
     def count(self, cursor):
         sql = f"SELECT COUNT(1) as `count` FROM ({self.query}) AS tracardi_import_temporary_table"
         cursor.execute(sql)
         return int(cursor.fetchone()['count'])
 
-    def data(self, credentials: MysqlConnectionConfig):
+    def batches(self, credentials: MysqlConnectionConfig, checkpoint: Optional[dict] = None) -> Iterator[ImportBatch]:
         connection = mysql.connector.connect(
             host=credentials.host,
             user=credentials.user,
@@ -41,15 +47,31 @@ class MySQLQueryImporter(BaseModel):
             database=self.database_name.id
         )
         cursor = connection.cursor(dictionary=True)
-        number_of_records = self.count(cursor)
-        if number_of_records > 0:
-            for batch_number, start in enumerate(range(0, number_of_records, self.batch)):
-                sql = f"{self.query} LIMIT {start}, {self.batch}"
-                cursor.execute(sql)
-                for record, data in enumerate(cursor):
-                    json_payload = json.dumps(data, default=self._default_none_serializable_data)
-                    data = json.loads(json_payload)
-                    progress = ((start + record + 1) / number_of_records) * 100
-                    yield data, progress, batch_number + 1
-        cursor.close()
-        connection.close()
+        try:
+            number_of_records = self.count(cursor)
+            if number_of_records > 0:
+                records = checkpoint['records'] if checkpoint else 0
+                batch_number = checkpoint['batch'] if checkpoint else 0
+
+                # Query result is streamed. Resumed import skips the records that were sent.
+                if records:
+                    cursor.execute(f"SELECT * FROM ({self.query}) AS tracardi_import_temporary_table "
+                                   f"LIMIT {records}, 18446744073709551615")
+                else:
+                    cursor.execute(self.query)
+
+                while True:
+                    rows = cursor.fetchmany(self.batch)
+                    if not rows:
+                        break
+                    records += len(rows)
+                    batch_number += 1
+                    yield ImportBatch(
+                        records=[self._to_json(row) for row in rows],
+                        progress=min(records / number_of_records * 100, 100),
+                        batch=batch_number,
+                        checkpoint={"position": records, "records": records, "batch": batch_number}
+                    )
+        finally:
+            cursor.close()
+            connection.close()
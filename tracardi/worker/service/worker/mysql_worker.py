@@ -1,9 +1,10 @@
-import json
 from datetime import datetime
+from typing import Optional, Iterator
 
 import mysql.connector
 from pydantic import BaseModel
 
+from tracardi.worker.domain.import_batch import ImportBatch
 from tracardi.worker.domain.named_entity import NamedEntity
 
 
@@ -27,12 +28,58 @@ class MySQLImporter(BaseModel):
         else:
             return f"<<non-serializable: {type(value).__qualname__}>>"
 
+    def _to_json(self, row: dict) -> dict:
+        return {key: value if isinstance(value, (str, int, float, bool, list, dict, type(None)))
+                else self._default_none_serializable_data(value)
+                for key, value in row.items()}
+
+    def _table(self) -> str:
+        return f"{self.database_name.id}.{self.table_name.id}"
+
     def count(self, cursor):
-        sql = f"SELECT COUNT(1) as `count` FROM {self.database_name.id}.{self.table_name.id}"
+        sql = f"SELECT COUNT(1) as `count` FROM {self._table()}"
         cursor.execute(sql)
         return int(cursor.fetchone()['count'])
 
-    def data(self, credentials: MysqlConnectionConfig):
+    def _primary_key(self, cursor) -> Optional[str]:
+        cursor.execute("SELECT COLUMN_NAME FROM information_schema.KEY_COLUMN_USAGE "
+                       "WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s AND CONSTRAINT_NAME = 'PRIMARY'",
+                       (self.database_name.id, self.table_name.id))
+        columns = cursor.fetchall()
+        return columns[0]['COLUMN_NAME'] if len(columns) == 1 else None
+
+    def _keyset_pages(self, cursor, primary_key: str, position):
+        """
+        Pages by primary key, so every page is an index range scan.
+        """
+        while True:
+            if position is None:
+                cursor.execute(f"SELECT * FROM {self._table()} ORDER BY `{primary_key}` LIMIT {self.batch}")
+            else:
+                cursor.execute(f"SELECT * FROM {self._table()} WHERE `{primary_key}` > %s "
+                               f"ORDER BY `{primary_key}` LIMIT {self.batch}", (position,))
+            rows = cursor.fetchall()
+            if not rows:
+                break
+            position = rows[-1][primary_key]
+            yield rows, position
+
+    def _streamed_pages(self, cursor, offset: int):
+        """
+        Tables without single column primary key are read with one streamed query.
+        """
+        if offset:
+            cursor.execute(f"SELECT * FROM {self._table()} LIMIT {offset}, 18446744073709551615")
+        else:
+            cursor.execute(f"SELECT * FROM {self._table()}")
+        while True:
+            rows = cursor.fetchmany(self.batch)
+            if not rows:
+                break
+            offset += len(rows)
+            yield rows, offset
+
+    def batches(self, credentials: MysqlConnectionConfig, checkpoint: Optional[dict] = None) -> Iterator[ImportBatch]:
         connection = mysql.connector.connect(
             host=credentials.host,
             user=credentials.user,
@@ -40,15 +87,26 @@ class MySQLImporter(BaseModel):
             port=credentials.port
         )
         cursor = connection.cursor(dictionary=True)
-        number_of_records = self.count(cursor)
-        if number_of_records > 0:
-            for batch_number, start in enumerate(range(0, number_of_records, self.batch)):
-                sql = f"SELECT * FROM {self.database_name.id}.{self.table_name.id} LIMIT {start}, {self.batch}"
-                cursor.execute(sql)
-                for record, data in enumerate(cursor):
-                    json_payload = json.dumps(data, default=self._default_none_serializable_data)
-                    data = json.loads(json_payload)
-                    progress = ((start + record + 1) / number_of_records) * 100
-                    yield data, progress, batch_number + 1
-        cursor.close()
-        connection.close()
+        try:
+            number_of_records = self.count(cursor)
+            if number_of_records > 0:
+                records = checkpoint['records'] if checkpoint else 0
+                batch_number = checkpoint['batch'] if checkpoint else 0
+                primary_key = self._primary_key(cursor)
+                if primary_key is not None:
+                    pages = self._keyset_pages(cursor, primary_key, checkpoint['position'] if checkpoint else None)
+                else:
+                    pages = self._streamed_pages(cursor, records)
+
+                for rows, position in pages:
+                    records += len(rows)
+                    batch_number += 1
+                    yield ImportBatch(
+                        records=[self._to_json(row) for row in rows],
+                        progress=min(records / number_of_records * 100, 100),
+                        batch=batch_number,
+                        checkpoint={"position": position, "records": records, "batch": batch_number}
+                    )
+        finally:
+            cursor.close()
+            connection.close()
@@ -10,7 +10,7 @@ from tracardi.service.storage.redis_connection_pool import get_redis_connection_
 import tracardi.worker.service.worker.migration_workers as migration_workers
 
 from tracardi.context import Context, ServerContext
-from tracardi.config import redis_config
+from tracardi.config import redis_config, tracardi
 from tracardi.worker.service.async_job import run_async_task
 from tracardi.worker.service.worker.elastic_worker import ElasticImporter, ElasticCredentials
 from tracardi.worker.service.worker.mysql_worker import MysqlConnectionConfig, MySQLImporter
@@ -19,6 +19,7 @@ from tracardi.worker.service.import_dispatcher import ImportDispatcher
 from tracardi.worker.domain.import_config import ImportConfig
 from tracardi.worker.domain.migration_schema import MigrationSchema
 from tracardi.worker.misc.task_progress import task_create, task_progress, task_finish
+from tracardi.worker.misc.import_checkpoint import checkpoint_key
 
 queue = RedisHuey('upgrade',
                   connection_pool=get_redis_connection_pool(redis_config),
@@ -38,13 +39,15 @@ async def import_mysql_table_data(task_name:str, import_config: dict, credential
             import_config.model_dump(mode='json')
         )
 
-        webhook_url = f"/collect/{import_config.event_type}/{import_config.event_source.id}"
-
         importer = ImportDispatcher(MysqlConnectionConfig(**credentials),
                                     importer=MySQLImporter(**import_config.config),
-                                    webhook_url=webhook_url)
+                                    event_source_id=import_config.event_source.id,
+                                    event_type=import_config.event_type,
+                                    checkpoint_key=checkpoint_key(import_config),
+                                    events_per_request=tracardi.import_events_per_request,
+                                    concurrency=tracardi.import_concurrency)
 
-        for progress, batch in importer.run(import_config.api_url):
+        async for progress, batch in importer.run(import_config.api_url):
             await task_progress(task_id, progress)
 
         await task_finish(task_id)
@@ -61,39 +64,44 @@ async def import_elastic_data(task_name:str, import_config, credentials, context
             import_config.model_dump(mode='json')
         )
 
-        webhook_url = f"/collect/{import_config.event_type}/{import_config.event_source.id}"
-
         importer = ImportDispatcher(ElasticCredentials(**credentials),
                                     importer=ElasticImporter(**import_config.config),
-                                    webhook_url=webhook_url)
+                                    event_source_id=import_config.event_source.id,
+                                    event_type=import_config.event_type,
+                                    checkpoint_key=checkpoint_key(import_config),
+                                    events_per_request=tracardi.import_events_per_request,
+                                    concurrency=tracardi.import_concurrency)
 
-        for progress, batch in importer.run(import_config.api_url):
+        async for progress, batch in importer.run(import_config.api_url):
             await task_progress(task_id, progress)
 
         await task_finish(task_id)
 
 @run_async_task
 async def import_mysql_data_with_query(task_name:str, import_config, credentials, context: Context):
-    import_config = ImportConfig(**import_config)
-
-    task_id = await task_create(
-        "import",
-        task_name if task_name else import_config.name,
-        import_config.model_dump(mode='json')
-    )
+    with ServerContext(context):
+        import_config = ImportConfig(**import_config)
 
-    webhook_url = f"/collect/{import_config.event_type}/{import_config.event_source.id}"
+        task_id = await task_create(
+            "import",
+            task_name if task_name else import_config.name,
+            import_config.model_dump(mode='json')
+        )
 
-    importer = ImportDispatcher(
-        MysqlQueryConnConfig(**credentials),
-        importer=MySQLQueryImporter(**import_config.config),
-        webhook_url=webhook_url
-    )
+        importer = ImportDispatcher(
+            MysqlQueryConnConfig(**credentials),
+            importer=MySQLQueryImporter(**import_config.config),
+            event_source_id=import_config.event_source.id,
+            event_type=import_config.event_type,
+            checkpoint_key=checkpoint_key(import_config),
+            events_per_request=tracardi.import_events_per_request,
+            concurrency=tracardi.import_concurrency
+        )
 
-    for progress, batch in importer.run(import_config.api_url):
-        await task_progress(task_id, progress)
+        async for progress, batch in importer.run(import_config.api_url):
+            await task_progress(task_id, progress)
 
-    await task_finish(task_id)
+        await task_finish(task_id)
 
 async def _run_migration_worker(worker_func, schema, elastic_host, context: Context):
     worker_function = getattr(migration_workers, worker_func, None)